@@ -1,6 +1,11 @@
-from machine import Pin,I2C,SPI,PWM,Timer,ADC
+from machine import Pin,I2C,SPI,PWM,Timer,ADC,idle
 import framebuf
 import time
+import profiler
+try:
+    import rp2
+except ImportError:
+    rp2 = None
 Vbat_Pin = 29
 
 #Pin definition  引脚定义
@@ -9,6 +14,7 @@ I2C_SDL = 7
 I2C_INT = 17
 I2C_RST = 16
 
+LCD_SPI = 1
 DC = 8
 CS = 9
 SCK = 10
@@ -18,9 +24,126 @@ RST = 13
 
 BL = 25
 
+# GC9A01 power-on register sequence  GC9A01上电寄存器序列
+# Records of: command, data length, data bytes
+_INIT_SEQUENCE = bytes((
+    0xEF, 0,
+    0xEB, 1, 0x14,
+    0xFE, 0,
+    0xEF, 0,
+    0xEB, 1, 0x14,
+    0x84, 1, 0x40,
+    0x85, 1, 0xFF,
+    0x86, 1, 0xFF,
+    0x87, 1, 0xFF,
+    0x88, 1, 0x0A,
+    0x89, 1, 0x21,
+    0x8A, 1, 0x00,
+    0x8B, 1, 0x80,
+    0x8C, 1, 0x01,
+    0x8D, 1, 0x01,
+    0x8E, 1, 0xFF,
+    0x8F, 1, 0xFF,
+    0xB6, 2, 0x00, 0x20,
+    0x36, 1, 0x98,
+    0x3A, 1, 0x05,
+    0x90, 4, 0x08, 0x08, 0x08, 0x08,
+    0xBD, 1, 0x06,
+    0xBC, 1, 0x00,
+    0xFF, 3, 0x60, 0x01, 0x04,
+    0xC3, 1, 0x13,
+    0xC4, 1, 0x13,
+    0xC9, 1, 0x22,
+    0xBE, 1, 0x11,
+    0xE1, 2, 0x10, 0x0E,
+    0xDF, 3, 0x21, 0x0C, 0x02,
+    0xF0, 6, 0x45, 0x09, 0x08, 0x08, 0x26, 0x2A,
+    0xF1, 6, 0x43, 0x70, 0x72, 0x36, 0x37, 0x6F,
+    0xF2, 6, 0x45, 0x09, 0x08, 0x08, 0x26, 0x2A,
+    0xF3, 6, 0x43, 0x70, 0x72, 0x36, 0x37, 0x6F,
+    0xED, 2, 0x1B, 0x0B,
+    0xAE, 1, 0x77,
+    0xCD, 1, 0x63,
+    0x70, 9, 0x07, 0x07, 0x04, 0x0E, 0x0F, 0x09, 0x07, 0x08, 0x03,
+    0xE8, 1, 0x34,
+    0x62, 12, 0x18, 0x0D, 0x71, 0xED, 0x70, 0x70, 0x18, 0x0F, 0x71, 0xEF, 0x70, 0x70,
+    0x63, 12, 0x18, 0x11, 0x71, 0xF1, 0x70, 0x70, 0x18, 0x13, 0x71, 0xF3, 0x70, 0x70,
+    0x64, 7, 0x28, 0x29, 0xF1, 0x01, 0xF1, 0x00, 0x07,
+    0x66, 10, 0x3C, 0x00, 0xCD, 0x67, 0x45, 0x45, 0x10, 0x00, 0x00, 0x00,
+    0x67, 10, 0x00, 0x3C, 0x00, 0x00, 0x00, 0x01, 0x54, 0x10, 0x32, 0x98,
+    0x74, 7, 0x10, 0x85, 0x80, 0x00, 0x00, 0x4E, 0x00,
+    0x98, 2, 0x3E, 0x07,
+    0x35, 0,    # Tearing effect line on
+    0x21, 0,    # Display inversion on
+    0x11, 0,    # Sleep out
+    0x29, 0,    # Display on
+))
+
+# Dirty rectangle tracking  脏矩形跟踪
+_MAX_DIRTY = 8          # Rectangles kept before the closest pair is merged
+_MERGE_SLACK = 240 * 8  # Extra pixels accepted to merge two nearby rectangles
+
+# Tearing effect sync  TE同步
+_TE_TIMEOUT_MS = 50     # Give up waiting for a TE edge after ~3 refreshes
+
+# Scaled text: (char, size) -> tuple of (dx, dy, w, h) rectangles
+# 缩放文字缓存：(字符, 大小) -> 矩形列表
+_scaled_glyphs = {}
+_SCALED_GLYPHS_MAX = 96
+
+
+#Background SPI writers for double buffering  双缓冲的后台SPI发送
+class _DmaWriter(object):
+    """Streams a buffer into an SPI TX FIFO with an rp2.DMA channel."""
+
+    def __init__(self, spi_id, done):
+        import os
+        from machine import mem32
+        if 'RP2350' in os.uname().machine:
+            base = 0x40080000 + spi_id * 0x8000
+            dreq = 24 + spi_id * 2
+        else:
+            base = 0x4003C000 + spi_id * 0x4000
+            dreq = 16 + spi_id * 2
+        self._mem32 = mem32
+        self._dr = base + 0x08  # SSPDR
+        self._sr = base + 0x0C  # SSPSR
+        self._done = done
+        self.dma = rp2.DMA()
+        self._ctrl = self.dma.pack_ctrl(size=0, inc_write=False, treq_sel=dreq, irq_quiet=False)
+        self.dma.irq(self._irq)
+
+    def start(self, buf):
+        self.dma.config(read=buf, write=self._dr, count=len(buf), ctrl=self._ctrl, trigger=True)
+
+    def _irq(self, dma):
+        # The last bytes are still shifting out when the channel finishes
+        while self._mem32[self._sr] & 0x10:  # BSY
+            pass
+        self._done()
+
+
+class _ThreadWriter(object):
+    """Host stand-in for _DmaWriter: spi.write on a background thread."""
+
+    def __init__(self, spi, done):
+        import threading
+        self._thread = threading.Thread
+        self._spi = spi
+        self._done = done
+
+    def start(self, buf):
+        worker = self._thread(target=self._run, args=(buf,))
+        worker.daemon = True
+        worker.start()
+
+    def _run(self, buf):
+        self._spi.write(buf)
+        self._done()
+
 #LCD Driver  LCD驱动
 class LCD_1inch28(framebuf.FrameBuffer):
-    def __init__(self): #SPI initialization  SPI初始化
+    def __init__(self, double_buffer=False, te_pin=None): #SPI initialization  SPI初始化
         self.width = 240
         self.height = 240
         
@@ -28,11 +151,54 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.rst = Pin(RST,Pin.OUT)
         
         self.cs(1)
-        self.spi = SPI(1,100_000_000,polarity=0, phase=0,bits= 8,sck=Pin(SCK),mosi=Pin(MOSI),miso=None)
+        self.spi = SPI(LCD_SPI,100_000_000,polarity=0, phase=0,bits= 8,sck=Pin(SCK),mosi=Pin(MOSI),miso=None)
         self.dc = Pin(DC,Pin.OUT)
         self.dc(1)
+        # Preallocated command/window buffers, no allocation per register write
+        # 预分配命令缓冲区，避免每次写寄存器都分配内存
+        self._cmd_buf = bytearray(1)
+        self._win_buf = bytearray(4)
         self.buffer = bytearray(self.height * self.width * 2)
+        self._mv = memoryview(self.buffer)
         super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
+        # Plain FrameBuffer over the same memory, used by the drawing
+        # overrides below so they can record dirty regions
+        # 共享同一缓冲区的FrameBuffer，供记录脏区域的绘图方法使用
+        self._fb = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.RGB565)
+        self._dirty = []
+        # 8x8 scratch glyph for write_text  write_text用的8x8字模缓冲区
+        self._glyph_buf = bytearray(8)
+        self._glyph = framebuf.FrameBuffer(self._glyph_buf, 8, 8, framebuf.MONO_HLSB)
+
+        # Double buffering: drawing goes to self.buffer, end_frame() copies
+        # the changed windows to self._front and sends them in the background
+        # 双缓冲：在self.buffer中绘制，end_frame()复制到前台缓冲区并在后台发送
+        self._flushing = False
+        self._queue = []
+        self._front = None
+        if double_buffer:
+            self._front = bytearray(len(self.buffer))
+            self._front_mv = memoryview(self._front)
+            if rp2 is not None:
+                self._writer = _DmaWriter(LCD_SPI, self._next_window)
+            else:
+                self._writer = _ThreadWriter(self.spi, self._next_window)
+
+        # Tearing effect (TE) sync: with a TE pin, every present waits for
+        # the panel's vertical blank edge, counted by a pin IRQ
+        # 撕裂效应同步：每次刷新等待TE引脚的垂直消隐沿
+        self.te = None
+        self.te_sync = False
+        self._vsync = 0
+        self._te_last_us = 0
+        self._te_period_us = 0
+        self._te_present = 0
+        self.te_reset_stats()
+        if te_pin is not None:
+            self.te = Pin(te_pin, Pin.IN)
+            self.te.irq(handler=self._te_irq, trigger=Pin.IRQ_RISING, hard=True)
+            self.te_sync = True
+
         self.init_display()
         
         #Define color, Micropython fixed to BRG format  定义颜色，Micropython固定为BRG格式
@@ -50,17 +216,50 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.pwm.freq(5000) #Turn on the backlight  开背光
         
     def write_cmd(self, cmd): #Write command  写命令
+        if self._flushing:
+            self.wait_idle()
+        self._cmd_buf[0] = cmd
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(self._cmd_buf)
         self.cs(1)
 
     def write_data(self, buf): #Write data  写数据
+        if self._flushing:
+            self.wait_idle()
+        self._cmd_buf[0] = buf
         self.cs(1)
         self.dc(1)
         self.cs(0)
-        self.spi.write(bytearray([buf]))
+        self.spi.write(self._cmd_buf)
+        self.cs(1)
+
+    #Write command and its parameters in one transaction  一次传输写命令和参数
+    def write_cmd_data(self, cmd, payload):
+        """
+        Write a command byte followed by its parameter bytes.
+
+        CS stays asserted for the whole register write and the parameters
+        go out in a single spi.write, instead of one transaction per byte.
+
+        Args:
+            cmd: Command byte
+            payload: bytes/bytearray/memoryview of parameters (may be empty)
+        """
+        if self._flushing:
+            self.wait_idle()
+        self._write_reg(cmd, payload)
+
+    def _write_reg(self, cmd, payload):
+        self._cmd_buf[0] = cmd
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(self._cmd_buf)
+        if payload:
+            self.dc(1)
+            self.spi.write(payload)
         self.cs(1)
         
     def set_bl_pwm(self,duty): #Set screen brightness  设置屏幕亮度
@@ -75,258 +274,44 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.rst(1)
         time.sleep(0.05)
         
-        self.write_cmd(0xEF)
-        self.write_cmd(0xEB)
-        self.write_data(0x14) 
-        
-        self.write_cmd(0xFE) 
-        self.write_cmd(0xEF) 
-
-        self.write_cmd(0xEB)
-        self.write_data(0x14) 
-
-        self.write_cmd(0x84)
-        self.write_data(0x40) 
-
-        self.write_cmd(0x85)
-        self.write_data(0xFF) 
-
-        self.write_cmd(0x86)
-        self.write_data(0xFF) 
-
-        self.write_cmd(0x87)
-        self.write_data(0xFF)
-
-        self.write_cmd(0x88)
-        self.write_data(0x0A)
-
-        self.write_cmd(0x89)
-        self.write_data(0x21) 
-
-        self.write_cmd(0x8A)
-        self.write_data(0x00) 
-
-        self.write_cmd(0x8B)
-        self.write_data(0x80) 
-
-        self.write_cmd(0x8C)
-        self.write_data(0x01) 
-
-        self.write_cmd(0x8D)
-        self.write_data(0x01) 
-
-        self.write_cmd(0x8E)
-        self.write_data(0xFF) 
-
-        self.write_cmd(0x8F)
-        self.write_data(0xFF) 
-
-
-        self.write_cmd(0xB6)
-        self.write_data(0x00)
-        self.write_data(0x20)
-
-        self.write_cmd(0x36)
-        self.write_data(0x98)
-
-        self.write_cmd(0x3A)
-        self.write_data(0x05) 
-
-
-        self.write_cmd(0x90)
-        self.write_data(0x08)
-        self.write_data(0x08)
-        self.write_data(0x08)
-        self.write_data(0x08) 
-
-        self.write_cmd(0xBD)
-        self.write_data(0x06)
-        
-        self.write_cmd(0xBC)
-        self.write_data(0x00)
-
-        self.write_cmd(0xFF)
-        self.write_data(0x60)
-        self.write_data(0x01)
-        self.write_data(0x04)
-
-        self.write_cmd(0xC3)
-        self.write_data(0x13)
-        self.write_cmd(0xC4)
-        self.write_data(0x13)
-
-        self.write_cmd(0xC9)
-        self.write_data(0x22)
-
-        self.write_cmd(0xBE)
-        self.write_data(0x11) 
-
-        self.write_cmd(0xE1)
-        self.write_data(0x10)
-        self.write_data(0x0E)
-
-        self.write_cmd(0xDF)
-        self.write_data(0x21)
-        self.write_data(0x0c)
-        self.write_data(0x02)
-
-        self.write_cmd(0xF0)   
-        self.write_data(0x45)
-        self.write_data(0x09)
-        self.write_data(0x08)
-        self.write_data(0x08)
-        self.write_data(0x26)
-        self.write_data(0x2A)
-
-        self.write_cmd(0xF1)    
-        self.write_data(0x43)
-        self.write_data(0x70)
-        self.write_data(0x72)
-        self.write_data(0x36)
-        self.write_data(0x37)  
-        self.write_data(0x6F)
-
-
-        self.write_cmd(0xF2)   
-        self.write_data(0x45)
-        self.write_data(0x09)
-        self.write_data(0x08)
-        self.write_data(0x08)
-        self.write_data(0x26)
-        self.write_data(0x2A)
-
-        self.write_cmd(0xF3)   
-        self.write_data(0x43)
-        self.write_data(0x70)
-        self.write_data(0x72)
-        self.write_data(0x36)
-        self.write_data(0x37) 
-        self.write_data(0x6F)
-
-        self.write_cmd(0xED)
-        self.write_data(0x1B) 
-        self.write_data(0x0B) 
-
-        self.write_cmd(0xAE)
-        self.write_data(0x77)
-        
-        self.write_cmd(0xCD)
-        self.write_data(0x63)
-
-
-        self.write_cmd(0x70)
-        self.write_data(0x07)
-        self.write_data(0x07)
-        self.write_data(0x04)
-        self.write_data(0x0E) 
-        self.write_data(0x0F) 
-        self.write_data(0x09)
-        self.write_data(0x07)
-        self.write_data(0x08)
-        self.write_data(0x03)
-
-        self.write_cmd(0xE8)
-        self.write_data(0x34)
-
-        self.write_cmd(0x62)
-        self.write_data(0x18)
-        self.write_data(0x0D)
-        self.write_data(0x71)
-        self.write_data(0xED)
-        self.write_data(0x70) 
-        self.write_data(0x70)
-        self.write_data(0x18)
-        self.write_data(0x0F)
-        self.write_data(0x71)
-        self.write_data(0xEF)
-        self.write_data(0x70) 
-        self.write_data(0x70)
-
-        self.write_cmd(0x63)
-        self.write_data(0x18)
-        self.write_data(0x11)
-        self.write_data(0x71)
-        self.write_data(0xF1)
-        self.write_data(0x70) 
-        self.write_data(0x70)
-        self.write_data(0x18)
-        self.write_data(0x13)
-        self.write_data(0x71)
-        self.write_data(0xF3)
-        self.write_data(0x70) 
-        self.write_data(0x70)
-
-        self.write_cmd(0x64)
-        self.write_data(0x28)
-        self.write_data(0x29)
-        self.write_data(0xF1)
-        self.write_data(0x01)
-        self.write_data(0xF1)
-        self.write_data(0x00)
-        self.write_data(0x07)
-
-        self.write_cmd(0x66)
-        self.write_data(0x3C)
-        self.write_data(0x00)
-        self.write_data(0xCD)
-        self.write_data(0x67)
-        self.write_data(0x45)
-        self.write_data(0x45)
-        self.write_data(0x10)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0x00)
-
-        self.write_cmd(0x67)
-        self.write_data(0x00)
-        self.write_data(0x3C)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0x01)
-        self.write_data(0x54)
-        self.write_data(0x10)
-        self.write_data(0x32)
-        self.write_data(0x98)
-
-        self.write_cmd(0x74)
-        self.write_data(0x10)
-        self.write_data(0x85)
-        self.write_data(0x80)
-        self.write_data(0x00) 
-        self.write_data(0x00) 
-        self.write_data(0x4E)
-        self.write_data(0x00)
-        
-        self.write_cmd(0x98)
-        self.write_data(0x3e)
-        self.write_data(0x07)
-
-        self.write_cmd(0x35)
-        self.write_cmd(0x21)
-
-        self.write_cmd(0x11)
-
-        self.write_cmd(0x29)
+        # One CS assertion per register, see _INIT_SEQUENCE  每个寄存器只拉低一次片选
+        seq = _INIT_SEQUENCE
+        mv = memoryview(seq)
+        i = 0
+        n = len(seq)
+        while i < n:
+            count = seq[i + 1]
+            self.write_cmd_data(seq[i], mv[i + 2:i + 2 + count])
+            i += 2 + count
     
     #设置窗口    
     def setWindows(self,Xstart,Ystart,Xend,Yend): 
-        self.write_cmd(0x2A)
-        self.write_data(0x00)
-        self.write_data(Xstart)
-        self.write_data(0x00)
-        self.write_data(Xend-1)
+        if self._flushing:
+            self.wait_idle()
+        self._set_window(Xstart,Ystart,Xend,Yend)
+
+    def _set_window(self,Xstart,Ystart,Xend,Yend):
+        win = self._win_buf
+        win[0] = 0x00
+        win[1] = Xstart
+        win[2] = 0x00
+        win[3] = Xend-1
+        self._write_reg(0x2A, win)
         
-        self.write_cmd(0x2B)
-        self.write_data(0x00)
-        self.write_data(Ystart)
-        self.write_data(0x00)
-        self.write_data(Yend-1)
+        win[1] = Ystart
+        win[3] = Yend-1
+        self._write_reg(0x2B, win)
         
-        self.write_cmd(0x2C)
+        self._write_reg(0x2C, None)
      
     #Show  显示   
+    @profiler.timed('lcd.show')
     def show(self): 
+        if self.te_sync:
+            # Finish any background transfer first so the write starts on
+            # the TE edge, not partway through the scan
+            self.wait_idle()
+            self._te_wait()
         self.setWindows(0,0,self.width,self.height)
         
         self.cs(1)
@@ -334,41 +319,382 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.cs(0)
         self.spi.write(self.buffer)
         self.cs(1)
-        
-    '''
-        Partial display, the starting point of the local
-        display here is reduced by 10, and the end point
-        is increased by 10
-    '''
-    #Partial display, the starting point of the local display here is reduced by 10, and the end point is increased by 10
-    #局部显示，这里的局部显示起点减少10，终点增加10
-    def Windows_show(self,Xstart,Ystart,Xend,Yend):
-        if Xstart > Xend:
-            data = Xstart
-            Xstart = Xend
-            Xend = data
-            
-        if (Ystart > Yend):        
-            data = Ystart
-            Ystart = Yend
-            Yend = data
-            
-        if Xstart <= 10:
-            Xstart = 10
-        if Ystart <= 10:
-            Ystart = 10
-            
-        Xstart -= 10;Xend += 10
-        Ystart -= 10;Yend += 10
-        
-        self.setWindows(Xstart,Ystart,Xend,Yend)      
+        self._dirty = []
+        if self.te_sync:
+            self._te_done()
+
+    #Send only the changed regions  只发送变化的区域
+    @profiler.timed('lcd.flush')
+    def flush(self):
+        """
+        Push the dirty regions of the framebuffer to the panel.
+
+        Every drawing call on the LCD records the rectangle it touched;
+        flush() sends just those windows and clears the list. When nothing
+        has changed since the last show()/flush() no SPI traffic happens.
+        """
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = []
+        if self.te_sync:
+            self.wait_idle()
+            self._te_wait()
+        for x0, y0, x1, y1 in dirty:
+            self._write_window(x0, y0, x1, y1)
+        if self.te_sync:
+            self._te_done()
+
+    def _write_window(self, x0, y0, x1, y1):
+        # x1/y1 are exclusive. Rows are sent as memoryview slices of the
+        # framebuffer (no copies); full-width windows are contiguous in
+        # memory and go out as a single transfer.
+        self.setWindows(x0, y0, x1, y1)
         self.cs(1)
         self.dc(1)
         self.cs(0)
-        for i in range (Ystart,Yend-1):             
-            Addr = (Xstart * 2) + (i * 240 * 2)                
-            self.spi.write(self.buffer[Addr : Addr+((Xend-Xstart)*2)])
+        mv = self._mv
+        row = self.width * 2
+        if x0 == 0 and x1 == self.width:
+            self.spi.write(mv[y0 * row:y1 * row])
+        else:
+            span = (x1 - x0) * 2
+            addr = y0 * row + x0 * 2
+            for _ in range(y1 - y0):
+                self.spi.write(mv[addr:addr + span])
+                addr += row
         self.cs(1)
+
+    #Double-buffered frames  双缓冲帧
+    def begin_frame(self):
+        """
+        Mark the start of a frame.
+
+        Drawing always targets lcd.buffer. In double-buffered mode the panel
+        is fed from a separate buffer, so this never waits for the previous
+        frame's transfer; it only pairs with end_frame() for readability.
+        """
+        pass
+
+    @profiler.timed('lcd.end_frame')
+    def end_frame(self):
+        """
+        Present the changed regions of the current frame.
+
+        Double-buffered: waits for the previous transfer, copies the dirty
+        windows into the front buffer and returns while they are sent in
+        the background (DMA on RP2, a thread on the host simulator).
+        Single-buffered: same as flush().
+        """
+        if self._front is None:
+            self.flush()
+            return
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = []
+        self.wait_idle()
+
+        # Windows mark_dirty kept apart may overlap; if together they would
+        # not fit in the front buffer, send the whole frame instead
+        area = 0
+        for x0, y0, x1, y1 in dirty:
+            area += (x1 - x0) * (y1 - y0)
+        if area * 2 > len(self._front):
+            dirty = ((0, 0, self.width, self.height),)
+
+        # Pack each window's rows back to back so each is one transfer
+        src = self._mv
+        dst = self._front_mv
+        row = self.width * 2
+        offset = 0
+        for x0, y0, x1, y1 in dirty:
+            start = offset
+            if x0 == 0 and x1 == self.width:
+                n = (y1 - y0) * row
+                dst[offset:offset + n] = src[y0 * row:y1 * row]
+                offset += n
+            else:
+                span = (x1 - x0) * 2
+                addr = y0 * row + x0 * 2
+                for _ in range(y1 - y0):
+                    dst[offset:offset + span] = src[addr:addr + span]
+                    offset += span
+                    addr += row
+            self._queue.append((x0, y0, x1, y1, start, offset))
+
+        if self.te_sync:
+            self._te_wait()
+        self._flushing = True
+        self._next_window()
+
+    def _next_window(self):
+        # Called by end_frame() and by the writer when a window completes
+        self.cs(1)
+        if not self._queue:
+            if self.te_sync:
+                self._te_done()
+            self._flushing = False
+            return
+        x0, y0, x1, y1, start, end = self._queue.pop(0)
+        self._set_window(x0, y0, x1, y1)
+        self.dc(1)
+        self.cs(0)
+        self._writer.start(self._front_mv[start:end])
+
+    def wait_idle(self):
+        """Block until the background frame transfer (if any) has finished."""
+        while self._flushing:
+            idle()
+
+    #Tearing effect sync  TE同步
+    def _te_irq(self, pin):
+        # Hard IRQ on the TE rising edge: no allocation here
+        now = time.ticks_us()
+        if self._vsync:
+            self._te_period_us = time.ticks_diff(now, self._te_last_us)
+        self._te_last_us = now
+        self._vsync += 1
+
+    def _te_wait(self):
+        # Sleep until the next vertical blank edge, then start the transfer
+        start = self._vsync
+        t0 = time.ticks_ms()
+        while self._vsync == start:
+            if time.ticks_diff(time.ticks_ms(), t0) > _TE_TIMEOUT_MS:
+                self.te_timeouts += 1
+                break
+            idle()  # Wakes on the next interrupt, TE included
+        now = self._vsync
+        if self.te_frames:
+            skipped = now - self._te_present - 1
+            if skipped > 0:
+                self.te_missed += skipped
+        self._te_present = now
+        self.te_frames += 1
+
+    def _te_done(self):
+        # Another edge during the transfer means the scan overtook the write
+        if self._vsync != self._te_present:
+            self.te_late += 1
+
+    def te_reset_stats(self):
+        """Clear the TE frame counters (call before measuring an animation)."""
+        self.te_frames = 0
+        self.te_missed = 0
+        self.te_late = 0
+        self.te_timeouts = 0
+
+    def te_stats(self):
+        """
+        Report frame pacing measured against the panel's TE signal.
+
+        Returns:
+            dict with:
+                vsync: TE edges seen since power-up
+                frames: presents synchronised to TE
+                missed: refreshes skipped between consecutive presents
+                        (dropped frames while animating every refresh)
+                late: presents whose transfer ran past the next TE edge
+                timeouts: presents that gave up waiting for TE
+                period_us: measured refresh period
+                max_fps: refresh rate, the ceiling for tear-free updates
+        """
+        period = self._te_period_us
+        return {
+            'vsync': self._vsync,
+            'frames': self.te_frames,
+            'missed': self.te_missed,
+            'late': self.te_late,
+            'timeouts': self.te_timeouts,
+            'period_us': period,
+            'max_fps': 1_000_000 / period if period else 0,
+        }
+
+    def mark_dirty(self, x, y, w, h):
+        """
+        Record that a region of the framebuffer has changed.
+
+        Drawing methods call this automatically; call it directly after
+        writing to lcd.buffer by hand. Overlapping or nearby rectangles
+        are merged so flush() sends a few windows, not one per draw call.
+
+        Args:
+            x: X coordinate of top-left corner (may be off-screen)
+            y: Y coordinate of top-left corner (may be off-screen)
+            w: Width in pixels
+            h: Height in pixels
+        """
+        x1 = x + w
+        y1 = y + h
+        if x < 0:
+            x = 0
+        if y < 0:
+            y = 0
+        if x1 > self.width:
+            x1 = self.width
+        if y1 > self.height:
+            y1 = self.height
+        if x >= x1 or y >= y1:
+            return
+        dirty = self._dirty
+        if dirty:
+            # Fast path for runs of pixels inside the last region
+            r = dirty[-1]
+            if r[0] <= x and r[1] <= y and x1 <= r[2] and y1 <= r[3]:
+                return
+        while True:
+            area = (x1 - x) * (y1 - y)
+            best = -1
+            best_grow = 0
+            for i in range(len(dirty)):
+                r = dirty[i]
+                grow = ((max(x1, r[2]) - min(x, r[0])) * (max(y1, r[3]) - min(y, r[1]))
+                        - area - (r[2] - r[0]) * (r[3] - r[1]))
+                if best < 0 or grow < best_grow:
+                    best = i
+                    best_grow = grow
+            if best < 0 or (best_grow > _MERGE_SLACK and len(dirty) < _MAX_DIRTY):
+                dirty.append([x, y, x1, y1])
+                return
+            r = dirty.pop(best)
+            x = min(x, r[0])
+            y = min(y, r[1])
+            x1 = max(x1, r[2])
+            y1 = max(y1, r[3])
+
+    def _clean(self, x0, y0, x1, y1):
+        # The window x0..x1, y0..y1 (exclusive) has been sent: drop the dirty
+        # rectangles inside it and trim those it cuts down to one rectangle,
+        # so the next flush()/end_frame() does not send it again
+        dirty = self._dirty
+        i = 0
+        while i < len(dirty):
+            r = dirty[i]
+            if r[2] <= x0 or r[0] >= x1 or r[3] <= y0 or r[1] >= y1:
+                i += 1
+                continue
+            if x0 <= r[0] and r[2] <= x1:
+                # Window spans the rectangle's width: trim the top or bottom
+                if y0 <= r[1] and r[3] <= y1:
+                    dirty.pop(i)
+                    continue
+                if y0 <= r[1]:
+                    r[1] = y1
+                elif r[3] <= y1:
+                    r[3] = y0
+            elif y0 <= r[1] and r[3] <= y1:
+                # Window spans the rectangle's height: trim the left or right
+                if x0 <= r[0]:
+                    r[0] = x1
+                elif r[2] <= x1:
+                    r[2] = x0
+            i += 1
+
+    def dirty_regions(self):
+        """Return the pending dirty rectangles as (x, y, w, h) tuples."""
+        return [(r[0], r[1], r[2] - r[0], r[3] - r[1]) for r in self._dirty]
+
+    #Drawing methods that record what they touch  记录绘制区域的绘图方法
+    def fill(self, c):
+        self._fb.fill(c)
+        self._dirty = [[0, 0, self.width, self.height]]
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            return self._fb.pixel(x, y)
+        self._fb.pixel(x, y, c)
+        self.mark_dirty(x, y, 1, 1)
+
+    def fill_rect(self, x, y, w, h, c):
+        self._fb.fill_rect(x, y, w, h, c)
+        self.mark_dirty(x, y, w, h)
+
+    def rect(self, x, y, w, h, c, f=False):
+        self._fb.rect(x, y, w, h, c, f)
+        self.mark_dirty(x, y, w, h)
+
+    def hline(self, x, y, w, c):
+        self._fb.hline(x, y, w, c)
+        self.mark_dirty(x, y, w, 1)
+
+    def vline(self, x, y, h, c):
+        self._fb.vline(x, y, h, c)
+        self.mark_dirty(x, y, 1, h)
+
+    def line(self, x1, y1, x2, y2, c):
+        self._fb.line(x1, y1, x2, y2, c)
+        self.mark_dirty(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+
+    def text(self, s, x, y, c=1):
+        self._fb.text(s, x, y, c)
+        self.mark_dirty(x, y, 8 * len(s), 8)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0xF):
+        self._fb.ellipse(x, y, xr, yr, c, f, m)
+        self.mark_dirty(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+
+    def poly(self, x, y, coords, c, f=False):
+        self._fb.poly(x, y, coords, c, f)
+        xs = coords[0::2]
+        ys = coords[1::2]
+        self.mark_dirty(x + min(xs), y + min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        self._fb.blit(fbuf, x, y, key, palette)
+        if isinstance(fbuf, tuple):
+            self.mark_dirty(x, y, fbuf[1], fbuf[2])
+        else:
+            # A native FrameBuffer does not expose its size, so assume it
+            # reaches the bottom-right corner
+            w = getattr(fbuf, 'width', self.width)
+            h = getattr(fbuf, 'height', self.height)
+            self.mark_dirty(x, y, w, h)
+
+    def scroll(self, xstep, ystep):
+        self._fb.scroll(xstep, ystep)
+        self._dirty = [[0, 0, self.width, self.height]]
+        
+    #Partial display of the window Xstart..Xend, Ystart..Yend (inclusive)
+    #局部显示，窗口包含起点和终点，pad为可选的外扩像素
+    @profiler.timed('lcd.Windows_show')
+    def Windows_show(self,Xstart,Ystart,Xend,Yend,pad=0):
+        '''
+        Push one rectangular window of the framebuffer to the panel.
+
+        Args:
+            Xstart, Ystart: One corner of the window
+            Xend, Yend: Opposite corner (inclusive, corners may be swapped)
+            pad: Optional margin in pixels added on every side (default 0)
+        '''
+        if Xstart > Xend:
+            Xstart, Xend = Xend, Xstart
+        if Ystart > Yend:
+            Ystart, Yend = Yend, Ystart
+
+        Xstart -= pad
+        Ystart -= pad
+        Xend += pad + 1
+        Yend += pad + 1
+
+        if Xstart < 0:
+            Xstart = 0
+        if Ystart < 0:
+            Ystart = 0
+        if Xend > self.width:
+            Xend = self.width
+        if Yend > self.height:
+            Yend = self.height
+        if Xstart >= Xend or Ystart >= Yend:
+            return
+
+        if self.te_sync:
+            self.wait_idle()
+            self._te_wait()
+        self._write_window(Xstart, Ystart, Xend, Yend)
+        if self.te_sync:
+            self._te_done()
+        self._clean(Xstart, Ystart, Xend, Yend)
         
     #Write characters, size is the font size, the minimum is 1  
     #写字符，size为字体大小,最小为1
@@ -376,6 +702,11 @@ class LCD_1inch28(framebuf.FrameBuffer):
         ''' Method to write Text on OLED/LCD Displays
             with a variable font size
 
+            Each glyph is rendered once into an 8x8 MONO_HLSB buffer and
+            turned into scaled rectangles (horizontal runs, merged down
+            rows), cached per (char, size). Only lit pixels are drawn, so
+            whatever is under the text is kept.
+
             Args:
                 text: the string of chars to be displayed
                 x: x co-ordinate of starting position
@@ -383,21 +714,52 @@ class LCD_1inch28(framebuf.FrameBuffer):
                 size: font size of text
                 color: color of text to be displayed
         '''
-        background = self.pixel(x,y)
-        info = []
-        # Creating reference charaters to read their values
-        self.text(text,x,y,color)
-        for i in range(x,x+(8*len(text))):
-            for j in range(y,y+8):
-                # Fetching amd saving details of pixels, such as
-                # x co-ordinate, y co-ordinate, and color of the pixel
-                px_color = self.pixel(i,j)
-                info.append((i,j,px_color)) if px_color == color else None
-        # Clearing the reference characters from the screen
-        self.text(text,x,y,background)
-        # Writing the custom-sized font characters on screen
-        for px_info in info:
-            self.fill_rect(size*px_info[0] - (size-1)*x , size*px_info[1] - (size-1)*y, size, size, px_info[2]) 
+        fill_rect = self._fb.fill_rect
+        step = 8 * size
+        cx = x
+        for ch in text:
+            rects = _scaled_glyphs.get((ch, size))
+            if rects is None:
+                rects = self._scale_glyph(ch, size)
+            for dx, dy, w, h in rects:
+                fill_rect(cx + dx, y + dy, w, h, color)
+            cx += step
+        self.mark_dirty(x, y, step * len(text), step)
+
+    def _scale_glyph(self, ch, size):
+        glyph = self._glyph_buf
+        self._glyph.fill(0)
+        self._glyph.text(ch, 0, 0, 1)
+        rects = []
+        open_runs = {}  # (col, length) -> index in rects, for runs on the previous row
+        for row in range(8):
+            bits = glyph[row]
+            runs = {}
+            col = 0
+            while bits:
+                if bits & 0x80:
+                    start = col
+                    while bits & 0x80:
+                        bits = (bits << 1) & 0xFF
+                        col += 1
+                    key = (start, col - start)
+                    i = open_runs.get(key)
+                    if i is None:
+                        i = len(rects)
+                        rects.append([start * size, row * size, (col - start) * size, size])
+                    else:
+                        # Same run as the row above: grow that rectangle
+                        rects[i][3] += size
+                    runs[key] = i
+                else:
+                    bits = (bits << 1) & 0xFF
+                    col += 1
+            open_runs = runs
+        rects = tuple(tuple(r) for r in rects)
+        if len(_scaled_glyphs) >= _SCALED_GLYPHS_MAX:
+            _scaled_glyphs.clear()
+        _scaled_glyphs[(ch, size)] = rects
+        return rects
     
         
 #Touch drive  触摸驱动
@@ -406,6 +768,10 @@ class Touch_CST816T(object):
     def __init__(self,address=0x15,mode=0,i2c_num=1,i2c_sda=6,i2c_scl=7,int_pin=21,rst_pin=22,LCD=None):
         self._bus = I2C(i2c_num, scl=Pin(i2c_scl), sda=Pin(i2c_sda), freq=400_000) #Initialize I2C 初始化I2C
         self._address = address #Set slave address  设置从机地址
+        # Optional flag set on every touch interrupt (e.g. a uasyncio
+        # ThreadSafeFlag), so a task can wait for touches instead of polling
+        # 可选的触摸中断标志，任务可等待触摸而无需轮询
+        self.event = None
         self.int=Pin(int_pin,Pin.IN, Pin.PULL_UP)
         self.tim = Timer(-1)
         self.rst=Pin(rst_pin,Pin.OUT)
@@ -480,6 +846,7 @@ class Touch_CST816T(object):
         self.X_point = x_point
         self.Y_point = y_point
         
+    @profiler.timed('touch.irq')
     def Int_Callback(self,pin):
         if self.Mode == 0 :
             self.Gestures = self._read_byte(0x01)
@@ -488,6 +855,9 @@ class Touch_CST816T(object):
             self.Flag = 1
             self.get_point()
 
+        if self.event is not None:
+            self.event.set()
+
     def Timer_callback(self,t):
         self.l += 1
         if self.l > 100:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: bitmap font rendering, per-pixel loop against glyph blits.
+
+"Legacy" replays the original draw_text, which tested every bit of every
+row and called lcd.pixel() for each set bit. The current fonts blit one
+pre-converted MONO_HLSB glyph per character. Both are rendered into a fresh
+frame and compared byte for byte before timing.
+
+On the host the simulated FrameBuffer.blit is itself a Python loop, so the
+wall times understate the gain; on the device blit runs in C and the number
+of Python-level draw calls is the figure that matters.
+
+Usage:
+    python benchmarks/bench_bitmap_fonts.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from LCD_1inch28 import LCD_1inch28
+from bitmap_fonts import LARGE_DIGITS, draw_text
+from bitmap_fonts_32 import LARGE_DIGITS_32, draw_text_32
+from bitmap_fonts_48 import LARGE_DIGITS_48, draw_text_48
+
+REPEAT = 20
+
+CASES = [
+    ("clock 16x24 '12:34'", LARGE_DIGITS, 16, 2, draw_text, "12:34"),
+    ("temp 24x32 '21'", LARGE_DIGITS_32, 24, 2, draw_text_32, "21"),
+    ("clock 24x48 '0959'", LARGE_DIGITS_48, 24, 4, draw_text_48, "0959"),
+]
+
+
+def legacy_draw_text(lcd, glyphs, width, text, x, y, color, spacing):
+    """The original per-pixel draw_char/draw_text, kept here for comparison."""
+    current_x = x
+    for char in text:
+        if char in glyphs:
+            for row_idx, row_data in enumerate(glyphs[char]):
+                for col in range(width):
+                    if row_data & (1 << (width - 1 - col)):
+                        lcd.pixel(current_x + col, y + row_idx, color)
+        current_x += width + spacing
+    return current_x - x
+
+
+class _CallCounter:
+    """Counts pixel() and blit() calls made on the display."""
+
+    def __init__(self, lcd):
+        self.pixels = 0
+        self.blits = 0
+        pixel, blit = lcd.pixel, lcd.blit
+
+        def counted_pixel(*args):
+            self.pixels += 1
+            return pixel(*args)
+
+        def counted_blit(*args):
+            self.blits += 1
+            return blit(*args)
+
+        lcd.pixel = counted_pixel
+        lcd.blit = counted_blit
+
+    def reset(self):
+        self.pixels = 0
+        self.blits = 0
+
+
+def _run(label, lcd, counter, fn):
+    lcd.fill(0)
+    counter.reset()
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    elapsed = (time.perf_counter() - t0) / REPEAT
+    print(f"    {label:<10} {counter.pixels // REPEAT:>7} {counter.blits // REPEAT:>6} "
+          f"{elapsed * 1000:>9.2f}")
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+    counter = _CallCounter(lcd)
+    color = 0xFFFF
+
+    print(f"Per string, averaged over {REPEAT} draws")
+    print(f"    {'':<10} {'pixel()':>7} {'blit()':>6} {'ms':>9}")
+    for name, glyphs, width, spacing, new_draw, text in CASES:
+        lcd.fill(0)
+        w_old = legacy_draw_text(lcd, glyphs, width, text, 20, 100, color, spacing)
+        expected = bytes(lcd.buffer)
+        lcd.fill(0)
+        w_new = new_draw(lcd, text, 20, 100, color, spacing)
+        assert w_old == w_new and bytes(lcd.buffer) == expected, name
+
+        print(f"  {name}")
+        _run("legacy", lcd, counter,
+             lambda: legacy_draw_text(lcd, glyphs, width, text, 20, 100, color, spacing))
+        _run("blit", lcd, counter, lambda: new_draw(lcd, text, 20, 100, color, spacing))
+
+
+if __name__ == '__main__':
+    main()
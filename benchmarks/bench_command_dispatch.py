@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: replay a Home Assistant command stream through
+process_command(), startswith chain against the dispatch table.
+
+ha_command_stream.txt is two hours of the traffic the ESP32 forwards with
+the automations in home_assistant_automation.yaml: BEDROOM and HIVE every
+2 minutes, WEATHER every 5, an hourly SETTIME, and a few MODE, BRIGHT and
+MSG commands. "Legacy" replays the original process_command, which tested
+every prefix in turn, decoded, stripped and split each line into temporary
+strings and printed it. The current one finds the handler in main.COMMANDS
+by the first letter and length of the name and parses the arguments in
+place, reading fields from the line through main._bounds, with printing
+behind main.DEBUG. Both must leave main.py in the same state,
+for the stream and for each of EDGE_CASES (spaced fields, which int()
+accepts, and malformed commands the legacy parser rejected).
+
+The first table times parsing and dispatch alone (update_display_for_mode
+is stubbed out), per command name: mean microseconds, mean peak heap from
+tracemalloc and mean characters printed per command. The last rows replay
+the stream with rendering. Printed text goes to an in-memory sink here; on
+the device every character goes out over USB serial, which costs more than
+the parsing. The in-place parser only allocates the strings it keeps, but
+runs its loops in bytecode where the legacy one called C string methods,
+so on CPython its time per command is about the same or a little higher.
+
+Usage:
+    python benchmarks/bench_command_dispatch.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+STREAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ha_command_stream.txt')
+REPEAT = 20
+STATE = ('current_brightness', 'current_mode', 'display_color', 'weather_condition',
+         'weather_temp', 'weather_humidity', 'hive_current_temp', 'hive_target_temp',
+         'hive_heating_status', 'hive_hotwater_status', 'bedroom_temp', 'bedroom_humidity')
+
+EDGE_CASES = [
+    b"COLOR:255, 128, 0\n",
+    b"COLOR: 12 ,\t34,56\n",
+    b"BRIGHT: 40 \n",
+    b"SETTIME:2025, 1, 5, 9, 30, 0, 6, 5\n",
+    b"SETTIME:2026,3,4,9,30,0,2,x\n",
+    b"SETTIME:2026,3,4,9,30,0,2,\n",
+    b"COLOR:255,12x,0\n",
+    b"BRIGHT:\n",
+    b"WEATHER:Rain, 12.0\xc2\xb0C, 80%\n",
+]
+
+
+def legacy_process_command(app, cmd_line):
+    """The original startswith chain, kept here for comparison."""
+    lcd = app.lcd
+    try:
+        print(f"Received command: {cmd_line}")
+        if cmd_line.startswith(b'MSG:'):
+            message = cmd_line[4:].decode().strip()
+            lcd.begin_frame()
+            lcd.fill(lcd.white)
+            lcd.text(message, 60, 120, app.display_color)
+            lcd.end_frame()
+            print(f"Displayed: {message}")
+        elif cmd_line.startswith(b'BRIGHT:'):
+            brightness = int(cmd_line[7:].decode().strip())
+            app.current_brightness = brightness
+            lcd.set_bl_pwm(int(brightness * 65535 / 100))
+            print(f"Brightness set to: {brightness}%")
+        elif cmd_line.startswith(b'MODE:'):
+            mode = cmd_line[5:].decode().strip()
+            app.current_mode = mode
+            print(f"Mode changed to: {mode}")
+            app.update_display_for_mode(mode)
+        elif cmd_line.startswith(b'CMD:CLEAR'):
+            lcd.begin_frame()
+            lcd.fill(lcd.white)
+            lcd.end_frame()
+            print("Display cleared")
+        elif cmd_line.startswith(b'CMD:TIME'):
+            lcd.begin_frame()
+            lcd.fill(lcd.white)
+            lcd.text("12:34 PM", 80, 120, lcd.black)
+            lcd.end_frame()
+            print("Time displayed")
+        elif cmd_line.startswith(b'DISP:'):
+            data = cmd_line[5:].decode().strip()
+            lcd.begin_frame()
+            lcd.fill(lcd.white)
+            lcd.text(data, 60, 120, app.display_color)
+            lcd.end_frame()
+            print(f"Custom display: {data}")
+        elif cmd_line.startswith(b'COLOR:'):
+            colors = cmd_line[6:].decode().strip().split(',')
+            r, g, b = int(colors[0]), int(colors[1]), int(colors[2])
+            app.display_color = ((b & 0xF8) << 8) | ((g & 0xFC) << 3) | (r >> 3)
+            print(f"Color set to RGB({r},{g},{b})")
+        elif cmd_line.startswith(b'SETTIME:'):
+            time_parts = cmd_line[8:].decode().strip().split(',')
+            if len(time_parts) == 8:
+                year = int(time_parts[0])
+                month = int(time_parts[1])
+                day = int(time_parts[2])
+                hour = int(time_parts[3])
+                minute = int(time_parts[4])
+                second = int(time_parts[5])
+                weekday = int(time_parts[6])
+                yearday = int(time_parts[7])
+                app.rtc.datetime((year, month, day, weekday, hour, minute, second, 0))
+                print(f"Time set to: {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}")
+                if app.current_mode == "Clock":
+                    app.update_display_for_mode(app.current_mode)
+        elif cmd_line.startswith(b'WEATHER:'):
+            weather_parts = cmd_line[8:].decode().strip().split(',')
+            if len(weather_parts) == 3:
+                app.weather_condition = weather_parts[0]
+                app.weather_temp = weather_parts[1]
+                app.weather_humidity = weather_parts[2]
+                print(f"Weather updated: {app.weather_condition}, {app.weather_temp}, "
+                      f"{app.weather_humidity}")
+                if app.current_mode == "Weather":
+                    app.update_display_for_mode(app.current_mode)
+        elif cmd_line.startswith(b'HIVE:'):
+            hive_parts = cmd_line[5:].decode().strip().split(',')
+            if len(hive_parts) == 4:
+                app.hive_current_temp = hive_parts[0]
+                app.hive_target_temp = hive_parts[1]
+                app.hive_heating_status = hive_parts[2]
+                app.hive_hotwater_status = hive_parts[3]
+                print(f"Hive updated: Current={app.hive_current_temp}, "
+                      f"Target={app.hive_target_temp}, Heating={app.hive_heating_status}, "
+                      f"HotWater={app.hive_hotwater_status}")
+                if app.current_mode == "Bedroom":
+                    app.update_display_for_mode(app.current_mode)
+        elif cmd_line.startswith(b'BEDROOM:'):
+            bedroom_parts = cmd_line[8:].decode().strip().split(',')
+            if len(bedroom_parts) == 2:
+                app.bedroom_temp = bedroom_parts[0]
+                app.bedroom_humidity = bedroom_parts[1]
+                print(f"Bedroom updated: Temp={app.bedroom_temp}, "
+                      f"Humidity={app.bedroom_humidity}")
+                if app.current_mode == "Bedroom":
+                    app.update_display_for_mode(app.current_mode)
+    except Exception as e:
+        print(f"Error processing command: {e}")
+
+
+def import_main():
+    """Import main.py quietly, without the 2 s welcome pause."""
+    cwd = os.getcwd()
+    sleep = time.sleep
+    os.chdir(ROOT)  # main.py opens its fonts by relative path
+    time.sleep = lambda seconds: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import main
+    finally:
+        time.sleep = sleep
+        os.chdir(cwd)
+    return main
+
+
+def load_stream():
+    with open(STREAM, 'rb') as f:
+        return [line.rstrip(b'\n') + b'\n' for line in f if line.strip()]
+
+
+def _state(app):
+    return tuple(getattr(app, name) for name in STATE) + (app.rtc.datetime()[:3],)
+
+
+def _reset(app, state):
+    for name, value in zip(STATE, state):
+        setattr(app, name, value)
+
+
+def replay(app, process, stream):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for line in stream:
+            process(line)
+        app.lcd.wait_idle()
+
+
+def per_command(app, process, stream):
+    """{name: [count, total seconds, total peak bytes, printed chars]}"""
+    results = {}
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for line in stream:
+            name = line.split(b':', 1)[0].decode()
+            entry = results.setdefault(name, [0, 0.0, 0, 0])
+            best = None
+            for _ in range(REPEAT):
+                t0 = time.perf_counter()
+                process(line)
+                elapsed = time.perf_counter() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            printed = sink.tell()
+            tracemalloc.start()
+            process(line)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            entry[0] += 1
+            entry[1] += best
+            entry[2] += peak
+            entry[3] += sink.tell() - printed
+    return results
+
+
+def main():
+    app = import_main()
+    stream = load_stream()
+    initial = _state(app)
+
+    def legacy(line):
+        legacy_process_command(app, line)
+
+    def table(line):
+        app.process_command(line)
+
+    replay(app, legacy, stream)
+    legacy_state = _state(app)
+    _reset(app, initial)
+    replay(app, table, stream)
+    assert _state(app) == legacy_state, "dispatch table ends in a different state"
+    print(f"{len(stream)} commands from {os.path.basename(STREAM)}; both end in the same state")
+
+    for line in EDGE_CASES:
+        _reset(app, initial)
+        app.rtc.datetime((2025, 6, 2, 0, 14, 37, 5, 0))
+        replay(app, legacy, [line])
+        legacy_state = _state(app)
+        _reset(app, initial)
+        app.rtc.datetime((2025, 6, 2, 0, 14, 37, 5, 0))
+        replay(app, table, [line])
+        assert _state(app) == legacy_state, f"{line}: dispatch table ends in a different state"
+    print(f"{len(EDGE_CASES)} edge cases (spaced fields, malformed numbers); same state each")
+
+    update = app.update_display_for_mode
+    app.update_display_for_mode = lambda mode: None
+    try:
+        _reset(app, initial)
+        old = per_command(app, legacy, stream)
+        _reset(app, initial)
+        new = per_command(app, table, stream)
+    finally:
+        app.update_display_for_mode = update
+
+    print(f"\nParse and dispatch only, best of {REPEAT}, mean per command")
+    print(f"  {'':<10} {'count':>6} {'legacy us':>10} {'table us':>9} "
+          f"{'legacy peak B':>14} {'table peak B':>13} {'legacy print':>13} "
+          f"{'table print':>12}")
+    totals = [0] * 7
+    for name in old:
+        n, old_s, old_peak, old_print = old[name]
+        _, new_s, new_peak, new_print = new[name]
+        print(f"  {name:<10} {n:>6} {old_s / n * 1e6:>10.1f} {new_s / n * 1e6:>9.1f} "
+              f"{old_peak // n:>14,} {new_peak // n:>13,} {old_print // n:>13,} "
+              f"{new_print // n:>12,}")
+        for i, value in enumerate((n, old_s, new_s, old_peak, new_peak, old_print, new_print)):
+            totals[i] += value
+    n, old_s, new_s, old_peak, new_peak, old_print, new_print = totals
+    print(f"  {'all':<10} {n:>6} {old_s / n * 1e6:>10.1f} {new_s / n * 1e6:>9.1f} "
+          f"{old_peak // n:>14,} {new_peak // n:>13,} {old_print // n:>13,} "
+          f"{new_print // n:>12,}")
+
+    print("\nFull replay with rendering")
+    for label, process in (("legacy", legacy), ("dispatch table", table)):
+        _reset(app, initial)
+        t0 = time.perf_counter()
+        replay(app, process, stream)
+        elapsed = time.perf_counter() - t0
+        print(f"  {label:<16} {elapsed * 1000:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: convert_image.py per-pixel loop against the NumPy pipeline.
+
+"Legacy" replays the original conversion, which read every pixel with
+img.getpixel() and gamma-corrected each channel with pow(). The current
+converter looks the channels up in a 256-entry gamma table and packs
+BRG565 with NumPy. Both outputs must be byte-identical, for both sample
+images and with gamma correction on and off, and the jatj_v2.png result
+must match the background1 bytes already committed in image_data.py.
+
+The last rows time --batch style conversion of a directory of variants of
+the sample images: serially and with a process pool, then again with an
+empty content-hash cache, a warm cache, and a warm cache with the outputs
+already up to date (the usual rebuild before a deploy). Each variant is
+the image shifted (wrapping round) by a different offset, so no two share
+content and every conversion in the empty-cache run misses the cache.
+
+Usage:
+    python benchmarks/bench_convert_image.py [copies]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from PIL import Image, ImageChops
+
+from convert_image import (apply_gamma_correction, convert_directory, convert_file,
+                           convert_image_to_rgb565_brg)
+
+IMAGES = ['jatj_v2.png', 'joeandthejuice.jpg']
+
+
+def legacy_convert(image_path, gamma=2.2):
+    """The original getpixel()/pow() conversion, kept here for comparison."""
+    img = Image.open(image_path)
+    if img.size != (240, 240):
+        img = img.resize((240, 240), Image.Resampling.LANCZOS)
+    img = img.convert('RGB')
+    byte_array = bytearray()
+    for y in range(240):
+        for x in range(240):
+            r, g, b = img.getpixel((x, y))
+            if gamma != 1.0:
+                r = apply_gamma_correction(r, gamma)
+                g = apply_gamma_correction(g, gamma)
+                b = apply_gamma_correction(b, gamma)
+            rgb565 = ((b & 0xF8) << 8) | ((r & 0xFC) << 3) | (g >> 3)
+            byte_array.append(rgb565 & 0xFF)
+            byte_array.append((rgb565 >> 8) & 0xFF)
+    return byte_array
+
+
+def image_data_background():
+    path = os.path.join(ROOT, 'image_data.py')
+    with open(path) as f:
+        source = f.read()
+    namespace = {'__name__': 'image_data'}
+    exec(compile(source, path, 'exec'), namespace)
+    return b''.join(namespace['background1'])
+
+
+def write_variant(image_path, out_path, i):
+    """Save variant i of an image: the same size, shifted by i + 1 pixels."""
+    img = Image.open(image_path)
+    w = img.size[0]
+    ImageChops.offset(img, (i + 1) % w, (i + 1) // w).save(out_path)
+
+
+def _time(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+    print(f"  {'':<30} {'legacy ms':>10} {'numpy ms':>9} {'identical':>9}")
+    for name in IMAGES:
+        path = os.path.join(ROOT, name)
+        for gamma in (2.2, 1.0):
+            old, old_ms = _time(lambda: legacy_convert(path, gamma))
+            (new, info), new_ms = _time(lambda: convert_image_to_rgb565_brg(path, 'img', gamma))
+            assert new == old, f"{name} gamma {gamma}: output differs"
+            print(f"  {name + ' gamma ' + str(gamma):<30} {old_ms:>10.1f} {new_ms:>9.1f} "
+                  f"{'yes':>9}")
+
+    new, info = convert_image_to_rgb565_brg(os.path.join(ROOT, 'jatj_v2.png'), 'img')
+    assert new == image_data_background(), "jatj_v2.png no longer matches image_data.py"
+    print("  jatj_v2.png matches background1 in image_data.py")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'src')
+        os.makedirs(src)
+        for i in range(copies):
+            for name in IMAGES:
+                write_variant(os.path.join(ROOT, name), os.path.join(src, f"{i:02d}_{name}"), i)
+        count = copies * len(IMAGES)
+        files = sorted(os.listdir(src))
+
+        out = os.path.join(tmp, 'serial')
+        os.makedirs(out)
+        _, serial_ms = _time(lambda: [
+            convert_file(os.path.join(src, n), os.path.join(out, n + '.rgb565'), rle=True)
+            for n in files])
+        _, pool_ms = _time(lambda: convert_directory(src, os.path.join(tmp, 'pool'), rle=True))
+        print(f"\n{count} images to .rgb565 --rle, {os.cpu_count()} CPUs")
+        print(f"  serial                    {serial_ms:>9.1f} ms")
+        print(f"  process pool              {pool_ms:>9.1f} ms")
+
+        cache = os.path.join(tmp, 'cache')
+        for label, out in (("empty cache", 'cold'), ("warm cache, new outputs", 'warm'),
+                           ("warm cache, up to date", 'warm')):
+            results, ms = _time(lambda: convert_directory(src, os.path.join(tmp, out), rle=True,
+                                                          cache_dir=cache))
+            written = sum(1 for r in results if r['written'])
+            hits = sum(1 for r in results if r['cached'])
+            print(f"  {label:<25} {ms:>9.1f} ms, {hits} cache hits, {written} written")
+
+
+if __name__ == '__main__':
+    main()
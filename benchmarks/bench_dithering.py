@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: dithering modes of convert_image.py on joeandthejuice.jpg.
+
+Each mode converts the image to BRG565 and is compared against the source
+after the calibration curves, i.e. the full-precision colour the panel is
+asked to show. Levels are expanded back to 0-255 (level * 255 / max). The
+metrics are:
+
+  rmse      per-pixel RMS error, 0-255 scale, all channels
+  blur rmse RMS error after a 5x5 box blur of both images, roughly what the
+            eye sees at viewing distance; dithering trades per-pixel error
+            for a lower value here
+  bias      mean signed error per channel (R/G/B), from truncating
+  bands     longest run of equal pixels across a smooth 0-255 ramp,
+            the width of the visible steps in gradients
+
+"truncate" is the default conversion (whole-value gamma table, then 5/6/5
+bit truncation), "round" applies the curves at full precision and rounds
+to the nearest level without dithering. With curves given on the command
+line the truncate row still uses plain gamma 2.2, as the default does, so
+its error includes the missing calibration.
+
+Usage:
+    python benchmarks/bench_dithering.py [R,G,B curves]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from PIL import Image
+
+from convert_image import channel_curves, convert_image_to_rgb565_brg, load_rgb
+
+IMAGE = os.path.join(ROOT, 'joeandthejuice.jpg')
+REPEAT = 3
+MODES = [
+    ("truncate", None, False),
+    ("round", None, True),
+    ("bayer", 'bayer', True),
+    ("floyd-steinberg", 'floyd-steinberg', True),
+]
+
+
+def _expand(byte_array):
+    # BRG565 bytes back to an RGB float image on the 0-255 scale
+    v = np.frombuffer(bytes(byte_array), dtype='<u2').reshape(240, 240).astype(float)
+    r = ((v.astype(np.uint16) >> 5) & 0x3F) * (255.0 / 63)
+    g = (v.astype(np.uint16) & 0x1F) * (255.0 / 31)
+    b = (v.astype(np.uint16) >> 11) * (255.0 / 31)
+    return np.stack([r, g, b], axis=2)
+
+
+def _blur(img, k=5):
+    # Box blur with edge padding, per channel
+    pad = k // 2
+    p = np.pad(img, ((pad, pad), (pad, pad), (0, 0)), mode='edge')
+    out = np.zeros_like(img)
+    for dy in range(k):
+        for dx in range(k):
+            out += p[dy:dy + img.shape[0], dx:dx + img.shape[1]]
+    return out / (k * k)
+
+
+def _bands(byte_array):
+    # Longest horizontal run of equal pixels, averaged over the rows
+    v = np.frombuffer(bytes(byte_array), dtype='<u2').reshape(240, 240)
+    longest = []
+    for row in v:
+        change = np.flatnonzero(np.diff(row)) + 1
+        edges = np.concatenate(([0], change, [row.size]))
+        longest.append(np.diff(edges).max())
+    return float(np.mean(longest))
+
+
+def _convert(path, dither, curves, use_curves):
+    if use_curves:
+        return convert_image_to_rgb565_brg(path, 'img', dither=dither,
+                                           curves=curves or (2.2, 2.2, 2.2))[0]
+    return convert_image_to_rgb565_brg(path, 'img')[0]
+
+
+def main():
+    curves = None
+    if len(sys.argv) > 1:
+        curves = tuple(float(v) for v in sys.argv[1].split(','))
+
+    rgb, size = load_rgb(IMAGE)
+    table = channel_curves(2.2, curves)
+    target = np.stack([table[i][rgb[:, :, i]] for i in range(3)], axis=2)
+    target_blur = _blur(target)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ramp_path = os.path.join(tmp, 'ramp.png')
+        ramp = np.tile(np.linspace(0, 255, 240), (240, 1))
+        Image.fromarray(np.stack([ramp] * 3, axis=2).astype(np.uint8)).save(ramp_path)
+
+        print(f"joeandthejuice.jpg, curves {curves or 'gamma 2.2'}, best of {REPEAT}")
+        print(f"  {'':<16} {'ms':>7} {'rmse':>6} {'blur rmse':>9} {'bias R/G/B':>20} "
+              f"{'bands px':>8}")
+        for label, dither, use_curves in MODES:
+            best = None
+            for _ in range(REPEAT):
+                t0 = time.perf_counter()
+                out = _convert(IMAGE, dither, curves, use_curves)
+                elapsed = time.perf_counter() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            shown = _expand(out)
+            err = shown - target
+            rmse = np.sqrt(np.mean(err ** 2))
+            blur_rmse = np.sqrt(np.mean((_blur(shown) - target_blur) ** 2))
+            bias = "/".join(f"{err[:, :, i].mean():+.1f}" for i in range(3))
+            bands = _bands(_convert(ramp_path, dither, curves, use_curves))
+            print(f"  {label:<16} {best * 1000:>7.1f} {rmse:>6.2f} {blur_rmse:>9.2f} "
+                  f"{bias:>20} {bands:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: the original 100 ms polling loop against main.py's
+uasyncio tasks.
+
+main.py is imported under the simulator with a CST816T answering on the
+I2C bus, then each loop runs in a background thread, as it would own the
+RP2350's CPU. "Legacy" replays the original while-loop (uart.any(),
+touch.Flag and ticks_diff timers, then time.sleep(0.1)). "Tasks" runs
+main.main_tasks() on a CPython event loop through simulator.uasyncio,
+whose StreamReader and ThreadSafeFlag wake on UART data and the touch IRQ.
+
+  idle wakeups  loop iterations per second with nothing to do; on the
+                device each one is a CPU wakeup. The tasks still wake for
+                their timers (telemetry and cycle every 10 s, the clock
+                once a minute), which the short idle window may not see
+  command       time from UART data arriving (MODE:...) to the new frame
+                being handed to end_frame()
+  touch         time from the touch IRQ (the INT pin's falling edge) to
+                the next mode's frame reaching end_frame()
+
+Latencies are min/median/max over randomly spaced events. The drawing is
+the same for both, so the difference is the time spent waiting to notice
+the event.
+
+Usage:
+    python benchmarks/bench_event_loop.py [events]
+"""
+
+import contextlib
+import io
+import os
+import random
+import selectors
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+import machine
+import uasyncio
+
+TOUCH_BUS = 1
+TOUCH_ADDR = 0x15
+IDLE_S = 3.0
+
+
+def legacy_loop(app, stop, wakeups):
+    """The original polling loop, kept here for comparison (with a stop flag)."""
+    last_sensor_update = time.ticks_ms()
+    last_clock_update = time.ticks_ms()
+    last_custom_update = time.ticks_ms()
+
+    while not stop.is_set():
+        wakeups[0] += 1
+        if app.uart.any():
+            cmd_line = app.uart.readline()
+            if cmd_line:
+                app.process_command(cmd_line)
+
+        if app.touch.Flag == 1:
+            app.handle_touch()
+
+        if app.current_mode == "Clock" and time.ticks_diff(time.ticks_ms(), last_clock_update) > 60000:
+            app.refresh_clock()
+            last_clock_update = time.ticks_ms()
+
+        if app.current_mode == "Cycle" and time.ticks_diff(time.ticks_ms(), last_custom_update) > 10000:
+            app.current_custom_index = (app.current_custom_index + 1) % len(app.custom_sub_modes)
+            app.update_display_for_mode(app.current_mode)
+            last_custom_update = time.ticks_ms()
+
+        if time.ticks_diff(time.ticks_ms(), last_sensor_update) > 10000:
+            app.send_sensor_data()
+            last_sensor_update = time.ticks_ms()
+
+        time.sleep(0.1)
+
+
+class _CountingSelector(selectors.DefaultSelector):
+    """Selector counting how often the event loop wakes up."""
+
+    wakeups = 0
+
+    def select(self, timeout=None):
+        events = super().select(timeout)
+        _CountingSelector.wakeups += 1
+        return events
+
+
+class _Legacy:
+    def __init__(self, app):
+        self.wakeups = [0]
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=legacy_loop, args=(app, self._stop, self.wakeups),
+                                        daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def count(self):
+        return self.wakeups[0]
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class _Tasks:
+    def __init__(self, app):
+        self._app = app
+        self._loop = uasyncio.SelectorEventLoop(_CountingSelector())
+        self._task = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        uasyncio.set_event_loop(self._loop)
+        self._task = self._loop.create_task(self._app.main_tasks())
+        self._loop.call_soon(self._started.set)
+        try:
+            self._loop.run_until_complete(self._task)
+        except uasyncio.CancelledError:
+            pass
+
+    def start(self):
+        self._thread.start()
+        self._started.wait()
+        time.sleep(0.05)  # Let every task reach its first wait
+
+    def count(self):
+        return _CountingSelector.wakeups
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._task.cancel)
+        self._thread.join()
+        self._loop.close()
+
+
+def import_main():
+    """Import main.py quietly, with a touch controller on the bus."""
+    machine.I2C.buses[TOUCH_BUS] = {TOUCH_ADDR: {0xA7: 0xB5}}  # CST816T chip id
+    cwd = os.getcwd()
+    sleep = time.sleep
+    os.chdir(ROOT)  # main.py opens its fonts by relative path
+    time.sleep = lambda seconds: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import main
+    finally:
+        time.sleep = sleep
+        os.chdir(cwd)
+    return main
+
+
+def _touch(x, y):
+    regs = machine.I2C.buses[TOUCH_BUS][TOUCH_ADDR]
+    regs[0x03], regs[0x04] = x >> 8, x & 0xFF
+    regs[0x05], regs[0x06] = y >> 8, y & 0xFF
+
+
+def _latency(frames, trigger):
+    # Time from trigger() until the next end_frame() call
+    seen = len(frames)
+    t0 = time.perf_counter()
+    trigger()
+    deadline = t0 + 1.0
+    while len(frames) == seen and time.perf_counter() < deadline:
+        time.sleep(0.0005)
+    if len(frames) == seen:
+        raise RuntimeError("no frame within 1 s")
+    return (frames[seen] - t0) * 1000
+
+
+def measure(app, runner, frames, events, rng):
+    runner.start()
+    start = runner.count()
+    time.sleep(IDLE_S)
+    idle = (runner.count() - start) / IDLE_S
+
+    commands = []
+    for i in range(events):
+        time.sleep(rng.uniform(0.05, 0.25))
+        line = b"MODE:Weather\n" if i % 2 else b"MODE:Bedroom\n"
+        commands.append(_latency(frames, lambda: app.uart.feed(line)))
+
+    touches = []
+    _touch(120, 225)  # The mode button
+    for _ in range(events):
+        time.sleep(0.5 + rng.uniform(0.02, 0.2))  # Past the 500 ms debounce
+        touches.append(_latency(frames, app.touch.int.pulse))
+    runner.stop()
+    return idle, commands, touches
+
+
+def _stats(values):
+    return f"{min(values):>6.1f} {statistics.median(values):>6.1f} {max(values):>6.1f}"
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    app = import_main()
+
+    frames = []
+    end_frame = app.lcd.end_frame
+
+    def timed_end_frame():
+        end_frame()
+        frames.append(time.perf_counter())
+    app.lcd.end_frame = timed_end_frame
+
+    print(f"{IDLE_S:.0f} s idle, then {events} commands and {events} touches each; "
+          f"latency ms min/median/max")
+    print(f"  {'':<8} {'idle wakeups/s':>14} {'command ms':>20} {'touch ms':>20}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = []
+        for label, runner in (("legacy", _Legacy(app)), ("tasks", _Tasks(app))):
+            app.current_mode = "Bedroom"
+            results.append((label, measure(app, runner, frames, events, random.Random(1))))
+    for label, (idle, commands, touches) in results:
+        print(f"  {label:<8} {idle:>14.1f} {_stats(commands):>20} {_stats(touches):>20}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: startup cost of the list-of-int font modules against packed
+.bfnt fonts.
+
+"Modules" compiles and runs bitmap_fonts*.py from source, as MicroPython
+does when importing a .py file, and keeps the resulting glyph dicts alive.
+"Packed" opens the .bfnt files with font_engine.PackedFont, which reads only
+the header and character index. The last rows draw a clock string with each
+so the cost of the first glyph reads is visible too.
+
+Run make_fonts.py first if the .bfnt files are missing.
+
+Usage:
+    python benchmarks/bench_font_loading.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+import font_engine
+from LCD_1inch28 import LCD_1inch28
+
+MODULES = ['bitmap_fonts.py', 'bitmap_fonts_32.py', 'bitmap_fonts_48.py']
+PACKED = ['font_16x24.bfnt', 'font_24x32.bfnt', 'font_24x48.bfnt']
+REPEAT = 10
+
+
+def load_modules():
+    loaded = []
+    for name in MODULES:
+        path = os.path.join(ROOT, name)
+        with open(path) as f:
+            source = f.read()
+        namespace = {'__name__': name[:-3]}
+        exec(compile(source, path, 'exec'), namespace)
+        loaded.append(namespace)
+    return loaded
+
+
+def load_packed():
+    return [font_engine.PackedFont(os.path.join(ROOT, name)) for name in PACKED]
+
+
+def _measure(label, fn):
+    best = None
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<34} {retained:>10,} {peak:>10,} {best * 1000:>8.2f}")
+    return result
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+
+    print(f"Best of {REPEAT} loads; retained/peak heap from tracemalloc")
+    print(f"  {'':<34} {'retained B':>10} {'peak B':>10} {'ms':>8}")
+    modules = _measure("modules: import all three", load_modules)
+    fonts = _measure("packed: open all three", load_packed)
+
+    def first_draw():
+        for font in load_packed():
+            font.draw_text(lcd, "12:34", 20, 100, 0xFFFF)
+
+    _measure("packed: open + first draw", first_draw)
+    _measure("packed: draw again (cached)",
+             lambda: [font.draw_text(lcd, "12:34", 20, 100, 0xFFFF) for font in fonts])
+    del modules
+
+
+if __name__ == '__main__':
+    main()
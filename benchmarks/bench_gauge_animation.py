@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: CircularGauge.animate_to() frame pacing.
+
+Animates a 0 -> 100% sweep for several segment counts and target frame
+rates, with the simulated SPI bus sleeping for the real transfer time, and
+prints frame_stats() so segment count can be traded against achievable FPS.
+Host Python is slower than the RP2350 for some work and faster for other
+work, so treat the numbers as relative.
+
+Usage:
+    python benchmarks/bench_gauge_animation.py [duration_ms]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from machine import SPI
+from LCD_1inch28 import LCD_1inch28
+from circular_gauge import CircularGauge
+
+SEGMENTS = [8, 12, 20]
+FPS = [30, 60]
+
+
+def main():
+    duration_ms = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28(double_buffer=True)
+    time.sleep = sleep
+    SPI.realtime = True
+
+    print(f"animate_to(100, {duration_ms}) from 0, double-buffered, "
+          f"SPI at {lcd.spi.baudrate / 1e6:.0f} MHz")
+    print(f"  {'':<22} {'frames':>6} {'dropped':>7} {'avg ms':>7} {'max ms':>7} "
+          f"{'max fps':>8}")
+    for aa in (False, True):
+        for segments in SEGMENTS:
+            for fps in FPS:
+                lcd.fill(0)
+                gauge = CircularGauge(lcd, 120, 120, 110, thickness=12, segments=segments,
+                                      antialias=aa)
+                gauge.capture_background()
+                gauge.draw()
+                lcd.show()
+                gauge.animate_to(100, duration_ms, fps)
+                lcd.wait_idle()
+                st = gauge.frame_stats()
+                label = f"{segments} seg{' AA' if aa else ''} @ {fps} fps"
+                print(f"  {label:<22} {st['frames']:>6} {st['dropped']:>7} "
+                      f"{st['avg_ms']:>7.2f} {st['max_ms']:>7.2f} {st['max_fps']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
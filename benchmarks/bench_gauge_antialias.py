@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: anti-aliased CircularGauge against the aliased span path.
+
+For each layout it reports the one-off cost of rasterizing the segments
+(spans only, or spans plus the 4x4-sampled edge coverage table), the size
+of the cached tables, and the per-draw cost of gauge.draw() once cached.
+Anti-aliased draws also blend every edge pixel with the framebuffer through
+a per-colour blend table; building one table is timed separately. Draw times
+include clearing the frame with lcd.fill(0) first.
+
+Usage:
+    python benchmarks/bench_gauge_antialias.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from LCD_1inch28 import LCD_1inch28
+from circular_gauge import CircularGauge, blend_lut, rgb_to_brg565
+
+REPEAT = 10
+
+LAYOUTS = [
+    ("gaugetest 270deg r110 t12 x12", dict(radius=110, thickness=12, segments=12,
+                                           start_angle=135, end_angle=405)),
+    ("jtj clockwise r115 t10 x20", dict(radius=115, thickness=10, segments=20,
+                                        start_angle=215, end_angle=320, clockwise=True)),
+    ("full ring r60 t20 x4", dict(radius=60, thickness=20, segments=4,
+                                  start_angle=0, end_angle=360, gap_degrees=0)),
+]
+
+
+def _table_bytes(gauge):
+    total = sum(len(s) * 2 for s in gauge.segment_spans())
+    for xy, levels in gauge.segment_edges() or ():
+        total += len(xy) * 2 + len(levels)
+    return total
+
+
+def _run(label, gauge, lcd):
+    t0 = time.perf_counter()
+    gauge.segment_spans()
+    build_ms = (time.perf_counter() - t0) * 1000
+    edges = sum(len(levels) for xy, levels in gauge.segment_edges() or ())
+
+    gauge.set_value(100)
+    gauge.draw()  # build the blend tables outside the timing
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        lcd.fill(0)
+        gauge.draw()
+    draw_ms = (time.perf_counter() - t0) / REPEAT * 1000
+    print(f"    {label:<10} {build_ms:>9.1f} {_table_bytes(gauge):>9,} {edges:>7,} "
+          f"{draw_ms:>8.2f}")
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+
+    color = rgb_to_brg565(255, 140, 0)
+    background = rgb_to_brg565(64, 64, 64)
+
+    t0 = time.perf_counter()
+    lut = blend_lut(color)
+    lut_ms = (time.perf_counter() - t0) * 1000
+    print(f"blend_lut(): {len(lut):,} bytes, {lut_ms:.2f} ms per colour")
+
+    # Half coverage of white over black lands mid-way in every channel
+    mid = blend_lut(0xFFFF)
+    assert (mid[8 * 128 + 0], mid[8 * 128 + 32], mid[8 * 128 + 96]) == (16, 32, 16)
+
+    print(f"\ngauge.draw() at 100%, averaged over {REPEAT} draws")
+    print(f"    {'':<10} {'build ms':>9} {'table B':>9} {'edge px':>7} {'draw ms':>8}")
+    for name, kwargs in LAYOUTS:
+        print(f"  {name}")
+        for label, aa in (("aliased", False), ("antialias", True)):
+            gauge = CircularGauge(lcd, 120, 120, color=color, background_color=background,
+                                  antialias=aa, **kwargs)
+            _run(label, gauge, lcd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: CircularGauge arc drawing, per-pixel trig against spans.
+
+"Legacy" replays the original _draw_thick_arc, which stepped every radius
+in 0.5/r radian increments and plotted each sample with lcd.pixel(). The
+current gauge draws hline() spans from arc_spans(). For each gauge layout
+the script reports Python-level draw calls, pixel writes, wall time, and
+how the two pixel sets compare: pixels only legacy sets, pixels only spans
+set, and pixels legacy plotted more than once.
+
+The second table times gauge.update() sweeping through values, rasterizing
+every segment on each draw versus replaying the cached segment spans, and
+the one-off cost of building the cache or loading it from a cache_dir.
+
+Usage:
+    python benchmarks/bench_gauge_arcs.py
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from LCD_1inch28 import LCD_1inch28
+from circular_gauge import CircularGauge
+
+REPEAT = 5
+UPDATES = 50
+
+LAYOUTS = [
+    ("gaugetest 270deg r110 t12 x12", dict(radius=110, thickness=12, segments=12,
+                                           start_angle=135, end_angle=405)),
+    ("jtj clockwise r115 t10 x20", dict(radius=115, thickness=10, segments=20,
+                                        start_angle=215, end_angle=320, clockwise=True)),
+    ("full ring r60 t20 x4", dict(radius=60, thickness=20, segments=4,
+                                  start_angle=0, end_angle=360, gap_degrees=0)),
+]
+
+
+def legacy_draw_thick_arc(gauge, start_deg, end_deg, color):
+    """The original per-pixel _draw_thick_arc, kept here for comparison."""
+    start_rad = math.radians(start_deg)
+    end_rad = math.radians(end_deg)
+    drawing_clockwise = start_deg > end_deg
+    for r in range(gauge.radius - gauge.thickness + 1, gauge.radius + 1):
+        angle_step = 0.5 / r if r > 0 else 0.01
+        angle = start_rad
+        if drawing_clockwise:
+            while angle >= end_rad:
+                x = int(gauge.center_x + r * math.cos(angle))
+                y = int(gauge.center_y - r * math.sin(angle))
+                if 0 <= x < 240 and 0 <= y < 240:
+                    gauge.lcd.pixel(x, y, color)
+                angle -= angle_step
+        else:
+            while angle <= end_rad:
+                x = int(gauge.center_x + r * math.cos(angle))
+                y = int(gauge.center_y - r * math.sin(angle))
+                if 0 <= x < 240 and 0 <= y < 240:
+                    gauge.lcd.pixel(x, y, color)
+                angle += angle_step
+
+
+class _Recorder:
+    """Stand-in display that records draw calls and the pixels they cover."""
+
+    def __init__(self):
+        self.calls = 0
+        self.writes = 0
+        self.hits = {}
+
+    def pixel(self, x, y, c):
+        self.calls += 1
+        self.writes += 1
+        self.hits[(x, y)] = self.hits.get((x, y), 0) + 1
+
+    def hline(self, x, y, w, c):
+        self.calls += 1
+        self.writes += w
+        for i in range(x, x + w):
+            self.hits[(i, y)] = self.hits.get((i, y), 0) + 1
+
+
+def _draw_all(gauge, draw):
+    for start_deg, end_deg in gauge.segment_angles:
+        draw(start_deg, end_deg, 0xFFFF)
+
+
+def _time(gauge, draw):
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        _draw_all(gauge, draw)
+    return (time.perf_counter() - t0) / REPEAT
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+
+    print(f"Full gauge draw (all segments), averaged over {REPEAT} draws")
+    print(f"    {'':<8} {'calls':>7} {'writes':>7} {'pixels':>7} {'overdraw':>8} "
+          f"{'ms':>8}")
+    for name, kwargs in LAYOUTS:
+        gauge = CircularGauge(lcd, 120, 120, **kwargs)
+
+        old, new = _Recorder(), _Recorder()
+        gauge.lcd = old
+        _draw_all(gauge, lambda a, b, c: legacy_draw_thick_arc(gauge, a, b, c))
+        gauge.lcd = new
+        _draw_all(gauge, gauge._draw_thick_arc)
+        gauge.lcd = lcd
+
+        old_ms = _time(gauge, lambda a, b, c: legacy_draw_thick_arc(gauge, a, b, c)) * 1000
+        new_ms = _time(gauge, gauge._draw_thick_arc) * 1000
+
+        print(f"  {name}")
+        for label, rec, ms in (("legacy", old, old_ms), ("spans", new, new_ms)):
+            overdraw = sum(n - 1 for n in rec.hits.values())
+            print(f"    {label:<8} {rec.calls:>7,} {rec.writes:>7,} {len(rec.hits):>7,} "
+                  f"{overdraw:>8,} {ms:>8.2f}")
+        only_old = len(old.hits.keys() - new.hits.keys())
+        only_new = len(new.hits.keys() - old.hits.keys())
+        print(f"    pixels only in legacy: {only_old}, only in spans: {only_new}")
+
+    print(f"\ngauge.update() sweeping {UPDATES} values, per update")
+    print(f"  {'':<32} {'rasterize ms':>12} {'cached ms':>10} {'build ms':>9} "
+          f"{'load ms':>8}")
+    cache_dir = tempfile.mkdtemp()
+    for name, kwargs in LAYOUTS:
+        kwargs = dict(kwargs, background_color=0x4208)
+        gauge = CircularGauge(lcd, 120, 120, **kwargs)
+
+        def rasterize_every_time():
+            # What draw() cost before the spans were cached
+            filled = int((gauge.value / 100.0) * gauge.segments)
+            for i, (a, b) in enumerate(gauge.segment_angles):
+                gauge._draw_thick_arc(a, b, gauge.color if i < filled else gauge.background_color)
+
+        t0 = time.perf_counter()
+        for v in range(UPDATES):
+            gauge.set_value(v * 2)
+            rasterize_every_time()
+        raster_ms = (time.perf_counter() - t0) / UPDATES * 1000
+
+        t0 = time.perf_counter()
+        gauge.segment_spans()
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        for v in range(UPDATES):
+            gauge.update(v * 2)
+        cached_ms = (time.perf_counter() - t0) / UPDATES * 1000
+
+        CircularGauge(lcd, 120, 120, cache_dir=cache_dir, **kwargs).segment_spans()
+        loaded = CircularGauge(lcd, 120, 120, cache_dir=cache_dir, **kwargs)
+        t0 = time.perf_counter()
+        spans = loaded.segment_spans()
+        load_ms = (time.perf_counter() - t0) * 1000
+        assert [list(s) for s in spans] == [list(s) for s in gauge.segment_spans()]
+
+        print(f"  {name:<32} {raster_ms:>12.2f} {cached_ms:>10.2f} {build_ms:>9.2f} "
+              f"{load_ms:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
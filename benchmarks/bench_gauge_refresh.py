@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: bytes sent to the panel per CircularGauge refresh.
+
+Compares the original draw_with_partial_refresh(), which sent the gauge's
+whole bounding square (plus 5px), with the union of per-segment bounding
+boxes: for a full redraw, and for a value change that fills one segment
+(draw_incremental_with_partial_refresh). "then flush" is what a following
+lcd.flush() sends on top: the gauge draws through the LCD's dirty-tracking
+methods, and Windows_show() must take what it sent off the dirty list.
+
+Usage:
+    python benchmarks/bench_gauge_refresh.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from LCD_1inch28 import LCD_1inch28
+from circular_gauge import CircularGauge
+
+LAYOUTS = [
+    ("gaugetest 270deg r110 x12", dict(radius=110, thickness=12, segments=12,
+                                       start_angle=135, end_angle=405)),
+    ("270deg r110 x20", dict(radius=110, thickness=12, segments=20,
+                             start_angle=135, end_angle=405)),
+    ("jtj clockwise r115 x20", dict(radius=115, thickness=10, segments=20,
+                                    start_angle=215, end_angle=320, clockwise=True)),
+]
+
+
+def legacy_partial_refresh(gauge):
+    """The original draw_with_partial_refresh, kept here for comparison."""
+    x_min = max(0, gauge.center_x - gauge.radius - 5)
+    x_max = min(239, gauge.center_x + gauge.radius + 5)
+    y_min = max(0, gauge.center_y - gauge.radius - 5)
+    y_max = min(239, gauge.center_y + gauge.radius + 5)
+    gauge.draw()
+    gauge.lcd.Windows_show(x_min, y_min, x_max, y_max)
+
+
+def _sent(lcd, fn):
+    lcd.flush()  # Start with nothing pending
+    lcd.spi.reset_counters()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    sent = lcd.spi.byte_count
+    lcd.flush()
+    return sent, lcd.spi.byte_count - sent, elapsed
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+
+    print(f"  {'':<34} {'bytes':>9} {'of frame':>8} {'ms':>7} {'then flush':>10}")
+    for name, kwargs in LAYOUTS:
+        gauge = CircularGauge(lcd, 120, 120, background_color=0x4208, **kwargs)
+        gauge.segment_spans()
+        one_step = 100.0 / gauge.segments
+
+        def one_segment():
+            old = gauge.value
+            gauge.set_value(old + one_step)
+            gauge.draw_incremental_with_partial_refresh(old)
+
+        print(f"  {name}")
+        gauge.set_value(50)
+        for label, fn in (("legacy full refresh (square)", lambda: legacy_partial_refresh(gauge)),
+                          ("full refresh (segment union)", gauge.draw_with_partial_refresh),
+                          ("one segment changed", one_segment)):
+            sent, flushed, elapsed = _sent(lcd, fn)
+            print(f"    {label:<32} {sent:>9,} {sent / len(lcd.buffer):>8.1%} "
+                  f"{elapsed * 1000:>7.2f} {flushed:>10,}")
+
+
+if __name__ == '__main__':
+    main()
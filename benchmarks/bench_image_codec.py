@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: run-length encoded .rgb565 files against raw ones.
+
+Each image is converted with convert_image.py, written raw and run-length
+encoded, and read back with the device decoder in image_display.py, both
+into the framebuffer (load_image_file) and streamed to the panel in row
+bands (stream_image_file, with the SPI writes captured). Every decode must
+reproduce the converted pixels exactly, so the script doubles as the
+round-trip check for the encoder and decoder. The synthetic images exercise
+the packet limits: 64/65-pixel runs, runs longer than one 16384-pixel
+packet, and literal stretches longer than 128 pixels.
+
+Raw loads on the host come from the OS page cache and the simulator's
+hline() is pure Python, so the timings flatter raw files. On the RP2350
+the raw read is bound by flash throughput and hline() is native.
+
+Usage:
+    python benchmarks/bench_image_codec.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+from LCD_1inch28 import LCD_1inch28
+from convert_image import convert_image_to_rgb565_brg, write_rgb565_file, IMAGE_RLE
+from image_display import load_image_file, stream_image_file
+
+REPEAT = 5
+BANDS = [1, 7, 16, 240]
+
+
+def _pixels(values):
+    out = bytearray()
+    for v in values:
+        out.append(v & 0xFF)
+        out.append(v >> 8)
+    return out
+
+
+def synthetic_images():
+    rng = random.Random(1)
+    yield "solid", _pixels([0xF7FC] * 57600)
+    yield "noise", _pixels([rng.randrange(0x10000) for _ in range(57600)])
+    # Runs of every length around the short/long packet boundary
+    values = []
+    length = 1
+    while len(values) < 57600:
+        values += [rng.randrange(0x10000)] * length
+        length = length % 70 + 1
+    yield "runs 1-70", _pixels(values[:57600])
+    # One run longer than a packet, then a literal stretch longer than a packet
+    noise = [rng.randrange(0x10000) for _ in range(300)]
+    yield "long run + literals", _pixels([0x0000] * 20000 + noise + [0xFFFF] * 37300)
+
+
+def _time(fn):
+    best = None
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def _streamed(lcd, path, band_rows):
+    sent = []
+    write = lcd.spi.write
+    lcd.spi.write = lambda buf: sent.append(bytes(buf))
+    try:
+        assert stream_image_file(lcd, path, band_rows=band_rows)
+    finally:
+        lcd.spi.write = write
+    # Drop the CASET/RASET/RAMWR writes, keep the pixel data
+    return b''.join(sent[5:])
+
+
+def check(lcd, name, pixels, tmp):
+    raw_path = os.path.join(tmp, 'raw.rgb565')
+    rle_path = os.path.join(tmp, 'rle.rgb565')
+    write_rgb565_file(pixels, raw_path)
+    encoding = write_rgb565_file(pixels, rle_path, rle=True)
+
+    for path in (raw_path, rle_path):
+        lcd.fill(0)
+        assert load_image_file(lcd, path), path
+        assert lcd.buffer == pixels, f"{name}: load_image_file mismatch"
+        for rows in BANDS:
+            assert _streamed(lcd, path, rows) == pixels, f"{name}: stream {rows} rows mismatch"
+
+    raw_ms = _time(lambda: load_image_file(lcd, raw_path))
+    rle_ms = _time(lambda: load_image_file(lcd, rle_path))
+    stream_ms = _time(lambda: stream_image_file(lcd, rle_path))
+    label = "rle" if encoding == IMAGE_RLE else "raw (rle larger)"
+    print(f"  {name:<20} {os.path.getsize(raw_path):>9,} {os.path.getsize(rle_path):>9,} "
+          f"{label:<17} {raw_ms:>8.2f} {rle_ms:>8.2f} {stream_ms:>9.2f}")
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+
+    images = []
+    for name in ('jatj_v2.png', 'joeandthejuice.jpg'):
+        pixels, info = convert_image_to_rgb565_brg(os.path.join(ROOT, name), 'img')
+        images.append((name, pixels))
+    images += list(synthetic_images())
+
+    print(f"Round trip through image_display, best of {REPEAT} loads")
+    print(f"  {'':<20} {'raw B':>9} {'file B':>9} {'encoding':<17} {'raw ms':>8} "
+          f"{'rle ms':>8} {'stream ms':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, pixels in images:
+            check(lcd, name, bytearray(pixels), tmp)
+    print("All decodes matched the converted pixels")
+
+
+if __name__ == '__main__':
+    main()
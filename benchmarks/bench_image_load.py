@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: getting a 240x240 background onto the screen.
+
+"image_data.py" compiles and runs the module from source, as MicroPython
+does when importing a .py file, and keeps its bytes literals alive. Its
+chunks are then copied into the framebuffer byte by byte (the original
+load_image_to_framebuffer loop), with one memoryview slice assignment per
+chunk (the current one), or sent to the panel with stream_image_data(). The
+.rgb565 rows read the same pixels from background1.rgb565: load_image_file()
+reads them into lcd.buffer, stream_image_file() sends them to the panel in
+row bands without touching the framebuffer. Retained/peak heap is measured
+with tracemalloc and excludes the framebuffer itself.
+
+Run `python convert_image.py jatj_v2.png background1.rgb565` first if the
+.rgb565 file is missing.
+
+Usage:
+    python benchmarks/bench_image_load.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+from LCD_1inch28 import LCD_1inch28
+from image_display import (load_image_file, load_image_to_framebuffer, stream_image_data,
+                           stream_image_file)
+
+IMAGE_FILE = os.path.join(ROOT, 'background1.rgb565')
+REPEAT = 10
+
+
+def import_image_data():
+    path = os.path.join(ROOT, 'image_data.py')
+    with open(path) as f:
+        source = f.read()
+    namespace = {'__name__': 'image_data'}
+    exec(compile(source, path, 'exec'), namespace)
+    return namespace
+
+
+def legacy_copy_chunks(lcd, image_data):
+    """The original byte-by-byte chunk copy, kept here for comparison."""
+    offset = 0
+    for chunk in image_data:
+        chunk_len = len(chunk)
+        for i in range(chunk_len):
+            lcd.buffer[offset + i] = chunk[i]
+        offset += chunk_len
+
+
+def _measure(label, fn):
+    best = None
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<36} {retained:>10,} {peak:>10,} {best * 1000:>8.2f}")
+    return result
+
+
+def main():
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+
+    module = import_image_data()
+    chunks = module['background1']
+    assert load_image_file(lcd, IMAGE_FILE)
+    assert bytes(lcd.buffer) == b''.join(chunks)
+    lcd.fill(0)
+    assert load_image_to_framebuffer(lcd, chunks)
+    assert bytes(lcd.buffer) == b''.join(chunks)
+
+    print(f"Best of {REPEAT}; retained/peak heap from tracemalloc")
+    print(f"  {'':<36} {'retained B':>10} {'peak B':>10} {'ms':>8}")
+    _measure("image_data.py: import", import_image_data)
+    _measure("image_data.py: byte loop (legacy)", lambda: legacy_copy_chunks(lcd, chunks))
+    _measure("image_data.py: slice copy to buffer",
+             lambda: load_image_to_framebuffer(lcd, chunks))
+    _measure("image_data.py: stream_image_data", lambda: stream_image_data(lcd, chunks))
+    _measure(".rgb565: load_image_file", lambda: load_image_file(lcd, IMAGE_FILE))
+    for rows in (8, 16, 48):
+        _measure(f".rgb565: stream_image_file {rows} rows",
+                 lambda: stream_image_file(lcd, IMAGE_FILE, band_rows=rows))
+
+    lcd.spi.reset_counters()
+    stream_image_file(lcd, IMAGE_FILE)
+    print(f"\nstream_image_file sent {lcd.spi.byte_count:,} bytes in "
+          f"{lcd.spi.write_count} SPI writes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: partial flush (Windows_show) against full-frame show().
+
+For each window size, reports bytes sent, SPI writes, how many of those
+writes were freshly allocated copies of the framebuffer, and wall time.
+"Legacy" replays the original Windows_show, which copied every row with
+self.buffer[a:b] (and padded the window by 10px).
+
+A final check presents a few double-buffered frames through end_frame()
+to a virtual GC9A01 and verifies the panel ends up showing the
+framebuffer, including dirty windows that overlap by more than the merge
+slack and add up to more than the screen.
+
+Usage:
+    python benchmarks/bench_partial_flush.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from machine import SPI
+from simulator.gc9a01 import GC9A01
+from LCD_1inch28 import LCD_1inch28
+
+REPEAT = 50
+
+WINDOWS = [
+    ("clock digits 96x24", (72, 100, 167, 123)),
+    ("gauge square 230x230", (5, 5, 234, 234)),
+    ("full-width band 240x30", (0, 210, 239, 239)),
+    ("full screen 240x240", (0, 0, 239, 239)),
+]
+
+# (label, fill_rect calls) for the end_frame() check
+FRAMES = [
+    ("one window", [(72, 100, 96, 24)]),
+    ("two apart", [(0, 0, 60, 20), (180, 220, 60, 20)]),
+    ("overlapping bands", [(0, 0, 240, 112), (0, 0, 112, 240),
+                           (0, 128, 240, 112), (128, 0, 112, 240)]),
+]
+
+
+def legacy_windows_show(lcd, Xstart, Ystart, Xend, Yend):
+    """The original Windows_show, kept here for comparison."""
+    if Xstart > Xend:
+        Xstart, Xend = Xend, Xstart
+    if Ystart > Yend:
+        Ystart, Yend = Yend, Ystart
+    if Xstart <= 10:
+        Xstart = 10
+    if Ystart <= 10:
+        Ystart = 10
+    Xstart -= 10
+    Xend += 10
+    Ystart -= 10
+    Yend += 10
+    lcd.setWindows(Xstart, Ystart, Xend, Yend)
+    lcd.cs(1)
+    lcd.dc(1)
+    lcd.cs(0)
+    for i in range(Ystart, Yend - 1):
+        Addr = (Xstart * 2) + (i * 240 * 2)
+        lcd.spi.write(lcd.buffer[Addr:Addr + ((Xend - Xstart) * 2)])
+    lcd.cs(1)
+
+
+class _SpiProbe:
+    """Wraps the simulated SPI write to classify what the driver passes in."""
+
+    def __init__(self, lcd):
+        self.lcd = lcd
+        self.spi_write = lcd.spi.write
+        self.copies = 0
+        self.copied_bytes = 0
+        lcd.spi.write = self.write
+
+    def write(self, buf):
+        if len(buf) > 4 and not isinstance(buf, memoryview) and buf is not self.lcd.buffer:
+            self.copies += 1
+            self.copied_bytes += len(buf)
+        self.spi_write(buf)
+
+    def reset(self):
+        self.lcd.spi.reset_counters()
+        self.copies = 0
+        self.copied_bytes = 0
+
+
+def _run(label, probe, fn):
+    probe.reset()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    elapsed = (time.perf_counter() - t0) / REPEAT
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    spi = probe.lcd.spi
+    print(f"    {label:<14} {spi.byte_count // REPEAT:>9,} {spi.write_count // REPEAT:>7} "
+          f"{probe.copies // REPEAT:>7} {probe.copied_bytes // REPEAT:>9,} "
+          f"{peak:>9,} {elapsed * 1e6:>9.1f}")
+
+
+def main():
+    # Skip the panel reset delays
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28()
+    time.sleep = sleep
+    probe = _SpiProbe(lcd)
+
+    print(f"Per call, averaged over {REPEAT} calls")
+    print(f"    {'':<14} {'bytes':>9} {'writes':>7} {'copies':>7} "
+          f"{'copied B':>9} {'peak B':>9} {'us':>9}")
+    for name, (x0, y0, x1, y1) in WINDOWS:
+        print(f"  {name}")
+        _run("show()", probe, lcd.show)
+        _run("legacy", probe, lambda: legacy_windows_show(lcd, x0, y0, x1, y1))
+        _run("Windows_show", probe, lambda: lcd.Windows_show(x0, y0, x1, y1))
+
+    check_end_frame()
+
+
+def check_end_frame():
+    """Present FRAMES double-buffered and compare the panel with lcd.buffer."""
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28(double_buffer=True)
+    time.sleep = sleep
+    panel = GC9A01(simulator.PANEL_DC, simulator.PANEL_CS)
+    SPI.devices[simulator.PANEL_SPI] = panel
+    try:
+        lcd.show()
+        print("\nDouble-buffered end_frame(), panel checked against the framebuffer")
+        print(f"    {'':<18} {'dirty':>6} {'area px':>8} {'windows':>8} {'pixel B':>8}")
+        for i, (name, rects) in enumerate(FRAMES):
+            lcd.begin_frame()
+            for x, y, w, h in rects:
+                lcd.fill_rect(x, y, w, h, 0x1234 * (i + 1) & 0xFFFF)
+            dirty = lcd.dirty_regions()
+            panel.reset_counters()
+            lcd.end_frame()
+            lcd.wait_idle()
+            assert panel.gram.tobytes() == bytes(lcd.buffer), f"{name}: panel differs"
+            area = sum(w * h for _, _, w, h in dirty)
+            print(f"    {name:<18} {len(dirty):>6} {area:>8,} {panel.windows:>8} "
+                  f"{panel.pixel_bytes:>8,}")
+    finally:
+        del SPI.devices[simulator.PANEL_SPI]
+
+
+if __name__ == '__main__':
+    main()
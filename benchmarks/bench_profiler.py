@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: cost of the profiler.py hooks and a sample STATS report.
+
+Disabled, profiler.timed() hands back the undecorated function, so the
+hooks cost nothing; the first rows check that and time a bare call against
+a timed one to show the per-call overhead when profiling is on. main.py is
+then imported with the profiler enabled, a short Home Assistant command
+sequence and a few touches are replayed through process_command() and
+handle_touch(), and the STATS reply written to the UART is printed.
+
+Timer samples are host microseconds; on the RP2350 expect the calls
+themselves to be slower and the profiler overhead (two ticks_us() calls and
+four array stores per sample) to be a few microseconds.
+
+Usage:
+    python benchmarks/bench_profiler.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+import profiler
+
+REPEAT = 100_000
+
+COMMANDS = [
+    b"SETTIME:2025,6,2,14,37,5,0,153\n",
+    b"WEATHER:Partly cloudy,18.5\xc2\xb0C,64%\n",
+    b"BEDROOM:21.3\xc2\xb0C,48%\n",
+    b"MODE:Weather\n",
+    b"MODE:Bedroom\n",
+    b"MODE:Clock\n",
+    b"BRIGHT:40\n",
+    b"MSG:Doorbell\n",
+    b"MODE:Clock\n",
+]
+
+
+def _noop(a, b):
+    return a
+
+
+def _per_call_ns(fn):
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(1, 2)
+    return (time.perf_counter() - t0) * 1e9 / REPEAT
+
+
+def import_main():
+    """Import main.py quietly, without the 2 s welcome pause."""
+    cwd = os.getcwd()
+    sleep = time.sleep
+    os.chdir(ROOT)  # main.py opens its fonts by relative path
+    time.sleep = lambda seconds: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import main
+    finally:
+        time.sleep = sleep
+        os.chdir(cwd)
+    return main
+
+
+def main():
+    assert not profiler.ENABLED
+    assert profiler.timed('noop')(_noop) is _noop
+    bare_ns = _per_call_ns(_noop)
+
+    profiler.ENABLED = True  # As if profile.flag were on the device at boot
+    app = import_main()
+    profiler.reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for line in COMMANDS:
+            app.process_command(line)
+            app.lcd.wait_idle()
+        for i in range(3):
+            app.touch.X_point, app.touch.Y_point = 120, 225
+            app.touch.Flag = 1
+            app.last_touch_time = time.ticks_ms() - 1000 if i != 1 else time.ticks_ms()
+            app.handle_touch()
+            app.lcd.wait_idle()
+
+        app.uart.tx = bytearray()
+        app.process_command(b"STATS\n")
+    reply = bytes(app.uart.tx).decode().splitlines()
+    assert reply[-1] == "STATS:END"
+
+    # Registered after the STATS reply so it does not show up in it
+    timed_ns = _per_call_ns(profiler.timed('bench.noop')(_noop))
+    print(f"Per call, {REPEAT:,} calls")
+    print(f"  disabled (function unchanged) {bare_ns:>8.0f} ns")
+    print(f"  enabled                       {timed_ns:>8.0f} ns "
+          f"(+{timed_ns - bare_ns:.0f} ns)")
+
+    print(f"\nSTATS reply after {len(COMMANDS)} commands and 3 touches (one debounced)")
+    print(f"  {'':<20} {'calls':>6} {'min us':>8} {'avg us':>8} {'max us':>8}")
+    for line in reply[:-1]:
+        fields = line[len("STATS:"):].split(',')
+        if len(fields) == 5:
+            name, calls, lo, avg, hi = fields
+            print(f"  {name:<20} {calls:>6} {lo:>8} {avg:>8} {hi:>8}")
+        else:
+            print(f"  {fields[0]:<20} {fields[1]:>6}")
+
+
+if __name__ == '__main__':
+    main()
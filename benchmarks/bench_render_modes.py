@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: frame cost of each main.py display mode.
+
+main.py is imported under the simulator (its main loop only runs as a
+script) with fixed weather/bedroom data and a fixed clock, and every mode
+is rendered through update_display_for_mode() as the device does on a
+MODE: command: "Clock", "Weather", "Bedroom", and "Cycle" once per sub-mode.
+"Clock refresh" is the once-a-minute partial redraw (refresh_clock) and
+"Gauge" a full CircularGauge frame, so the gauge code is covered too.
+For each frame:
+
+  ms        wall time from begin_frame() until the double-buffered
+            transfer has finished, best of REPEAT after one warm-up frame
+            (the warm-up reads the font glyphs from the .bfnt files)
+  fb calls  calls into framebuf.FrameBuffer primitives (fill_rect, hline,
+            text, blit, ...), i.e. Python-to-native calls on the device
+  pixel     of those, pixel() calls, the most expensive per pixel drawn
+  spi B     bytes written to the SPI bus, commands included
+  spi tx    SPI write() calls (transactions)
+  peak B    peak traced heap during the frame (tracemalloc), which also
+            counts the simulator's NumPy temporaries, so compare it with
+            the baseline rather than reading it as device heap
+
+Results are compared with benchmarks/render_baseline.json. The counts are
+deterministic and any change is reported, as is peak heap growing by more
+than HEAP_TOLERANCE; either makes the script exit with status 1. Frames
+more than TIME_TOLERANCE slower are listed as a warning only, since host
+timings depend on the machine and its load. After an intended change, or
+on a new machine, run with --update to rewrite the baseline and commit it
+with the change.
+
+Usage:
+    python benchmarks/bench_render_modes.py [--update]
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import simulator
+simulator.install()
+
+from simulator import framebuf
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'render_baseline.json')
+REPEAT = 20
+TIME_TOLERANCE = 1.5    # ms may grow by 50% (sub-millisecond host timings are noisy)
+HEAP_TOLERANCE = 1.10   # peak heap may grow by 10%
+COUNTS = ('fb_calls', 'pixel', 'spi_bytes', 'spi_tx')
+
+# Monday 2 June 2025, 14:37:05
+LOCALTIME = (2025, 6, 2, 14, 37, 5, 0, 153)
+
+PRIMITIVES = ('pixel', 'fill', 'fill_rect', 'hline', 'vline', 'rect', 'line',
+              'ellipse', 'poly', 'text', 'blit', 'scroll')
+
+
+class _CallCounter:
+    """Counts calls to the FrameBuffer primitives while installed."""
+
+    def __init__(self):
+        self.calls = dict.fromkeys(PRIMITIVES, 0)
+        self._saved = {}
+        self._depth = [0]
+
+    def install(self):
+        for name in PRIMITIVES:
+            method = getattr(framebuf.FrameBuffer, name)
+            self._saved[name] = method
+            setattr(framebuf.FrameBuffer, name, self._wrap(name, method))
+
+    def uninstall(self):
+        for name, method in self._saved.items():
+            setattr(framebuf.FrameBuffer, name, method)
+
+    def reset(self):
+        for name in self.calls:
+            self.calls[name] = 0
+
+    def _wrap(self, name, method):
+        calls = self.calls
+        depth = self._depth
+
+        def counted(*args, **kwargs):
+            # The simulator implements some primitives with others (hline
+            # with fill_rect, ...); only the outermost call is a native call
+            if not depth[0]:
+                calls[name] += 1
+            depth[0] += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+        return counted
+
+
+def import_main():
+    """Import main.py quietly, without the 2 s welcome pause."""
+    cwd = os.getcwd()
+    sleep = time.sleep
+    os.chdir(ROOT)  # main.py opens its fonts by relative path
+    time.sleep = lambda seconds: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import main
+    finally:
+        time.sleep = sleep
+        os.chdir(cwd)
+    main.weather_condition = "Partly cloudy"
+    main.weather_temp = "18.5°C"
+    main.weather_humidity = "64%"
+    main.bedroom_temp = "21.3°C"
+    main.bedroom_humidity = "48%"
+    return main
+
+
+def frames(main):
+    """(label, draw function) for every frame measured."""
+    from circular_gauge import CircularGauge
+
+    def mode(name, sub_mode=None):
+        def draw():
+            if sub_mode is not None:
+                main.current_custom_index = main.custom_sub_modes.index(sub_mode)
+            main.update_display_for_mode(name)
+        return draw
+
+    gauge = CircularGauge(main.lcd, 120, 120, 110, thickness=12, segments=12,
+                          color=main.lcd.green, background_color=0x4208)
+
+    def gauge_frame():
+        main.lcd.begin_frame()
+        main.lcd.fill(main.lcd.black)
+        gauge.update(75)
+        main.lcd.text("75%", 108, 116, main.lcd.white)
+        main.lcd.end_frame()
+
+    return [
+        ("Clock", mode("Clock")),
+        ("Clock refresh", main.refresh_clock),
+        ("Weather", mode("Weather")),
+        ("Bedroom", mode("Bedroom")),
+        ("Cycle: Clock", mode("Cycle", "Clock")),
+        ("Cycle: Weather", mode("Cycle", "Weather")),
+        ("Cycle: Bedroom", mode("Cycle", "Bedroom")),
+        ("Gauge", gauge_frame),
+    ]
+
+
+def measure(lcd, counter, draw):
+    def frame():
+        draw()
+        lcd.wait_idle()
+
+    frame()  # warm-up: glyph reads, gauge rasterization
+    best = None
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        frame()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+
+    counter.reset()
+    lcd.spi.reset_counters()
+    counter.install()
+    try:
+        frame()
+    finally:
+        counter.uninstall()
+    result = {
+        'ms': round(best * 1000, 3),
+        'fb_calls': sum(counter.calls.values()),
+        'pixel': counter.calls['pixel'],
+        'spi_bytes': lcd.spi.byte_count,
+        'spi_tx': lcd.spi.write_count,
+    }
+
+    tracemalloc.start()
+    frame()
+    result['peak_heap'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def compare(label, result, base):
+    """
+    Check one frame against its baseline entry.
+
+    Returns:
+        (regressions, slower): messages for changed counts or heap growth,
+        and for wall time over the tolerance
+    """
+    if base is None:
+        return [f"{label}: not in baseline"], []
+    problems = []
+    for key in COUNTS:
+        if result[key] != base[key]:
+            problems.append(f"{label}: {key} {base[key]:,} -> {result[key]:,}")
+    if result['peak_heap'] > base['peak_heap'] * HEAP_TOLERANCE:
+        problems.append(f"{label}: peak_heap {base['peak_heap']:,} -> "
+                        f"{result['peak_heap']:,}")
+    slower = []
+    if result['ms'] > base['ms'] * TIME_TOLERANCE:
+        slower.append(f"{label}: ms {base['ms']:.2f} -> {result['ms']:.2f}")
+    return problems, slower
+
+
+def main():
+    update = '--update' in sys.argv[1:]
+
+    localtime = time.localtime
+    time.localtime = lambda *args: LOCALTIME
+    try:
+        app = import_main()
+        lcd = app.lcd
+        counter = _CallCounter()
+        results = {}
+        for label, draw in frames(app):
+            results[label] = measure(lcd, counter, draw)
+    finally:
+        time.localtime = localtime
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f).get('frames', {})
+
+    print(f"main.py frames, best of {REPEAT}; peak heap from tracemalloc")
+    print(f"  {'':<16} {'ms':>7} {'base ms':>8} {'fb calls':>9} {'pixel':>7} "
+          f"{'spi B':>9} {'spi tx':>7} {'peak B':>9}")
+    problems = []
+    slower = []
+    for label, r in results.items():
+        base = baseline.get(label)
+        base_ms = f"{base['ms']:>8.2f}" if base else f"{'-':>8}"
+        print(f"  {label:<16} {r['ms']:>7.2f} {base_ms} {r['fb_calls']:>9,} "
+              f"{r['pixel']:>7,} {r['spi_bytes']:>9,} {r['spi_tx']:>7,} "
+              f"{r['peak_heap']:>9,}")
+        changed, slow = compare(label, r, base)
+        problems += changed
+        slower += slow
+
+    if update:
+        with open(BASELINE, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'repeat': REPEAT,
+                       'frames': results}, f, indent=2)
+            f.write('\n')
+        print(f"\nBaseline written to {os.path.relpath(BASELINE)}")
+        return
+    if not baseline:
+        print("\nNo baseline yet, run with --update to record one")
+        return
+    if slower:
+        print("\nSlower than the baseline (check on an idle machine):")
+        for line in slower:
+            print(f"  {line}")
+    if problems:
+        print("\nChanged since the baseline:")
+        for line in problems:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nNo regressions against the baseline")
+
+
+if __name__ == '__main__':
+    main()
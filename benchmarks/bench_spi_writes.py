@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: SPI transactions and allocations for LCD_1inch28 register writes.
+
+Compares the batched driver (write_cmd_data + _INIT_SEQUENCE table) against
+the original one-transaction-per-byte protocol, replayed by LegacyLCD below.
+
+Usage:
+    python benchmarks/bench_spi_writes.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+import LCD_1inch28 as driver
+
+
+class _CountingBytearray(bytearray):
+    """bytearray that counts constructions made from inside the driver."""
+    created = 0
+
+    def __init__(self, *args):
+        _CountingBytearray.created += 1
+        super().__init__(*args)
+
+
+class LegacyLCD(driver.LCD_1inch28):
+    """The original per-byte register protocol, for comparison."""
+
+    def write_cmd(self, cmd):
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(bytearray([cmd]))
+        self.cs(1)
+
+    def write_data(self, buf):
+        self.cs(1)
+        self.dc(1)
+        self.cs(0)
+        self.spi.write(bytearray([buf]))
+        self.cs(1)
+
+    def init_display(self):
+        self.rst(1)
+        time.sleep(0.01)
+        self.rst(0)
+        time.sleep(0.01)
+        self.rst(1)
+        time.sleep(0.05)
+
+        seq = driver._INIT_SEQUENCE
+        i = 0
+        while i < len(seq):
+            count = seq[i + 1]
+            self.write_cmd(seq[i])
+            for b in seq[i + 2:i + 2 + count]:
+                self.write_data(b)
+            i += 2 + count
+
+    def setWindows(self, Xstart, Ystart, Xend, Yend):
+        self.write_cmd(0x2A)
+        self.write_data(0x00)
+        self.write_data(Xstart)
+        self.write_data(0x00)
+        self.write_data(Xend - 1)
+        self.write_cmd(0x2B)
+        self.write_data(0x00)
+        self.write_data(Ystart)
+        self.write_data(0x00)
+        self.write_data(Yend - 1)
+        self.write_cmd(0x2C)
+
+
+def _no_sleep(seconds):
+    pass
+
+
+def _measure(label, fn):
+    # Count bytearray() calls made by the driver and by LegacyLCD, and skip
+    # the reset delays so only protocol overhead is timed.
+    driver.bytearray = _CountingBytearray
+    globals()['bytearray'] = _CountingBytearray
+    _CountingBytearray.created = 0
+    sleep = time.sleep
+    time.sleep = _no_sleep
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        lcd, spi_writes, cs_asserts = fn()
+    finally:
+        elapsed = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        time.sleep = sleep
+        del driver.bytearray
+        del globals()['bytearray']
+    print(f"  {label:<28} {cs_asserts:>7} {spi_writes:>7} "
+          f"{_CountingBytearray.created:>7} {peak:>9,} {elapsed * 1000:>8.2f}")
+    return lcd
+
+
+def _boot(cls):
+    def run():
+        lcd = cls()
+        return lcd, lcd.spi.write_count, lcd.cs.falls
+    return run
+
+
+def _windows(lcd, count=240):
+    def run():
+        lcd.spi.reset_counters()
+        falls = lcd.cs.falls
+        for y in range(count):
+            lcd.setWindows(0, y, 240, y + 1)
+        return lcd, lcd.spi.write_count, lcd.cs.falls - falls
+    return run
+
+
+def main():
+    header = (f"  {'':<28} {'CS':>7} {'writes':>7} {'allocs':>7} "
+              f"{'peak B':>9} {'ms':>8}")
+
+    print("Boot (reset + init sequence + first full frame)")
+    print(header)
+    legacy = _measure("legacy per-byte", _boot(LegacyLCD))
+    batched = _measure("batched write_cmd_data", _boot(driver.LCD_1inch28))
+
+    print("\n240 x setWindows (one per show()/partial flush)")
+    print(header)
+    _measure("legacy per-byte", _windows(legacy))
+    _measure("batched write_cmd_data", _windows(batched))
+
+
+if __name__ == '__main__':
+    main()
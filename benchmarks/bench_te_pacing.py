@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: frame pacing of TE-synchronised presents.
+
+A background thread pulses a simulated TE pin at the panel refresh rate and
+the SPI bus sleeps for the real transfer time, so te_stats() shows how many
+refreshes each kind of update can keep up with before frames are dropped.
+
+Usage:
+    python benchmarks/bench_te_pacing.py [refresh_hz]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import simulator
+simulator.install()
+
+from machine import SPI
+from LCD_1inch28 import LCD_1inch28
+
+FRAMES = 60
+TE_PIN = 18
+
+
+def _te_source(pin, hz, stop):
+    period = 1.0 / hz
+    next_edge = time.perf_counter()
+    while not stop.is_set():
+        next_edge += period
+        delay = next_edge - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        pin.pulse()
+
+
+def _run(label, lcd, present):
+    lcd.te_reset_stats()
+    t0 = time.perf_counter()
+    for i in range(FRAMES):
+        lcd.fill_rect(60, 60 + (i % 20), 120, 20, 0xFFFF if i & 1 else 0x0000)
+        present()
+    lcd.wait_idle()
+    elapsed = time.perf_counter() - t0
+    st = lcd.te_stats()
+    print(f"  {label:<30} {FRAMES / elapsed:>7.1f} {st['missed']:>7} {st['late']:>6} "
+          f"{st['timeouts']:>9} {st['max_fps']:>8.1f}")
+
+
+def main():
+    hz = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    lcd = LCD_1inch28(double_buffer=True, te_pin=TE_PIN)
+    time.sleep = sleep
+
+    SPI.realtime = True
+    stop = threading.Event()
+    source = threading.Thread(target=_te_source, args=(lcd.te, hz, stop), daemon=True)
+    source.start()
+
+    print(f"{FRAMES} presents, TE at {hz:.0f} Hz, SPI at {lcd.spi.baudrate / 1e6:.0f} MHz")
+    print(f"  {'':<30} {'fps':>7} {'missed':>7} {'late':>6} {'timeouts':>9} {'max fps':>8}")
+    _run("show() full frame", lcd, lcd.show)
+    _run("flush() 120x39 region", lcd, lcd.flush)
+    _run("end_frame() 120x39 (async)", lcd, lcd.end_frame)
+
+    stop.set()
+    source.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 # Bitmap Font Handler for LCD_1inch28
 # This module provides custom bitmap fonts for better-looking large text displays
 
+from font_engine import BitmapFont
+
 # Large digit font (16x24 pixels per character)
 # Format: Each digit is represented as a list of 24 rows, each row is 16 bits (2 bytes)
 # 1 = pixel on, 0 = pixel off
@@ -294,26 +296,16 @@ LARGE_DIGITS = {
     ],
 }
 
+# Glyphs are converted to MONO_HLSB and blitted by the shared font engine
+FONT = BitmapFont(LARGE_DIGITS, 16, 24)
+
 def draw_char(lcd, char, x, y, color):
     """Draw a single character using bitmap font"""
-    if char not in LARGE_DIGITS:
-        return 16  # Return character width even if not found
-
-    bitmap = LARGE_DIGITS[char]
-    for row_idx, row_data in enumerate(bitmap):
-        for col in range(16):
-            if row_data & (1 << (15 - col)):
-                lcd.pixel(x + col, y + row_idx, color)
-
-    return 16  # Return character width for spacing
+    return FONT.draw_char(lcd, char, x, y, color)  # Return character width for spacing
 
 def draw_text(lcd, text, x, y, color, spacing=2):
     """Draw text using bitmap font"""
-    current_x = x
-    for char in text:
-        char_width = draw_char(lcd, char, current_x, y, color)
-        current_x += char_width + spacing
-    return current_x - x  # Return total width
+    return FONT.draw_text(lcd, text, x, y, color, spacing)  # Return total width
 
 def get_text_width(text, spacing=2):
     """Calculate the width of text in pixels"""
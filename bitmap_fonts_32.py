@@ -3,6 +3,8 @@
 # Format: Each digit is represented as a list of 32 rows, each row is 24 bits (3 bytes)
 # 1 = pixel on, 0 = pixel off
 
+from font_engine import BitmapFont
+
 LARGE_DIGITS_32 = {
     '0': [
         0b000000111111111111000000,
@@ -380,26 +382,16 @@ LARGE_DIGITS_32 = {
     ],
 }
 
+# Glyphs are converted to MONO_HLSB and blitted by the shared font engine
+FONT_32 = BitmapFont(LARGE_DIGITS_32, 24, 32)
+
 def draw_char_32(lcd, char, x, y, color):
     """Draw a single character using 24x32 bitmap font"""
-    if char not in LARGE_DIGITS_32:
-        return 24  # Return character width even if not found
-
-    bitmap = LARGE_DIGITS_32[char]
-    for row_idx, row_data in enumerate(bitmap):
-        for col in range(24):
-            if row_data & (1 << (23 - col)):
-                lcd.pixel(x + col, y + row_idx, color)
-
-    return 24  # Return character width for spacing
+    return FONT_32.draw_char(lcd, char, x, y, color)  # Return character width for spacing
 
 def draw_text_32(lcd, text, x, y, color, spacing=2):
     """Draw text using 24x32 bitmap font"""
-    current_x = x
-    for char in text:
-        char_width = draw_char_32(lcd, char, current_x, y, color)
-        current_x += char_width + spacing
-    return current_x - x  # Return total width
+    return FONT_32.draw_text(lcd, text, x, y, color, spacing)  # Return total width
 
 def get_text_width_32(text, spacing=2):
     """Calculate the width of text in pixels for 24x32 font"""
@@ -2,6 +2,8 @@
 # Auto-generated from 1to0 greyscale bitmap, with per-digit horizontal centering
 # and removal of stray columns mistakenly shared between adjacent glyphs.
 
+from font_engine import BitmapFont
+
 # Large digit font (24x48 pixels per character)
 # Format: Each digit is represented as a list of 48 rows, each row is 24 bits
 # 1 = pixel on, 0 = pixel off
@@ -510,27 +512,18 @@ LARGE_DIGITS_48 = {
 }
 
 
-def draw_char_48(lcd, char, x, y, color):
-    """Draw a single 24x48 character using bitmap font"""
-    if char not in LARGE_DIGITS_48:
-        return 24  # character width
+# Glyphs are converted to MONO_HLSB and blitted by the shared font engine
+FONT_48 = BitmapFont(LARGE_DIGITS_48, 24, 48)
 
-    bitmap = LARGE_DIGITS_48[char]
-    for row_idx, row_data in enumerate(bitmap):
-        for col in range(24):
-            if row_data & (1 << (23 - col)):
-                lcd.pixel(x + col, y + row_idx, color)
 
-    return 24
+def draw_char_48(lcd, char, x, y, color):
+    """Draw a single 24x48 character using bitmap font"""
+    return FONT_48.draw_char(lcd, char, x, y, color)
 
 
 def draw_text_48(lcd, text, x, y, color, spacing=4):
     """Draw text using 24x48 bitmap font"""
-    current_x = x
-    for char in text:
-        char_width = draw_char_48(lcd, char, current_x, y, color)
-        current_x += char_width + spacing
-    return current_x - x
+    return FONT_48.draw_text(lcd, text, x, y, color, spacing)
 
 
 def get_text_width_48(text, spacing=4):
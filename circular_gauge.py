@@ -3,6 +3,73 @@
 # Supports configurable segments, angles, thickness, gaps, and colors
 
 import math
+import time
+from array import array
+import profiler
+
+# Fixed-point scale of the sine table (1.0 = 1 << 14)
+_DIR_SHIFT = 14
+
+# Angles are handled in quarter degrees
+_QUARTERS = 1440
+
+# Span cache file: magic, version, segment count, antialias flag; then per
+# segment a uint16 span count and edge pixel count; then each segment's
+# (y, x, width) spans and (x, y) edge pixels as int16; then all edge
+# coverage levels, one byte each
+_SPAN_MAGIC = b'GSPN'
+_SPAN_VERSION = 3
+
+# Anti-aliasing: coverage is sampled on a 4x4 grid per pixel, so edge pixels
+# have levels 1-15 (16 = fully covered, drawn as part of a span)
+_AA_GRID = 4
+_AA_LEVELS = _AA_GRID * _AA_GRID
+
+
+def _build_sin_table():
+    """
+    sin() of every quarter degree in 1 << 14 fixed point.
+
+    Computed with integer Taylor series rather than math.sin, whose
+    single-precision result on the RP2350 rounds differently from CPython
+    for some entries, so the host and the device get identical tables.
+    """
+    # pi in 1 << 60 fixed point
+    pi = 0xC90FDAA22168C235 >> 2
+    one = 1 << 60
+    quarter = array('h', bytearray(2 * 361))
+    for k in range(361):
+        x = k * pi // 720
+        x2 = x * x >> 60
+        term = x
+        total = 0
+        n = 1
+        while term:
+            total += term
+            term = -(term * x2 >> 60) // ((n + 1) * (n + 2))
+            n += 2
+        quarter[k] = (total * (1 << _DIR_SHIFT) + one // 2) >> 60
+
+    table = array('h', bytearray(2 * _QUARTERS))
+    for k in range(_QUARTERS):
+        q = k % 720
+        v = quarter[q] if q <= 360 else quarter[720 - q]
+        table[k] = v if k < 720 else -v
+    return table
+
+
+# Shared by every gauge: _SIN[q] = sin(q / 4 degrees) * (1 << 14)
+_SIN = _build_sin_table()
+
+
+def _quarter(deg):
+    """Angle in degrees -> nearest whole quarter degree."""
+    return int(round(deg * 4))
+
+
+def _direction(q):
+    """Fixed-point unit vector for an angle in quarter degrees (y up)."""
+    return _SIN[(q + 360) % _QUARTERS], _SIN[q % _QUARTERS]
 
 
 class CircularGauge:
@@ -66,7 +133,7 @@ class CircularGauge:
     def __init__(self, lcd, center_x, center_y, radius, thickness=10,
                  segments=12, start_angle=135, end_angle=405,
                  gap_degrees=2, color=0xFFFF, background_color=None,
-                 clockwise=False):
+                 clockwise=False, cache_dir=None, antialias=False):
         """
         Initialize circular gauge.
 
@@ -85,6 +152,12 @@ class CircularGauge:
             color: RGB565 color for filled segments (default white)
             background_color: RGB565 color for unfilled segments (None=don't draw)
             clockwise: If True, draw clockwise from start to end angle (default False)
+            cache_dir: Directory to save rasterized segments in, so later runs
+                      with the same geometry load them instead (None=RAM only)
+            antialias: If True, blend partly covered edge pixels with what is
+                      already in the framebuffer (default False). Redraw the
+                      background under the gauge before redrawing the gauge,
+                      or edges blend over their previous colour.
         """
         self.lcd = lcd
         self.center_x = center_x
@@ -98,11 +171,31 @@ class CircularGauge:
         self.color = color
         self.background_color = background_color
         self.clockwise = clockwise
+        self.cache_dir = cache_dir
+        self.antialias = antialias
         self.value = 0
 
         # Pre-calculate segment angles for performance
         self.segment_angles = self._calculate_segment_angles()
 
+        # Screen rectangle (x0, y0, x1, y1 inclusive) of each segment, used
+        # to flush only what changed
+        self.segment_bounds = [arc_bounds(center_x, center_y, radius, thickness,
+                                          start_deg, end_deg)
+                               for start_deg, end_deg in self.segment_angles]
+
+        # Per-segment spans and anti-aliased edges, rasterized (or loaded) on
+        # first draw, and blend tables per colour
+        self._spans = None
+        self._edges = None
+        self._blend_luts = {}
+
+        # Framebuffer pixels under each segment (see capture_background)
+        self._background = None
+
+        # animate_to() frame timing (see frame_stats)
+        self.reset_frame_stats()
+
     def _calculate_segment_angles(self):
         """
         Calculate start/end angles for each segment with gaps.
@@ -123,20 +216,18 @@ class CircularGauge:
             if total_arc <= 0:
                 total_arc += 360
 
-        total_gaps = self.gap_degrees * self.segments
-        usable_arc = total_arc - total_gaps
-        segment_arc = usable_arc / self.segments
+        # Work in whole quarter degrees so every segment edge lands on an
+        # entry of the shared sine table
+        start = _quarter(self.start_angle)
+        gap = _quarter(self.gap_degrees)
+        usable_arc = _quarter(total_arc) - gap * self.segments
+        direction = -1 if self.clockwise else 1
 
         segments = []
-        current = self.start_angle
-
         for i in range(self.segments):
-            if self.clockwise:
-                segments.append((current, current - segment_arc))
-                current -= segment_arc + self.gap_degrees
-            else:
-                segments.append((current, current + segment_arc))
-                current += segment_arc + self.gap_degrees
+            a = start + direction * (i * usable_arc // self.segments + i * gap)
+            b = start + direction * ((i + 1) * usable_arc // self.segments + i * gap)
+            segments.append((a / 4, b / 4))
 
         return segments
 
@@ -149,73 +240,251 @@ class CircularGauge:
         """
         self.value = max(0, min(100, percentage))
 
+    @profiler.timed('gauge.draw')
     def draw(self):
         """
         Draw the gauge to the LCD buffer.
         Call lcd.show() or lcd.Windows_show() afterward to display.
         """
-        filled_count = int((self.value / 100.0) * self.segments)
+        filled_count = self._filled_count(self.value)
 
-        for i, (start_deg, end_deg) in enumerate(self.segment_angles):
+        for i in range(self.segments):
             if i < filled_count:
                 # Draw filled segment
-                self._draw_thick_arc(start_deg, end_deg, self.color)
-            elif self.background_color is not None:
-                # Draw unfilled segment
-                self._draw_thick_arc(start_deg, end_deg, self.background_color)
+                self._paint_segment(i, self.color)
+            else:
+                # Draw (or erase) unfilled segment
+                self._paint_segment(i, self.background_color)
+
+    def _filled_count(self, value):
+        """Number of filled segments at a value."""
+        return int((value / 100.0) * self.segments)
+
+    def capture_background(self):
+        """
+        Save the framebuffer pixels under every segment.
+
+        Call after drawing whatever is behind the gauge and before drawing
+        the gauge. Unfilled segments are then erased back to the saved
+        pixels, so gauges without a background_color can shrink, and
+        anti-aliased edges are blended over the saved pixels instead of
+        their previous colour.
+        """
+        mv = memoryview(self.lcd.buffer)
+        stride = self.lcd.width * 2
+        spans = self.segment_spans()
+        edges = self._edges
+        saved = []
+        for i in range(self.segments):
+            s = spans[i]
+            xy = edges[i][0] if edges is not None else ()
+            size = len(xy)
+            for k in range(2, len(s), 3):
+                size += 2 * s[k]
+            b = bytearray(size)
+            pos = 0
+            for k in range(0, len(s), 3):
+                a = s[k] * stride + s[k + 1] * 2
+                n = s[k + 2] * 2
+                b[pos:pos + n] = mv[a:a + n]
+                pos += n
+            for k in range(0, len(xy), 2):
+                a = xy[k + 1] * stride + xy[k] * 2
+                b[pos:pos + 2] = mv[a:a + 2]
+                pos += 2
+            saved.append(b)
+        self._background = saved
+
+    def _restore_segment(self, i):
+        """Copy a segment's saved background pixels back to the framebuffer."""
+        lcd = self.lcd
+        mv = memoryview(lcd.buffer)
+        stride = lcd.width * 2
+        b = memoryview(self._background[i])  # Slices below copy nothing
+        s = self._spans[i]
+        pos = 0
+        for k in range(0, len(s), 3):
+            y = s[k]
+            x = s[k + 1]
+            a = y * stride + x * 2
+            n = s[k + 2] * 2
+            mv[a:a + n] = b[pos:pos + n]
+            pos += n
+            lcd.mark_dirty(x, y, s[k + 2], 1)
+        if self._edges is not None:
+            xy = self._edges[i][0]
+            for k in range(0, len(xy), 2):
+                x = xy[k]
+                y = xy[k + 1]
+                a = y * stride + x * 2
+                mv[a:a + 2] = b[pos:pos + 2]
+                pos += 2
+                lcd.mark_dirty(x, y, 1, 1)
+
+    def _paint_segment(self, i, color):
+        """
+        Draw one segment in a colour, or erase it to the saved background
+        when color is None.
+        """
+        if self._background is not None and (color is None or self._edges is not None):
+            self._restore_segment(i)
+        if color is not None:
+            self._draw_segment(i, color)
+
+    def segment_spans(self):
+        """
+        Rasterized segments, computed once and reused by every draw.
+
+        Returns:
+            List with one array of (y, x, width) span triples per segment.
+            With antialias=True these are the fully covered pixels only.
+        """
+        if self._spans is None:
+            if not self._load_spans():
+                spans = []
+                edges = []
+                for start_deg, end_deg in self.segment_angles:
+                    if self.antialias:
+                        solid, xy, levels = arc_coverage(
+                            self.center_x, self.center_y, self.radius,
+                            self.thickness, start_deg, end_deg)
+                        edges.append((xy, levels))
+                    else:
+                        solid = arc_spans(self.center_x, self.center_y, self.radius,
+                                          self.thickness, start_deg, end_deg)
+                    spans.append(solid)
+                self._spans = spans
+                self._edges = edges if self.antialias else None
+                self._save_spans()
+        return self._spans
+
+    def segment_edges(self):
+        """
+        Anti-aliased edge pixels of each segment.
+
+        Returns:
+            List with one (xy, levels) pair per segment: xy is an array of
+            (x, y) pairs and levels a bytes-like coverage table (1-15 of 16).
+            None if the gauge is not anti-aliased.
+        """
+        self.segment_spans()
+        return self._edges
+
+    def _draw_segment(self, i, color):
+        """Draw one cached segment in a colour."""
+        self._fill_spans(self.segment_spans()[i], color)
+        if self._edges is not None:
+            lut = self._blend_luts.get(color)
+            if lut is None:
+                lut = blend_lut(color)
+                self._blend_luts[color] = lut
+            xy, levels = self._edges[i]
+            self._blend_pixels(xy, levels, lut)
+
+    def _blend_pixels(self, xy, levels, lut):
+        """Blend edge pixels over the framebuffer through a blend_lut() table."""
+        pixel = self.lcd.pixel
+        for i in range(len(levels)):
+            x = xy[2 * i]
+            y = xy[2 * i + 1]
+            o = levels[i] << 7
+            bg = pixel(x, y)
+            pixel(x, y, (lut[o + (bg >> 11)] << 11)
+                  | (lut[o + 32 + ((bg >> 5) & 0x3F)] << 5)
+                  | lut[o + 96 + (bg & 0x1F)])
+
+    def _span_cache_path(self):
+        """Cache file name for this geometry, or None if caching to flash is off."""
+        if self.cache_dir is None:
+            return None
+        return "%s/gauge_%d_%d_%d_%d_%d_%g_%g_%g_%d%s.spn" % (
+            self.cache_dir, self.center_x, self.center_y, self.radius,
+            self.thickness, self.segments, self.start_angle, self.end_angle,
+            self.gap_degrees, 1 if self.clockwise else 0,
+            "_aa" if self.antialias else "")
+
+    def _load_spans(self):
+        """Read cached segments from flash; False if missing or invalid."""
+        path = self._span_cache_path()
+        if path is None:
+            return False
+        n = self.segments
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(7)
+                if header[:4] != _SPAN_MAGIC or header[4] != _SPAN_VERSION \
+                        or header[5] != n or header[6] != (1 if self.antialias else 0):
+                    return False
+                # A bytearray initialiser is copied raw, giving zeroed arrays
+                counts = array('H', bytearray(4 * n))
+                f.readinto(counts)
+                n_spans = sum(counts[0::2])
+                n_edges = sum(counts[1::2])
+                data = array('h', bytearray(6 * n_spans + 4 * n_edges))
+                levels = bytearray(n_edges)
+                if f.readinto(data) != 2 * len(data) or f.readinto(levels) != n_edges:
+                    return False
+        except OSError:
+            return False
+
+        # Segments share the arrays through memoryview slices
+        mv = memoryview(data)
+        lv = memoryview(levels)
+        spans = []
+        edges = []
+        pos = 0
+        lpos = 0
+        for i in range(n):
+            ns = 3 * counts[2 * i]
+            ne = counts[2 * i + 1]
+            spans.append(mv[pos:pos + ns])
+            edges.append((mv[pos + ns:pos + ns + 2 * ne], lv[lpos:lpos + ne]))
+            pos += ns + 2 * ne
+            lpos += ne
+        self._spans = spans
+        self._edges = edges if self.antialias else None
+        return True
+
+    def _save_spans(self):
+        """Write cached segments to flash (ignored if the filesystem refuses)."""
+        path = self._span_cache_path()
+        if path is None:
+            return
+        edges = self._edges or [(b'', b'')] * self.segments
+        try:
+            with open(path, 'wb') as f:
+                f.write(_SPAN_MAGIC + bytes((_SPAN_VERSION, self.segments,
+                                             1 if self.antialias else 0)))
+                counts = array('H')
+                for spans, (xy, levels) in zip(self._spans, edges):
+                    counts.append(len(spans) // 3)
+                    counts.append(len(levels))
+                f.write(counts)
+                for spans, (xy, levels) in zip(self._spans, edges):
+                    f.write(spans)
+                    f.write(xy)
+                for xy, levels in edges:
+                    f.write(levels)
+        except OSError:
+            pass
+
+    def _fill_spans(self, spans, color):
+        """Draw a list of (y, x, width) span triples in one colour."""
+        hline = self.lcd.hline
+        for i in range(0, len(spans), 3):
+            hline(spans[i + 1], spans[i], spans[i + 2], color)
 
     def _draw_thick_arc(self, start_deg, end_deg, color):
         """
-        Draw thick arc segment using parametric circle algorithm.
+        Draw thick arc segment as horizontal spans.
 
         Args:
             start_deg: Starting angle in degrees
             end_deg: Ending angle in degrees
             color: RGB565 color value
         """
-        # Convert to radians
-        start_rad = math.radians(start_deg)
-        end_rad = math.radians(end_deg)
-
-        # Determine direction based on start/end relationship
-        drawing_clockwise = start_deg > end_deg
-
-        # Draw from inner radius to outer radius for thickness
-        for r in range(self.radius - self.thickness + 1, self.radius + 1):
-            # Calculate step size to ensure solid fill (no gaps between pixels)
-            # Use smaller step to guarantee coverage: 0.5 pixels worth of angle
-            angle_step = 0.5 / r if r > 0 else 0.01
-
-            angle = start_rad
-
-            if drawing_clockwise:
-                # Draw clockwise (decrement angle)
-                while angle >= end_rad:
-                    # Parametric circle equations
-                    # Y uses negative sin because Y increases downward on display
-                    # This makes: 0°=right, 90°=top, 180°=left, 270°=bottom
-                    x = int(self.center_x + r * math.cos(angle))
-                    y = int(self.center_y - r * math.sin(angle))
-
-                    # Bounds check (display is 240x240)
-                    if 0 <= x < 240 and 0 <= y < 240:
-                        self.lcd.pixel(x, y, color)
-
-                    angle -= angle_step
-            else:
-                # Draw counter-clockwise (increment angle)
-                while angle <= end_rad:
-                    # Parametric circle equations
-                    # Y uses negative sin because Y increases downward on display
-                    # This makes: 0°=right, 90°=top, 180°=left, 270°=bottom
-                    x = int(self.center_x + r * math.cos(angle))
-                    y = int(self.center_y - r * math.sin(angle))
-
-                    # Bounds check (display is 240x240)
-                    if 0 <= x < 240 and 0 <= y < 240:
-                        self.lcd.pixel(x, y, color)
-
-                    angle += angle_step
+        self._fill_spans(arc_spans(self.center_x, self.center_y, self.radius,
+                                   self.thickness, start_deg, end_deg), color)
 
     def update(self, percentage):
         """
@@ -230,16 +499,42 @@ class CircularGauge:
     def draw_with_partial_refresh(self):
         """
         Draw gauge and refresh only the gauge area (more efficient).
-        Calculates bounding box and uses Windows_show().
+        Sends the union of the segment bounding boxes with Windows_show().
         """
-        # Calculate bounding box with small padding
-        x_min = max(0, self.center_x - self.radius - 5)
-        x_max = min(239, self.center_x + self.radius + 5)
-        y_min = max(0, self.center_y - self.radius - 5)
-        y_max = min(239, self.center_y + self.radius + 5)
-
         self.draw()
-        self.lcd.Windows_show(x_min, y_min, x_max, y_max)
+        self._show_segments(0, self.segments)
+
+    def draw_incremental_with_partial_refresh(self, old_value):
+        """
+        Redraw the segments that changed since old_value and refresh only
+        the union of their bounding boxes with Windows_show().
+
+        Args:
+            old_value: Previous percentage value (0-100)
+        """
+        old_filled = self._filled_count(old_value)
+        new_filled = self._filled_count(self.value)
+        self._redraw_changed(old_filled, new_filled)
+        self._show_segments(min(old_filled, new_filled), max(old_filled, new_filled))
+
+    def _show_segments(self, first, last):
+        """Send the union of segment_bounds[first:last] to the panel."""
+        x0 = y0 = 1 << 15
+        x1 = y1 = -1
+        for i in range(first, last):
+            b = self.segment_bounds[i]
+            if b is None:
+                continue
+            if b[0] < x0:
+                x0 = b[0]
+            if b[1] < y0:
+                y0 = b[1]
+            if b[2] > x1:
+                x1 = b[2]
+            if b[3] > y1:
+                y1 = b[3]
+        if x1 >= 0:
+            self.lcd.Windows_show(x0, y0, x1, y1)
 
     def draw_incremental(self, old_value):
         """
@@ -248,22 +543,418 @@ class CircularGauge:
         Args:
             old_value: Previous percentage value (0-100)
         """
-        old_filled = int((old_value / 100.0) * self.segments)
-        new_filled = int((self.value / 100.0) * self.segments)
+        self._redraw_changed(self._filled_count(old_value), self._filled_count(self.value))
 
+    def _redraw_changed(self, old_filled, new_filled):
+        """Redraw the segments between two filled counts."""
         if new_filled > old_filled:
             # Fill additional segments
             for i in range(old_filled, new_filled):
-                start_deg, end_deg = self.segment_angles[i]
-                self._draw_thick_arc(start_deg, end_deg, self.color)
+                self._paint_segment(i, self.color)
         elif new_filled < old_filled:
             # Unfill segments
             for i in range(new_filled, old_filled):
-                start_deg, end_deg = self.segment_angles[i]
-                if self.background_color is not None:
-                    self._draw_thick_arc(start_deg, end_deg, self.background_color)
-                # Note: If no background_color, we can't erase efficiently
-                # In that case, full redraw is needed
+                # Without background_color this restores the pixels saved by
+                # capture_background(), or leaves the segment if none were
+                self._paint_segment(i, self.background_color)
+
+    def animate_to(self, value, duration_ms=300, fps=30):
+        """
+        Animate the gauge from its current value to a new one.
+
+        Each frame redraws only the segments whose fill changed and presents
+        them with lcd.end_frame(), which flushes just the changed area.
+        Frames are paced to a 1000/fps ms budget. The fill level follows
+        the elapsed time, so when a frame overruns the budget the levels it
+        would have shown are skipped and the animation still finishes on
+        time. Per-frame timing is available from frame_stats().
+
+        The gauge must currently show self.value (draw() it first).
+
+        Args:
+            value: Target percentage (0-100)
+            duration_ms: Animation length in milliseconds (default 300)
+            fps: Target frame rate (default 30)
+        """
+        target = max(0, min(100, value))
+        start = self.value
+        shown = self._filled_count(start)
+        self.reset_frame_stats()
+        if self._filled_count(target) == shown:
+            # The fill moves monotonically, so no segment would change
+            self.value = target
+            return
+
+        budget_us = 1_000_000 // fps
+        duration_us = max(1, duration_ms) * 1000
+        self._budget_us = budget_us
+        t0 = time.ticks_us()
+        while True:
+            elapsed = time.ticks_diff(time.ticks_us(), t0)
+            done = elapsed >= duration_us
+            self.value = target if done else start + (target - start) * elapsed / duration_us
+            filled = self._filled_count(self.value)
+
+            if filled != shown:
+                f0 = time.ticks_us()
+                self._redraw_changed(shown, filled)
+                self.lcd.end_frame()
+                frame_us = time.ticks_diff(time.ticks_us(), f0)
+                shown = filled
+                self._frames += 1
+                self._frame_total_us += frame_us
+                self._frame_last_us = frame_us
+                if frame_us > self._frame_max_us:
+                    self._frame_max_us = frame_us
+                if frame_us > budget_us:
+                    self._frames_dropped += frame_us // budget_us
+
+            if done:
+                break
+
+            # Wait for the next frame slot (or the end of the animation)
+            now = time.ticks_diff(time.ticks_us(), t0)
+            wait = min(budget_us - now % budget_us, duration_us - now)
+            if wait > 0:
+                time.sleep_us(wait)
+
+    def reset_frame_stats(self):
+        """Clear the counters reported by frame_stats()."""
+        self._frames = 0
+        self._frames_dropped = 0
+        self._frame_total_us = 0
+        self._frame_max_us = 0
+        self._frame_last_us = 0
+        self._budget_us = 0
+
+    def frame_stats(self):
+        """
+        Frame timing of the last animate_to().
+
+        Returns:
+            dict with frames (presented), dropped (budget slots lost to
+            slow frames), avg_ms/max_ms/last_ms (draw + present time),
+            budget_ms and max_fps (1000 / avg_ms)
+        """
+        frames = self._frames
+        avg_us = self._frame_total_us // frames if frames else 0
+        return {
+            'frames': frames,
+            'dropped': self._frames_dropped,
+            'avg_ms': avg_us / 1000,
+            'max_ms': self._frame_max_us / 1000,
+            'last_ms': self._frame_last_us / 1000,
+            'budget_ms': self._budget_us / 1000,
+            'max_fps': 1_000_000 / avg_us if avg_us else 0,
+        }
+
+
+def _isqrt(n):
+    """Largest integer s with s * s <= n (n >= 0)."""
+    s = int(math.sqrt(n))
+    while s * s > n:
+        s -= 1
+    while (s + 1) * (s + 1) <= n:
+        s += 1
+    return s
+
+
+def _sector_spans(out, cx, cy, radius, thickness, lo, hi, width, height,
+                  open_start=False):
+    """
+    Append the spans of one annulus sector of at most 180 degrees, with
+    lo and hi in quarter degrees.
+
+    With open_start, pixel centres exactly on the start ray are left out,
+    so two sectors sharing a ray do not both draw it.
+
+    Works in doubled coordinates relative to the centre so pixel centres
+    are odd integers: X = 2x + 1 - 2cx, Y = 2y + 1 - 2cy. A pixel belongs to
+    the arc if its centre lies between the inner and outer circles and on
+    the inner side of both edge rays; each test is solved per row for the
+    range of X it allows, so the only per-row work is integer arithmetic
+    plus one square root per circle.
+    """
+    ux0, uy0 = _direction(lo)
+    ux1, uy1 = _direction(hi)
+    outer2 = (2 * radius + 1) ** 2
+    inner = radius - thickness
+    inner2 = (2 * inner + 1) ** 2 if inner >= 0 else 0
+
+    # Rows spanned by the sector: its corners, plus the top or bottom of the
+    # ring if the sector crosses 90 or 270 degrees
+    r_in = max(inner, 0)
+    top = max(uy0 * radius, uy1 * radius, uy0 * r_in, uy1 * r_in) >> _DIR_SHIFT
+    bottom = min(uy0 * radius, uy1 * radius, uy0 * r_in, uy1 * r_in) >> _DIR_SHIFT
+    if (360 - lo) % _QUARTERS <= hi - lo:
+        top = radius
+    if (1080 - lo) % _QUARTERS <= hi - lo:
+        bottom = -radius
+    y_first = max(0, cy - top - 2, cy - radius - 1)
+    bias = 1 if open_start else 0
+    y_last = min(height - 1, cy - bottom + 1, cy + radius)
+    for y in range(y_first, y_last + 1):
+        Y = 2 * (y - cy) + 1
+        rem = outer2 - Y * Y
+        if rem < 0:
+            continue
+        s = _isqrt(rem)
+        # Edge rays: cross(u0, p) >= 0 and cross(p, u1) >= 0, with p = (X, -Y)
+        x_lo = -s
+        x_hi = s
+        py = -Y
+        c0 = ux0 * py - bias
+        if uy0 > 0:
+            x_hi = min(x_hi, c0 // uy0)
+        elif uy0 < 0:
+            x_lo = max(x_lo, -((-c0) // uy0))
+        elif c0 < 0:
+            continue
+        if uy1 > 0:
+            x_lo = max(x_lo, -((-ux1 * py) // uy1))
+        elif uy1 < 0:
+            x_hi = min(x_hi, (ux1 * py) // uy1)
+        elif ux1 * py > 0:
+            continue
+        if x_lo > x_hi:
+            continue
+
+        # Inner circle: exclude |X| <= t where X * X < inner2 - Y * Y
+        hole = inner2 - Y * Y
+        if hole > 0:
+            t = _isqrt(hole - 1)
+            runs = ((x_lo, min(x_hi, -t - 1)), (max(x_lo, t + 1), x_hi))
+        else:
+            runs = ((x_lo, x_hi),)
+
+        for a, b in runs:
+            # Odd X in [a, b] -> pixel columns
+            x0 = cx - ((1 - a) // 2)
+            x1 = cx + ((b - 1) // 2)
+            if x0 < 0:
+                x0 = 0
+            if x1 >= width:
+                x1 = width - 1
+            if x0 <= x1:
+                out.append(y)
+                out.append(x0)
+                out.append(x1 - x0 + 1)
+
+
+def _quarter_range(start_deg, end_deg):
+    """Arc end angles -> (lo, hi) in quarter degrees."""
+    a = _quarter(start_deg)
+    b = _quarter(end_deg)
+    return (a, b) if a <= b else (b, a)
+
+
+def arc_spans(cx, cy, radius, thickness, start_deg, end_deg, width=240, height=240):
+    """
+    Rasterize a thick arc into horizontal spans.
+
+    Covers the pixels whose centres lie in the ring between
+    radius - thickness and radius (outer edge inclusive) and between the
+    two angles, in either order. Spans are clipped to the screen.
+
+    Args:
+        cx, cy: Centre of the arc
+        radius: Outer radius in pixels
+        thickness: Ring thickness in pixels
+        start_deg, end_deg: Arc end angles (0=right, 90=top), rounded to
+                            quarter degrees
+        width, height: Clip size (default 240x240)
+
+    Returns:
+        array('h') of (y, x, width) triples, ready for lcd.hline()
+    """
+    lo, hi = _quarter_range(start_deg, end_deg)
+    out = array('h')
+    if hi - lo >= _QUARTERS:
+        # Full ring: two half rings
+        _sector_spans(out, cx, cy, radius, thickness, 0, 720, width, height)
+        _sector_spans(out, cx, cy, radius, thickness, 720, 1440, width, height, True)
+    elif hi - lo > 720:
+        mid = (lo + hi) // 2
+        _sector_spans(out, cx, cy, radius, thickness, lo, mid, width, height)
+        _sector_spans(out, cx, cy, radius, thickness, mid, hi, width, height, True)
+    else:
+        _sector_spans(out, cx, cy, radius, thickness, lo, hi, width, height)
+    return out
+
+
+def arc_bounds(cx, cy, radius, thickness, start_deg, end_deg, width=240, height=240):
+    """
+    Bounding box of the pixels arc_spans() or arc_coverage() can touch.
+
+    Args:
+        Same as arc_spans()
+
+    Returns:
+        (x0, y0, x1, y1) inclusive and clipped to the screen, or None if
+        the arc is entirely off screen
+    """
+    lo, hi = _quarter_range(start_deg, end_deg)
+    # Doubled radii of the ring edges
+    r_out = 2 * radius + 1
+    r_in = max(2 * (radius - thickness) + 1, 0)
+
+    # Extremes are at the four corners, or on the outer edge where the
+    # arc crosses an axis (x right, y up relative to the centre). Values
+    # are in 1 << 15 fixed point: doubled radius times the sine table.
+    xs = []
+    ys = []
+    for q in (lo, hi):
+        c, s = _direction(q)
+        for r in (r_in, r_out):
+            xs.append(r * c)
+            ys.append(r * s)
+    one = 1 << _DIR_SHIFT
+    for axis, dx, dy in ((0, one, 0), (360, 0, one), (720, -one, 0), (1080, 0, -one)):
+        if hi - lo >= _QUARTERS or (axis - lo) % _QUARTERS <= hi - lo:
+            xs.append(r_out * dx)
+            ys.append(r_out * dy)
+
+    shift = _DIR_SHIFT + 1
+    x0 = max(0, cx + (min(xs) >> shift))
+    x1 = min(width - 1, cx - ((-max(xs)) >> shift) - 1)
+    y0 = max(0, cy + ((-max(ys)) >> shift))
+    y1 = min(height - 1, cy - (min(ys) >> shift) - 1)
+    if x0 > x1 or y0 > y1:
+        return None
+    return (x0, y0, x1, y1)
+
+
+def arc_coverage(cx, cy, radius, thickness, start_deg, end_deg, width=240, height=240):
+    """
+    Rasterize a thick arc with anti-aliased edges.
+
+    Uses the same ring as arc_spans() (pixel centres between
+    radius - thickness + 0.5 and radius + 0.5 from the centre), but
+    measures how much of each pixel the ideal shape covers. Pixels well
+    inside or outside are classified from their centre's distance to each
+    edge; only those within a pixel of an edge are sampled on a 4x4 grid.
+
+    Args:
+        Same as arc_spans()
+
+    Returns:
+        (spans, xy, levels): array('h') of (y, x, width) triples for fully
+        covered pixels, array('h') of (x, y) pairs for partly covered
+        pixels, and a bytearray of their coverage in sixteenths (1-15)
+    """
+    lo, hi = _quarter_range(start_deg, end_deg)
+    sweep = hi - lo
+    full_ring = sweep >= _QUARTERS
+    # Wider than 180 degrees the sector is the union of the two half-planes
+    union = sweep > 720
+    ux0, uy0 = _direction(lo)
+    ux1, uy1 = _direction(hi)
+
+    # Positions are measured in eighths of a pixel from the centre (y up),
+    # so pixel centres and the 4x4 sample points are all integers
+    r_out = 8 * radius + 4
+    r_in = max(8 * (radius - thickness) + 4, 0)
+    r_out2 = r_out * r_out
+    r_in2 = r_in * r_in
+    # A pixel whose centre is at least 3/4 px inside (or outside) every edge
+    # is fully covered (or empty): its samples are at most 0.53 px away
+    near = 6
+    full_out2 = (r_out - near) ** 2
+    full_in2 = (r_in + near) ** 2
+    empty_out2 = (r_out + near) ** 2
+    empty_in2 = (r_in - near) ** 2 if r_in > near else -1
+    near_edge = near << _DIR_SHIFT
+
+    def inside(px, py):
+        d2 = px * px + py * py
+        if d2 > r_out2 or d2 < r_in2:
+            return False
+        if full_ring:
+            return True
+        s0 = ux0 * py - uy0 * px >= 0
+        s1 = px * uy1 - py * ux1 >= 0
+        return (s0 or s1) if union else (s0 and s1)
+
+    # Candidate pixels: the aliased arc grown by a pixel on every side
+    pad = 4 * int(math.degrees(1.5 / max(radius - thickness, 2))) + 4
+    candidates = arc_spans(cx, cy, radius + 1, thickness + 2,
+                           (lo - pad) / 4, (hi + pad) / 4, width, height)
+
+    spans = array('h')
+    xy = array('h')
+    levels = bytearray()
+    for i in range(0, len(candidates), 3):
+        y = candidates[i]
+        x0 = candidates[i + 1]
+        end = x0 + candidates[i + 2]
+        py = 8 * (cy - y) - 4
+        run = -1
+        for x in range(x0, end + 1):
+            level = 0
+            if x < end:
+                px = 8 * (x - cx) + 4
+                d2 = px * px + py * py
+                if d2 > empty_out2 or d2 < empty_in2:
+                    pass
+                else:
+                    ring_full = full_in2 <= d2 <= full_out2 if r_in else d2 <= full_out2
+                    if full_ring:
+                        a_full = True
+                        a_empty = False
+                    else:
+                        a0 = ux0 * py - uy0 * px
+                        a1 = px * uy1 - py * ux1
+                        a = max(a0, a1) if union else min(a0, a1)
+                        a_full = a >= near_edge
+                        a_empty = a <= -near_edge
+                    if ring_full and a_full:
+                        level = _AA_LEVELS
+                    elif not a_empty:
+                        for sy in range(1, 2 * _AA_GRID, 2):
+                            for sx in range(1, 2 * _AA_GRID, 2):
+                                if inside(px - 4 + sx, py + 4 - sy):
+                                    level += 1
+            if level == _AA_LEVELS:
+                if run < 0:
+                    run = x
+                continue
+            if run >= 0:
+                spans.append(y)
+                spans.append(run)
+                spans.append(x - run)
+                run = -1
+            if level:
+                xy.append(x)
+                xy.append(y)
+                levels.append(level)
+    return spans, xy, levels
+
+
+def blend_lut(color):
+    """
+    Blend table for drawing anti-aliased edges in one colour.
+
+    Each 16-bit colour is blended channel by channel: bits 15-11 and 4-0
+    (5 bits) and bits 10-5 (6 bits). Works for the display's BRG565 layout
+    as well as RGB565 since only the field widths matter.
+
+    Args:
+        color: Foreground colour
+
+    Returns:
+        bytearray of 16 x 128 bytes: at level * 128 the blended values for
+        every bits 15-11 value (32 entries), bits 10-5 value (64 entries)
+        and bits 4-0 value (32 entries), at level/16 coverage
+    """
+    fg = (color >> 11, (color >> 5) & 0x3F, color & 0x1F)
+    lut = bytearray(_AA_LEVELS * 128)
+    for level in range(_AA_LEVELS):
+        base = level * 128
+        for ch, (offset, size) in enumerate(((0, 32), (32, 64), (96, 32))):
+            f = fg[ch]
+            for v in range(size):
+                lut[base + offset + v] = v + ((f - v) * level + _AA_LEVELS // 2) // _AA_LEVELS
+    return lut
 
 
 def rgb_to_brg565(r, g, b):
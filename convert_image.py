@@ -7,17 +7,54 @@ for the Waveshare RP2350-Touch-LCD-1.28 display (240x240 pixels).
 
 Usage:
     python convert_image.py image.jpg variable_name > output.py
-
-The output can be copied into image_data.py on the RP2350.
+    python convert_image.py image.jpg background.rgb565 [--rle]
+    python convert_image.py --batch assets/ [--out build/] [--rle] [--jobs N]
+
+The first form prints Python code to copy into image_data.py on the RP2350.
+The second writes a .rgb565 file that image_display.load_image_file()
+reads straight into the framebuffer, so nothing stays resident in RAM.
+With --rle the pixels are run-length encoded when that makes the file
+smaller; the encoding is checked to decode back to the exact pixels.
+The third converts every JPG/PNG in a directory to .rgb565 files, one
+image per worker process.
+
+Outputs are cached in .image_cache/ next to this script, keyed by a hash of
+the source file and the conversion parameters, so re-running on unchanged
+assets only hashes them. Output files that are already up to date are not
+rewritten. Use --cache-dir to move the cache or --no-cache to bypass it.
+
+Any form accepts --dither bayer|floyd-steinberg to dither to the 5/6/5-bit
+levels instead of truncating, which removes banding in gradients, and
+--curves R,G,B to give each channel its own calibration gamma.
 
 Requirements:
-    pip install Pillow
+    pip install Pillow numpy
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
+import argparse
+import contextlib
+import hashlib
+import io
+import numpy as np
+import struct
 import sys
 import os
 
+# .rgb565 file header, see image_display.py
+IMAGE_MAGIC = b'R565'
+IMAGE_VERSION = 1
+IMAGE_HEADER = '<4sBBHH'
+IMAGE_RAW = 0
+IMAGE_RLE = 1
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Bump when the converter's output changes, so older cache entries are ignored
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.image_cache')
+
 
 def apply_gamma_correction(value, gamma=2.2):
     """
@@ -41,17 +78,143 @@ def apply_gamma_correction(value, gamma=2.2):
     return int(corrected * 255.0)
 
 
-def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2):
+def gamma_lut(gamma=2.2):
     """
-    Convert image to RGB565 byte array with BRG color correction.
+    Build a 256-entry lookup table of apply_gamma_correction() results.
+
+    Args:
+        gamma: Gamma value (default 2.2). 1.0 gives the identity table.
+
+    Returns:
+        numpy uint8 array indexed by the input colour value
+    """
+    if gamma == 1.0:
+        return np.arange(256, dtype=np.uint8)
+    return np.array([apply_gamma_correction(v, gamma) for v in range(256)], dtype=np.uint8)
+
+
+def channel_curves(gamma=2.2, curves=None):
+    """
+    Build the calibration curves applied to each channel before quantization.
+
+    The panel's red, green and blue responses differ (see COLOR_NOTES.md),
+    so each channel can have its own curve. Unlike gamma_lut() the curves
+    keep fractional values, which the dithering stage turns into patterns.
+
+    Args:
+        gamma: Gamma used for every channel when curves is None (default 2.2)
+        curves: Optional (red, green, blue); each a gamma value or a
+                256-entry table of output values 0-255
+
+    Returns:
+        numpy float array of shape (3, 256), rows in R, G, B order
+    """
+    if curves is None:
+        curves = (gamma, gamma, gamma)
+    x = np.arange(256) / 255.0
+    table = np.empty((3, 256))
+    for i, curve in enumerate(curves):
+        if np.ndim(curve) == 0:
+            table[i] = 255.0 * x ** (1.0 / curve)
+        else:
+            curve = np.asarray(curve, dtype=float)
+            if curve.shape != (256,):
+                raise ValueError("Calibration tables need 256 entries")
+            table[i] = curve
+    return np.clip(table, 0.0, 255.0)
+
+
+# Quantization levels of the BRG565 channels, in R, G, B order
+_CHANNEL_LEVELS = (63, 31, 31)
+
+# 8x8 Bayer matrix, thresholds 0-63
+_BAYER_8 = np.array([
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21],
+])
+
+
+def _bayer_quantize(levels):
+    """Ordered dither: add a tiled threshold in [0, 1) and round down."""
+    h, w = levels.shape
+    threshold = (np.tile(_BAYER_8, (h // 8 + 1, w // 8 + 1))[:h, :w] + 0.5) / 64.0
+    return np.floor(levels + threshold)
+
+
+def _error_diffuse(levels, max_level):
+    """Floyd-Steinberg error diffusion on one channel, serpentine rows."""
+    h, w = levels.shape
+    out = np.empty((h, w))
+    cur = levels[0].tolist()
+    for y in range(h):
+        nxt = levels[y + 1].tolist() if y + 1 < h else [0.0] * w
+        row = [0] * w
+        if y & 1:
+            xs, d = range(w - 1, -1, -1), -1
+        else:
+            xs, d = range(w), 1
+        for x in xs:
+            v = cur[x]
+            q = int(v + 0.5) if v > 0 else 0
+            if q > max_level:
+                q = max_level
+            row[x] = q
+            e = v - q
+            ahead = x + d
+            if 0 <= ahead < w:
+                cur[ahead] += e * 0.4375
+                nxt[ahead] += e * 0.0625
+            nxt[x] += e * 0.3125
+            behind = x - d
+            if 0 <= behind < w:
+                nxt[behind] += e * 0.1875
+        out[y] = row
+        cur = nxt
+    return out
+
+
+def quantize_channels(rgb, dither=None):
+    """
+    Quantize curve-corrected R, G, B values to BRG565 channel levels.
+
+    Args:
+        rgb: float array (height, width, 3) of values 0-255
+        dither: None to round to the nearest level, 'bayer' for an 8x8
+                ordered dither, or 'floyd-steinberg' for error diffusion
+
+    Returns:
+        Tuple of (red 0-63, green 0-31, blue 0-31) uint16 arrays
+    """
+    out = []
+    for i, max_level in enumerate(_CHANNEL_LEVELS):
+        levels = rgb[:, :, i] * (max_level / 255.0)
+        if dither == 'bayer':
+            levels = _bayer_quantize(levels)
+        elif dither == 'floyd-steinberg':
+            levels = _error_diffuse(levels, max_level)
+        elif dither is None:
+            levels = np.floor(levels + 0.5)
+        else:
+            raise ValueError(f"Unknown dither mode: {dither}")
+        out.append(np.clip(levels, 0, max_level).astype(np.uint16))
+    return tuple(out)
+
+
+def load_rgb(image_path):
+    """
+    Load an image as 240x240 RGB888.
 
     Args:
         image_path: Path to JPG/PNG file
-        variable_name: Variable name for the Python output
-        gamma: Gamma correction value (default 2.2 for sRGB). Set to 1.0 to disable.
 
     Returns:
-        Tuple of (byte_array, image_info_dict)
+        Tuple of (uint8 array of shape (240, 240, 3), original (width, height))
     """
     # Load image
     try:
@@ -70,37 +233,59 @@ def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2):
 
     # Convert to RGB (handles RGBA, grayscale, etc.)
     img = img.convert('RGB')
+    return np.asarray(img, dtype=np.uint8), (orig_width, orig_height)
 
-    # Convert to RGB565 with BRG correction
-    byte_array = bytearray()
 
-    for y in range(240):
-        for x in range(240):
-            r, g, b = img.getpixel((x, y))
+def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2, dither=None, curves=None):
+    """
+    Convert image to RGB565 byte array with BRG color correction.
 
-            # Apply gamma correction to brighten mid-tones
-            if gamma != 1.0:
-                r = apply_gamma_correction(r, gamma)
-                g = apply_gamma_correction(g, gamma)
-                b = apply_gamma_correction(b, gamma)
+    Without dither or curves the channels are gamma-corrected to whole
+    values and truncated to 5/6/5 bits, as image_data.py was built. With
+    either, the calibration curves are applied at full precision and each
+    channel is rounded or dithered to its nearest levels.
 
-            # Convert RGB888 to RGB565 with BRG format for this display
-            # The display uses non-standard color layout:
-            # Bits 15-11: Blue (5 bits)
-            # Bits 10-5: Red (6 bits)
-            # Bits 4-0: Green (5 bits)
-            rgb565 = ((b & 0xF8) << 8) | ((r & 0xFC) << 3) | (g >> 3)
+    Args:
+        image_path: Path to JPG/PNG file
+        variable_name: Variable name for the Python output
+        gamma: Gamma correction value (default 2.2 for sRGB). Set to 1.0 to disable.
+        dither: None, 'bayer' or 'floyd-steinberg' (see quantize_channels)
+        curves: Optional per-channel calibration curves (see channel_curves)
 
-            # Store as little-endian bytes
-            byte_array.append(rgb565 & 0xFF)
-            byte_array.append((rgb565 >> 8) & 0xFF)
+    Returns:
+        Tuple of (byte_array, image_info_dict)
+    """
+    rgb, (orig_width, orig_height) = load_rgb(image_path)
+
+    if dither is None and curves is None:
+        # Apply gamma correction to brighten mid-tones, one table lookup per channel
+        pixels = gamma_lut(gamma)[rgb]
+        r = pixels[:, :, 0].astype(np.uint16) >> 2
+        g = pixels[:, :, 1].astype(np.uint16) >> 3
+        b = pixels[:, :, 2].astype(np.uint16) >> 3
+    else:
+        table = channel_curves(gamma, curves)
+        corrected = np.stack([table[i][rgb[:, :, i]] for i in range(3)], axis=2)
+        r, g, b = quantize_channels(corrected, dither)
+
+    # Convert RGB888 to RGB565 with BRG format for this display
+    # The display uses non-standard color layout:
+    # Bits 15-11: Blue (5 bits)
+    # Bits 10-5: Red (6 bits)
+    # Bits 4-0: Green (5 bits)
+    rgb565 = (b << 11) | (r << 5) | g
+
+    # Store as little-endian bytes, rows top to bottom
+    byte_array = bytearray(rgb565.astype('<u2').tobytes())
 
     info = {
         'original_size': (orig_width, orig_height),
         'output_size': (240, 240),
         'byte_count': len(byte_array),
         'variable_name': variable_name,
-        'gamma': gamma
+        'gamma': gamma,
+        'dither': dither,
+        'curves': curves
     }
 
     return byte_array, info
@@ -122,6 +307,10 @@ def generate_python_code(byte_array, variable_name, image_path, info):
     print(f"# Format: RGB565 (BRG color corrected)")
     gamma_note = f" with gamma correction {info['gamma']}" if info['gamma'] != 1.0 else ""
     print(f"# Size: {len(byte_array):,} bytes{gamma_note}")
+    if info.get('curves') is not None:
+        print(f"# Calibration curves: {_curves_param(info['curves'])}")
+    if info.get('dither'):
+        print(f"# Dithering: {info['dither']}")
     print()
 
     # Split into small chunks stored as separate variables
@@ -147,29 +336,398 @@ def generate_python_code(byte_array, variable_name, image_path, info):
     print()
 
 
+def _append_literals(out, byte_array, start, end):
+    # Literal packets for pixels start..end-1, at most 128 pixels each
+    while start < end:
+        n = min(128, end - start)
+        out.append(n - 1)
+        out += byte_array[start * 2:(start + n) * 2]
+        start += n
+
+
+def encode_rle(byte_array):
+    """
+    Run-length encode RGB565 pixel data in the .rgb565 packet format.
+
+    Runs of two or more equal pixels become run packets, everything else is
+    stored in literal packets of up to 128 pixels. Packets continue across
+    row ends. See image_display.py for the packet layout.
+
+    Args:
+        byte_array: bytearray with image data, 2 bytes per pixel
+
+    Returns:
+        bytearray with the encoded packets
+    """
+    pixels = [byte_array[i] | (byte_array[i + 1] << 8) for i in range(0, len(byte_array), 2)]
+    count = len(pixels)
+    out = bytearray()
+    literal_start = 0
+    i = 0
+    while i < count:
+        color = pixels[i]
+        j = i + 1
+        while j < count and j - i < 0x4000 and pixels[j] == color:
+            j += 1
+        run = j - i
+        if run < 2:
+            i = j
+            continue
+        _append_literals(out, byte_array, literal_start, i)
+        if run <= 64:
+            out.append(0x80 | (run - 1))
+        else:
+            out.append(0xC0 | ((run - 1) >> 8))
+            out.append((run - 1) & 0xFF)
+        out.append(color & 0xFF)
+        out.append(color >> 8)
+        i = j
+        literal_start = i
+    _append_literals(out, byte_array, literal_start, count)
+    return out
+
+
+def decode_rle(data, pixel_count):
+    """
+    Decode .rgb565 run-length packets back to pixel bytes.
+
+    Host-side reference for encode_rle(), used to check every encoded image.
+
+    Args:
+        data: Encoded packets
+        pixel_count: Number of pixels in the image
+
+    Returns:
+        bytearray with 2 bytes per pixel
+    """
+    out = bytearray()
+    i = 0
+    while i < len(data) and len(out) < pixel_count * 2:
+        c = data[i]
+        if c < 0x80:
+            n = (c + 1) * 2
+            out += data[i + 1:i + 1 + n]
+            i += 1 + n
+        elif c < 0xC0:
+            out += data[i + 1:i + 3] * ((c & 0x3F) + 1)
+            i += 3
+        else:
+            out += data[i + 2:i + 4] * (((c & 0x3F) << 8 | data[i + 1]) + 1)
+            i += 4
+    return out
+
+
+def rgb565_file_bytes(byte_array, width=240, height=240, rle=False):
+    """
+    Build the contents of a .rgb565 file for image_display.load_image_file().
+
+    Args:
+        byte_array: bytearray with image data (width * height * 2 bytes)
+        width: Image width in pixels (default 240)
+        height: Image height in pixels (default 240)
+        rle: Run-length encode the pixels if that is smaller (default False)
+
+    Returns:
+        bytes with the header and pixel data; byte 5 holds the encoding
+    """
+    encoding = IMAGE_RAW
+    data = byte_array
+    if rle:
+        packed = encode_rle(byte_array)
+        if decode_rle(packed, width * height) != byte_array:
+            raise ValueError("Run-length encoding did not round-trip")
+        if len(packed) < len(byte_array):
+            encoding = IMAGE_RLE
+            data = packed
+    return struct.pack(IMAGE_HEADER, IMAGE_MAGIC, IMAGE_VERSION, encoding, width, height) + data
+
+
+def write_rgb565_file(byte_array, path, width=240, height=240, rle=False):
+    """
+    Write pixel data as a .rgb565 file for image_display.load_image_file().
+
+    Args:
+        byte_array: bytearray with image data (width * height * 2 bytes)
+        path: Output file path
+        width: Image width in pixels (default 240)
+        height: Image height in pixels (default 240)
+        rle: Run-length encode the pixels if that is smaller (default False)
+
+    Returns:
+        Encoding written, IMAGE_RAW or IMAGE_RLE
+    """
+    data = rgb565_file_bytes(byte_array, width, height, rle)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return data[5]
+
+
+def cache_key(image_path, **params):
+    """
+    Hash a source image's contents together with its conversion parameters.
+
+    Args:
+        image_path: Path to the source image
+        **params: Everything else that changes the output (gamma, size, format...)
+
+    Returns:
+        Hex digest naming the cache entry
+    """
+    h = hashlib.sha256()
+    with open(image_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    h.update(repr((CACHE_VERSION, sorted(params.items()))).encode())
+    return h.hexdigest()
+
+
+def cached_output(cache_dir, key, build):
+    """
+    Return the cached bytes for `key`, or call build() and cache its result.
+
+    Args:
+        cache_dir: Cache directory, or None to always build
+        key: Entry name from cache_key()
+        build: Function returning the output bytes
+
+    Returns:
+        Tuple of (data, hit) where hit is True if the cache was used
+    """
+    if cache_dir is None:
+        return build(), False
+    path = os.path.join(cache_dir, key)
+    try:
+        with open(path, 'rb') as f:
+            return f.read(), True
+    except OSError:
+        pass
+    data = build()
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary name first so parallel workers never see half a file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return data, False
+
+
+def write_if_changed(path, data):
+    """
+    Write `data` to `path` unless the file already holds exactly that.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def _curves_param(curves):
+    # Plain floats for cache keys and notes; repr() of an array is abbreviated
+    if curves is None:
+        return None
+    return [np.asarray(c, dtype=float).tolist() for c in curves]
+
+
+def _rgb565_key(image_path, gamma, rle, dither, curves):
+    return cache_key(image_path, gamma=gamma, size=(240, 240), format='rle' if rle else 'raw',
+                     dither=dither, curves=_curves_param(curves))
+
+
+def convert_file(image_path, out_path, gamma=2.2, rle=False, cache_dir=None, dither=None,
+                 curves=None):
+    """
+    Convert one image to a .rgb565 file. Used by --batch worker processes.
+
+    Args:
+        image_path: Path to JPG/PNG file
+        out_path: Output .rgb565 path
+        gamma: Gamma correction value (default 2.2)
+        rle: Run-length encode the pixels if that is smaller (default False)
+        cache_dir: Directory of cached outputs, or None to always convert
+        dither: None, 'bayer' or 'floyd-steinberg' (see quantize_channels)
+        curves: Optional per-channel calibration curves (see channel_curves)
+
+    Returns:
+        Dictionary with the output 'path', 'size' and 'encoding', whether it
+        came from the cache ('cached') and whether the file was 'written'
+    """
+    def build():
+        byte_array, info = convert_image_to_rgb565_brg(image_path, os.path.basename(out_path),
+                                                       gamma, dither, curves)
+        return rgb565_file_bytes(byte_array, *info['output_size'], rle=rle)
+
+    key = _rgb565_key(image_path, gamma, rle, dither, curves)
+    data, hit = cached_output(cache_dir, key, build)
+    written = write_if_changed(out_path, data)
+    return {
+        'path': out_path,
+        'size': len(data),
+        'encoding': data[5],
+        'cached': hit,
+        'written': written,
+    }
+
+
+def convert_directory(src_dir, out_dir=None, gamma=2.2, rle=False, jobs=None, cache_dir=None,
+                      dither=None, curves=None):
+    """
+    Convert every JPG/PNG in a directory to .rgb565 files in parallel.
+
+    Images with a cache entry are copied out in this process; only the rest
+    are sent to the worker pool.
+
+    Args:
+        src_dir: Directory with the source images
+        out_dir: Output directory (default: src_dir)
+        gamma: Gamma correction value (default 2.2)
+        rle: Run-length encode the pixels if that is smaller (default False)
+        jobs: Number of worker processes (default: one per CPU)
+        cache_dir: Directory of cached outputs, or None to always convert
+        dither: None, 'bayer' or 'floyd-steinberg' (see quantize_channels)
+        curves: Optional per-channel calibration curves (see channel_curves)
+
+    Returns:
+        List of convert_file() results, in source file name order
+    """
+    out_dir = out_dir or src_dir
+    os.makedirs(out_dir, exist_ok=True)
+    names = sorted(n for n in os.listdir(src_dir) if n.lower().endswith(IMAGE_EXTENSIONS))
+    sources = [os.path.join(src_dir, n) for n in names]
+    outputs = [os.path.join(out_dir, os.path.splitext(n)[0] + '.rgb565') for n in names]
+
+    results = [None] * len(names)
+    todo = []
+    for i, source in enumerate(sources):
+        if cache_dir is not None and os.path.exists(
+                os.path.join(cache_dir, _rgb565_key(source, gamma, rle, dither, curves))):
+            results[i] = convert_file(source, outputs[i], gamma, rle, cache_dir, dither, curves)
+        else:
+            todo.append(i)
+
+    if len(todo) == 1:
+        i = todo[0]
+        results[i] = convert_file(sources[i], outputs[i], gamma, rle, cache_dir, dither, curves)
+    elif todo:
+        n = len(todo)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            done = pool.map(convert_file, [sources[i] for i in todo], [outputs[i] for i in todo],
+                            [gamma] * n, [rle] * n, [cache_dir] * n, [dither] * n, [curves] * n)
+            for i, result in zip(todo, done):
+                results[i] = result
+    return results
+
+
+def _report(result):
+    label = "run-length" if result['encoding'] == IMAGE_RLE else "raw"
+    if not result['written']:
+        state = "unchanged"
+    elif result['cached']:
+        state = "from cache"
+    else:
+        state = "converted"
+    print(f"# {result['path']}: {result['size']:,} bytes, {label}, {state}", file=sys.stderr)
+
+
+def _parse_curves(text):
+    try:
+        curves = tuple(float(v) for v in text.split(','))
+    except ValueError:
+        curves = ()
+    if len(curves) != 3 or min(curves) <= 0:
+        raise argparse.ArgumentTypeError("expected three positive gammas, e.g. 2.2,2.0,2.4")
+    return curves
+
+
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python convert_image.py <image_file> <variable_name>", file=sys.stderr)
-        print("\nExample:", file=sys.stderr)
-        print("  python convert_image.py background.jpg bg_image > temp.py", file=sys.stderr)
-        print("\nThen copy the output from temp.py into image_data.py", file=sys.stderr)
+    parser = argparse.ArgumentParser(
+        description="Convert JPG/PNG images to BRG565 data for the RP2350 display.",
+        epilog="Examples:\n"
+               "  python convert_image.py background.jpg bg_image > temp.py\n"
+               "      then copy the output from temp.py into image_data.py\n"
+               "  python convert_image.py background.jpg background.rgb565 --rle\n"
+               "      writes a raw image file to upload instead\n"
+               "  python convert_image.py --batch assets/ --out build/ --rle",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('image_file', nargs='?', help="source JPG/PNG image")
+    parser.add_argument('variable_name', nargs='?',
+                        help="Python variable name, or an output path ending in .rgb565")
+    parser.add_argument('--rle', action='store_true',
+                        help="run-length encode .rgb565 output when smaller")
+    parser.add_argument('--batch', metavar='DIR',
+                        help="convert every JPG/PNG in DIR to .rgb565 files")
+    parser.add_argument('--out', metavar='DIR', help="output directory for --batch")
+    parser.add_argument('--jobs', type=int, help="worker processes for --batch")
+    parser.add_argument('--dither', choices=['bayer', 'floyd-steinberg'],
+                        help="dither to the 5/6/5-bit levels instead of truncating")
+    parser.add_argument('--curves', metavar='R,G,B', type=_parse_curves,
+                        help="per-channel calibration gammas, e.g. 2.2,2.0,2.4")
+    parser.add_argument('--cache-dir', metavar='DIR', default=DEFAULT_CACHE_DIR,
+                        help="cache of converted outputs (default: .image_cache)")
+    parser.add_argument('--no-cache', action='store_true', help="always convert")
+    args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    if args.batch:
+        if args.image_file:
+            parser.error("--batch takes no image_file/variable_name")
+        if not os.path.isdir(args.batch):
+            print(f"Error: Directory not found: {args.batch}", file=sys.stderr)
+            sys.exit(1)
+        results = convert_directory(args.batch, args.out, rle=args.rle, jobs=args.jobs,
+                                    cache_dir=cache_dir, dither=args.dither, curves=args.curves)
+        for result in results:
+            _report(result)
+        written = sum(1 for r in results if r['written'])
+        print(f"# {len(results)} image(s), {written} written", file=sys.stderr)
+        return
+
+    if not args.variable_name:
+        parser.print_usage(sys.stderr)
         sys.exit(1)
 
-    image_path = sys.argv[1]
-    variable_name = sys.argv[2]
+    image_path = args.image_file
+    variable_name = args.variable_name
 
     # Check if file exists
     if not os.path.exists(image_path):
         print(f"Error: File not found: {image_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Convert image
-    print(f"# Converting {image_path}...", file=sys.stderr)
-    byte_array, info = convert_image_to_rgb565_brg(image_path, variable_name)
-    print(f"# Generated {len(byte_array):,} bytes", file=sys.stderr)
-
-    # Generate Python code
-    generate_python_code(byte_array, variable_name, image_path, info)
+    if variable_name.endswith('.rgb565'):
+        print(f"# Converting {image_path}...", file=sys.stderr)
+        result = convert_file(image_path, variable_name, rle=args.rle, cache_dir=cache_dir,
+                              dither=args.dither, curves=args.curves)
+        _report(result)
+        print(f"# Upload it with: mpremote cp {variable_name} :{os.path.basename(variable_name)}",
+              file=sys.stderr)
+        return
+
+    def build():
+        # Convert image and capture the generated Python code
+        print(f"# Converting {image_path}...", file=sys.stderr)
+        byte_array, info = convert_image_to_rgb565_brg(image_path, variable_name,
+                                                       dither=args.dither, curves=args.curves)
+        print(f"# Generated {len(byte_array):,} bytes", file=sys.stderr)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            generate_python_code(byte_array, variable_name, image_path, info)
+        return out.getvalue().encode()
+
+    key = cache_key(image_path, gamma=2.2, size=(240, 240), format='python',
+                    name=variable_name, source=os.path.basename(image_path),
+                    dither=args.dither, curves=_curves_param(args.curves))
+    code, hit = cached_output(cache_dir, key, build)
+    if hit:
+        print(f"# {image_path} unchanged, using cached output", file=sys.stderr)
+    sys.stdout.write(code.decode())
 
     print(f"# Conversion complete!", file=sys.stderr)
     print(f"# Copy the output above into image_data.py", file=sys.stderr)
@@ -0,0 +1,181 @@
+# Bitmap Font Engine for LCD_1inch28
+# Shared renderer for bitmap_fonts, bitmap_fonts_32 and bitmap_fonts_48.
+# Glyph tables are converted to MONO_HLSB buffers on first use and drawn with
+# FrameBuffer.blit, using a 2-colour palette to set the text colour.
+#
+# Packed font files (.bfnt, written by make_fonts.py) hold the same MONO_HLSB
+# glyphs, so PackedFont can read them straight from flash when first drawn:
+#
+#   offset  size        field
+#   0       4           magic b'BFNT'
+#   4       1           version (1)
+#   5       1           glyph width in pixels
+#   6       1           glyph height in pixels
+#   7       1           number of glyphs N
+#   8       2           bytes per glyph (little-endian)
+#   10      N           character codes, one byte each
+#   10+N    N*size      glyph bitmaps, MONO_HLSB, rows padded to whole bytes
+
+import framebuf
+import struct
+import profiler
+
+FONT_MAGIC = b'BFNT'
+FONT_VERSION = 1
+FONT_HEADER = '<4sBBBBH'
+FONT_HEADER_SIZE = 10
+
+# Palettes for the most recently used colours (most recent first)
+_PALETTE_CACHE_SIZE = 4
+_palettes = []
+
+
+def _palette(color):
+    """
+    Return (palette, key) for drawing set bits in the given colour.
+
+    Index 0 (background) maps to a colour different from `color`, which is
+    then passed to blit() as the transparent key, so only set bits are drawn.
+    """
+    for i in range(len(_palettes)):
+        entry = _palettes[i]
+        if entry[0] == color:
+            if i:
+                _palettes.pop(i)
+                _palettes.insert(0, entry)
+            return entry[1], entry[2]
+
+    key = color ^ 0xFFFF
+    pal = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+    pal.pixel(0, 0, key)
+    pal.pixel(1, 0, color)
+    _palettes.insert(0, (color, pal, key))
+    if len(_palettes) > _PALETTE_CACHE_SIZE:
+        _palettes.pop()
+    return pal, key
+
+
+class BitmapFont:
+    """
+    Fixed-width bitmap font drawn with FrameBuffer.blit.
+
+    Example:
+        font = BitmapFont(LARGE_DIGITS, 16, 24)
+        font.draw_text(lcd, "12:34", 50, 100, lcd.white, spacing=4)
+    """
+
+    def __init__(self, glyphs, width, height):
+        """
+        Args:
+            glyphs: dict of char -> list of `height` row ints, `width` bits
+                    each, most significant bit = leftmost pixel
+            width: Glyph width in pixels
+            height: Glyph height in pixels
+        """
+        self.glyphs = glyphs
+        self.width = width
+        self.height = height
+        self._stride = (width + 7) // 8
+        self._cache = {}
+
+    def glyph(self, char):
+        """
+        Return the blit source tuple (buffer, width, height, MONO_HLSB) for
+        a character, converting it on first use. None if the font lacks it.
+        """
+        g = self._cache.get(char)
+        if g is None:
+            buf = self._load(char)
+            if buf is None:
+                return None
+            g = (buf, self.width, self.height, framebuf.MONO_HLSB)
+            self._cache[char] = g
+        return g
+
+    def _load(self, char):
+        """Convert one glyph's row ints to a MONO_HLSB buffer."""
+        rows = self.glyphs.get(char)
+        if rows is None:
+            return None
+        stride = self._stride
+        shift = stride * 8 - self.width
+        buf = bytearray(stride * self.height)
+        i = 0
+        for bits in rows:
+            bits <<= shift
+            for b in range(stride - 1, -1, -1):
+                buf[i] = (bits >> (8 * b)) & 0xFF
+                i += 1
+        return buf
+
+    @profiler.timed('font.draw_char')
+    def draw_char(self, lcd, char, x, y, color):
+        """Draw one character; returns the character width."""
+        g = self.glyph(char)
+        if g is not None:
+            pal, key = _palette(color)
+            lcd.blit(g, x, y, key, pal)
+        return self.width
+
+    @profiler.timed('font.draw_text')
+    def draw_text(self, lcd, text, x, y, color, spacing=2):
+        """Draw text; returns the total width drawn."""
+        pal, key = _palette(color)
+        step = self.width + spacing
+        current_x = x
+        for char in text:
+            g = self.glyph(char)
+            if g is not None:
+                lcd.blit(g, current_x, y, key, pal)
+            current_x += step
+        return current_x - x
+
+    def text_width(self, text, spacing=2):
+        """Width of text in pixels."""
+        if not text:
+            return 0
+        return (self.width * len(text)) + (spacing * (len(text) - 1))
+
+
+class PackedFont(BitmapFont):
+    """
+    Bitmap font read from a packed .bfnt file.
+
+    Only the header and character index are read when the font is opened;
+    each glyph is read from flash with readinto() the first time it is drawn.
+
+    Example:
+        font = PackedFont('font_24x48.bfnt')
+        font.draw_text(lcd, "21", 72, 70, lcd.white, spacing=3)
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Path of a .bfnt file written by make_fonts.py
+        """
+        with open(path, 'rb') as f:
+            header = f.read(FONT_HEADER_SIZE)
+            magic, version, width, height, count, size = struct.unpack(FONT_HEADER, header)
+            if magic != FONT_MAGIC or version != FONT_VERSION:
+                raise ValueError("Not a packed font: " + path)
+            index = f.read(count)
+        super().__init__(None, width, height)
+        self.path = path
+        self._size = size
+        self._index = index
+        self._data = FONT_HEADER_SIZE + count
+
+    def _load(self, char):
+        """Read one glyph's MONO_HLSB buffer from the font file."""
+        code = ord(char)
+        if code > 255:
+            return None
+        i = self._index.find(bytes((code,)))
+        if i < 0:
+            return None
+        buf = bytearray(self._size)
+        with open(self.path, 'rb') as f:
+            f.seek(self._data + i * self._size)
+            f.readinto(buf)
+        return buf
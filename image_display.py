@@ -1,5 +1,36 @@
 # Image Display Utilities for Waveshare RP2350 Display
 # Provides functions for displaying images as backgrounds with text/graphics overlay
+#
+# Raw image files (.rgb565, written by convert_image.py) hold the framebuffer
+# bytes behind a small header, so a background can be read from flash without
+# importing image_data.py and keeping its bytes literals in RAM:
+#
+#   offset  size        field
+#   0       4           magic b'R565'
+#   4       1           version (1)
+#   5       1           encoding (0 = raw pixels, 1 = run-length)
+#   6       2           width in pixels (little-endian)
+#   8       2           height in pixels (little-endian)
+#   10      ...         pixels, BRG565 little-endian, rows top to bottom
+#
+# Raw files hold w*h*2 pixel bytes. Run-length files hold packets that run
+# on across row ends, each starting with a control byte c:
+#
+#   0x00-0x7F   c+1 literal pixels follow (2 bytes each)
+#   0x80-0xBF   one pixel follows, repeated (c & 0x3F)+1 times
+#   0xC0-0xFF   a count byte n and one pixel follow, repeated
+#               ((c & 0x3F) << 8 | n)+1 times
+
+import framebuf
+import struct
+
+IMAGE_MAGIC = b'R565'
+IMAGE_VERSION = 1
+IMAGE_HEADER = '<4sBBHH'
+IMAGE_HEADER_SIZE = 10
+IMAGE_RAW = 0
+IMAGE_RLE = 1
+
 
 def load_image_to_framebuffer(lcd, image_data):
     """
@@ -8,6 +39,7 @@ def load_image_to_framebuffer(lcd, image_data):
     Args:
         lcd: LCD_1inch28 instance
         image_data: bytes object OR tuple of bytes chunks (total 115,200 bytes for 240x240 RGB565)
+                    OR path of a .rgb565 file, read with load_image_file()
 
     Returns:
         True if successful, False otherwise
@@ -18,6 +50,10 @@ def load_image_to_framebuffer(lcd, image_data):
         load_image_to_framebuffer(lcd, img)
         lcd.show()
     """
+    # Handle image files on flash
+    if isinstance(image_data, str):
+        return load_image_file(lcd, image_data)
+
     # Handle chunked image data (tuple of bytes objects)
     if isinstance(image_data, tuple):
         # Calculate total size
@@ -26,14 +62,15 @@ def load_image_to_framebuffer(lcd, image_data):
             print(f"Error: Image data must be 115,200 bytes, got {total_size}")
             return False
 
-        # Copy chunks sequentially to framebuffer
+        # Copy chunks sequentially to framebuffer, one slice assignment each
+        mv = memoryview(lcd.buffer)
         offset = 0
         for chunk in image_data:
-            chunk_len = len(chunk)
-            for i in range(chunk_len):
-                lcd.buffer[offset + i] = chunk[i]
-            offset += chunk_len
+            end = offset + len(chunk)
+            mv[offset:end] = chunk
+            offset = end
 
+        lcd.mark_dirty(0, 0, lcd.width, lcd.height)
         return True
 
     # Handle single bytes object (original format)
@@ -50,6 +87,239 @@ def load_image_to_framebuffer(lcd, image_data):
         for i in range(len(image_data)):
             lcd.buffer[i] = image_data[i]
 
+    lcd.mark_dirty(0, 0, lcd.width, lcd.height)
+    return True
+
+
+def read_image_header(f):
+    """
+    Read the header of an open .rgb565 file.
+
+    Args:
+        f: File opened in binary mode, positioned at the start
+
+    Returns:
+        (width, height, encoding); the file is left at the first pixel
+
+    Raises:
+        ValueError if the file is not a .rgb565 image
+    """
+    header = f.read(IMAGE_HEADER_SIZE)
+    if len(header) != IMAGE_HEADER_SIZE:
+        raise ValueError("Not an .rgb565 image")
+    magic, version, encoding, width, height = struct.unpack(IMAGE_HEADER, header)
+    if magic != IMAGE_MAGIC or version != IMAGE_VERSION:
+        raise ValueError("Not an .rgb565 image")
+    return width, height, encoding
+
+
+class _RLEDecoder:
+    """
+    Decodes the run-length pixel stream of an open .rgb565 file.
+
+    decode() can be called repeatedly to fill consecutive bands; a packet
+    that runs past the end of one band carries on into the next.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self._ctl = bytearray(1)
+        self._arg = bytearray(3)
+        self._arg_mv = memoryview(self._arg)
+        self._left = 0
+        self._run = False
+        self._color = 0
+
+    def decode(self, buf, width, count):
+        """
+        Decode the next `count` pixels into an RGB565 buffer.
+
+        Args:
+            buf: bytearray holding whole rows `width` pixels wide
+            width: Row width in pixels
+            count: Number of pixels to decode, from the start of buf
+
+        Returns:
+            Number of pixels decoded, less than count if the file ends early
+        """
+        f = self._f
+        fb = framebuf.FrameBuffer(buf, width, len(buf) // (width * 2), framebuf.RGB565)
+        mv = memoryview(buf)
+        arg = self._arg
+        left = self._left
+        pos = 0
+        while pos < count:
+            if not left:
+                if not f.readinto(self._ctl):
+                    break
+                c = self._ctl[0]
+                if c < 0x80:
+                    left = c + 1
+                    self._run = False
+                elif c < 0xC0:
+                    f.readinto(self._arg_mv[:2])
+                    left = (c & 0x3F) + 1
+                    self._color = arg[0] | (arg[1] << 8)
+                    self._run = True
+                else:
+                    f.readinto(arg)
+                    left = ((c & 0x3F) << 8 | arg[0]) + 1
+                    self._color = arg[1] | (arg[2] << 8)
+                    self._run = True
+
+            n = min(left, count - pos)
+            if self._run:
+                # Fill the run row by row
+                x = pos % width
+                y = pos // width
+                todo = n
+                while todo:
+                    w = min(width - x, todo)
+                    fb.hline(x, y, w, self._color)
+                    todo -= w
+                    x = 0
+                    y += 1
+            elif f.readinto(mv[pos * 2:(pos + n) * 2]) != n * 2:
+                break
+            pos += n
+            left -= n
+
+        self._left = left
+        return pos
+
+
+def load_image_file(lcd, path):
+    """
+    Read a full-screen .rgb565 file straight into the LCD framebuffer.
+
+    Raw pixels go from flash into lcd.buffer with readinto(), and run-length
+    files are decoded in place, so no copy of the image is held in RAM. The
+    whole screen is marked dirty.
+
+    Args:
+        lcd: LCD_1inch28 instance
+        path: Path of a 240x240 .rgb565 file written by convert_image.py
+
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        load_image_file(lcd, 'background1.rgb565')
+        lcd.show()
+    """
+    with open(path, 'rb') as f:
+        width, height, encoding = read_image_header(f)
+        if (width, height) != (lcd.width, lcd.height):
+            print(f"Error: {path} is not a {lcd.width}x{lcd.height} image")
+            return False
+        if encoding == IMAGE_RAW:
+            n = f.readinto(lcd.buffer)
+        elif encoding == IMAGE_RLE:
+            n = _RLEDecoder(f).decode(lcd.buffer, width, width * height) * 2
+        else:
+            print(f"Error: {path} uses unsupported encoding {encoding}")
+            return False
+
+    if n != len(lcd.buffer):
+        print(f"Error: Image data must be {len(lcd.buffer):,} bytes, got {n}")
+        return False
+
+    lcd.mark_dirty(0, 0, lcd.width, lcd.height)
+    return True
+
+
+def stream_image_file(lcd, path, x=0, y=0, band_rows=16):
+    """
+    Send a .rgb565 file to the panel band by band, bypassing the framebuffer.
+
+    Only a band of `band_rows` rows is held in RAM at a time; run-length
+    files are decoded into the band before it is sent. lcd.buffer is
+    not changed, so a later show() or flush() will draw over the image; use
+    load_image_file() when overlays are drawn on top of the background.
+
+    Args:
+        lcd: LCD_1inch28 instance
+        path: Path of a .rgb565 file written by convert_image.py
+        x: Left edge on screen (default 0)
+        y: Top edge on screen (default 0)
+        band_rows: Rows read and sent per SPI transfer (default 16)
+
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        stream_image_file(lcd, 'background1.rgb565')
+    """
+    with open(path, 'rb') as f:
+        width, height, encoding = read_image_header(f)
+        if encoding == IMAGE_RLE:
+            decoder = _RLEDecoder(f)
+        elif encoding != IMAGE_RAW:
+            print(f"Error: {path} uses unsupported encoding {encoding}")
+            return False
+        if x < 0 or y < 0 or x + width > lcd.width or y + height > lcd.height:
+            print(f"Error: {width}x{height} image does not fit at ({x}, {y})")
+            return False
+
+        band = bytearray(width * 2 * min(band_rows, height))
+        mv = memoryview(band)
+        remaining = width * 2 * height
+
+        lcd.setWindows(x, y, x + width, y + height)
+        lcd.cs(1)
+        lcd.dc(1)
+        lcd.cs(0)
+        while remaining:
+            n = min(len(band), remaining)
+            if encoding == IMAGE_RAW:
+                n = f.readinto(mv[:n])
+            else:
+                n = decoder.decode(band, width, n // 2) * 2
+            if not n:
+                break
+            lcd.spi.write(mv[:n])
+            remaining -= n
+        lcd.cs(1)
+
+    if remaining:
+        print(f"Error: {path} is truncated")
+        return False
+    return True
+
+
+def stream_image_data(lcd, image_data):
+    """
+    Send full-screen image data straight to the panel, bypassing the framebuffer.
+
+    Each chunk goes out as one SPI write, so nothing is copied. As with
+    stream_image_file(), lcd.buffer is not changed and a later show() or
+    flush() will draw over the image.
+
+    Args:
+        lcd: LCD_1inch28 instance
+        image_data: bytes object OR tuple of bytes chunks (total 115,200 bytes)
+
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        from image_data import get_image
+        stream_image_data(lcd, get_image('background1'))
+    """
+    if not isinstance(image_data, tuple):
+        image_data = (image_data,)
+    total_size = sum(len(chunk) for chunk in image_data)
+    if total_size != len(lcd.buffer):
+        print(f"Error: Image data must be {len(lcd.buffer):,} bytes, got {total_size}")
+        return False
+
+    lcd.setWindows(0, 0, lcd.width, lcd.height)
+    lcd.cs(1)
+    lcd.dc(1)
+    lcd.cs(0)
+    for chunk in image_data:
+        lcd.spi.write(chunk)
+    lcd.cs(1)
     return True
 
 
@@ -59,7 +329,7 @@ def display_image_background(lcd, image_data, show=True):
 
     Args:
         lcd: LCD_1inch28 instance
-        image_data: bytes object with image data
+        image_data: bytes object with image data, or path of a .rgb565 file
         show: If True, call lcd.show() to display immediately (default True)
 
     Returns:
@@ -85,7 +355,7 @@ def display_image_with_text(lcd, image_data, text_items, show=True):
 
     Args:
         lcd: LCD_1inch28 instance
-        image_data: bytes object with image data
+        image_data: bytes object with image data, or path of a .rgb565 file
         text_items: List of tuples (text, x, y, color, size)
                    size can be 1-5 for write_text, or None for standard 8x8 text
         show: If True, call lcd.show() after drawing (default True)
@@ -131,7 +401,7 @@ def display_image_with_gauge(lcd, image_data, gauge, gauge_value, show=True):
 
     Args:
         lcd: LCD_1inch28 instance
-        image_data: bytes object with image data
+        image_data: bytes object with image data, or path of a .rgb565 file
         gauge: CircularGauge instance
         gauge_value: Value to display on gauge (0-100)
         show: If True, call lcd.show() after drawing (default True)
@@ -168,7 +438,7 @@ def display_image_with_bitmap_text(lcd, image_data, bitmap_font_module, text, x,
 
     Args:
         lcd: LCD_1inch28 instance
-        image_data: bytes object with image data
+        image_data: bytes object with image data, or path of a .rgb565 file
         bitmap_font_module: Imported bitmap font module (bitmap_fonts, bitmap_fonts_32, or bitmap_fonts_48)
         text: Text string to display
         x: X coordinate
@@ -216,7 +486,7 @@ def display_image_with_overlays(lcd, image_data, text_items=None, gauge_items=No
 
     Args:
         lcd: LCD_1inch28 instance
-        image_data: bytes object with image data
+        image_data: bytes object with image data, or path of a .rgb565 file
         text_items: Optional list of text tuples (text, x, y, color, size)
         gauge_items: Optional list of gauge tuples (gauge_instance, value)
         show: If True, call lcd.show() after drawing (default True)
@@ -3,9 +3,7 @@
 
 from LCD_1inch28 import LCD_1inch28
 from circular_gauge import CircularGauge, rgb_to_brg565
-from image_data import get_image, get_image_names, get_image_count
-from image_display import (display_image_background, display_image_with_text,
-                           display_image_with_gauge, display_image_with_overlays)
+from image_display import display_image_with_overlays
 import time
 
 print("=== Image Display Test ===")
@@ -14,14 +12,8 @@ print("=== Image Display Test ===")
 lcd = LCD_1inch28()
 lcd.set_bl_pwm(65535)  # Maximum brightness
 
-# Check if any images are available
-image_count = get_image_count()
-print(f"Found {image_count} image(s)")
-
-
-
-img_name = get_image_names()[0]
-img_data = get_image(img_name)
+# Background is read from flash into the framebuffer, image_data.py is not imported
+img_data = 'background1.rgb565'
 
 # Create two small gauges
 gauge1 = CircularGauge(
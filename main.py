@@ -2,9 +2,18 @@ from machine import UART, Pin, RTC
 from LCD_1inch28 import LCD_1inch28, Touch_CST816T
 import time
 import json
-import bitmap_fonts
-import bitmap_fonts_32
-import bitmap_fonts_48
+from array import array
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+import profiler
+from font_engine import PackedFont
+
+# Bitmap fonts (packed by make_fonts.py, glyphs read from flash on first use)
+font_16x24 = PackedFont("font_16x24.bfnt")
+font_24x32 = PackedFont("font_24x32.bfnt")
+font_24x48 = PackedFont("font_24x48.bfnt")
 
 # Initialize UART
 uart = UART(0, baudrate=115200, tx=Pin(16), rx=Pin(17))
@@ -13,11 +22,15 @@ uart = UART(0, baudrate=115200, tx=Pin(16), rx=Pin(17))
 rtc = RTC()
 
 # Initialize display
-lcd = LCD_1inch28()
+# Double buffered: draw the next frame while the last one is sent in the background
+lcd = LCD_1inch28(double_buffer=True)
 lcd.set_bl_pwm(65535)  # Set brightness to maximum
 
 # Initialize touch controller
 touch = Touch_CST816T(mode=1, LCD=lcd)  # Mode 1 = point mode
+# Set by the touch IRQ, awaited by touch_events()
+touch_flag = asyncio.ThreadSafeFlag()
+touch.event = touch_flag
 
 # Display welcome message
 lcd.fill(lcd.white)
@@ -34,11 +47,19 @@ time.sleep(2)
 current_brightness = 100
 current_mode = "Clock"
 display_color = lcd.black
+clock_face_shown = False  # True while the Clock mode face is on screen
 
 # Custom mode cycling
 custom_sub_modes = ["Clock", "Weather", "Bedroom"]
 current_custom_index = 0
 
+# Timer periods in seconds
+CYCLE_INTERVAL = 10      # Cycle mode: time on each sub-mode
+TELEMETRY_INTERVAL = 10  # SENSOR: reports to Home Assistant
+
+# Set by SETTIME so clock_timer() re-aims at the new minute boundary
+clock_reset = asyncio.Event()
+
 # Weather data
 weather_condition = "N/A"
 weather_temp = "N/A"
@@ -54,130 +75,312 @@ hive_target_temp = "N/A"
 hive_heating_status = "OFF"
 hive_hotwater_status = "OFF"
 
-def process_command(cmd_line):
-    """Process incoming commands from Home Assistant via ESP32"""
-    global current_brightness, current_mode, display_color, weather_condition, weather_temp, weather_humidity
-    global hive_current_temp, hive_target_temp, hive_heating_status, hive_hotwater_status
-    global bedroom_temp, bedroom_humidity
+# Touch debounce
+last_touch_time = 0
 
-    try:
-        print(f"Received command: {cmd_line}")
-        if cmd_line.startswith(b'MSG:'):
-            # Display a text message
-            message = cmd_line[4:].decode().strip()
-            lcd.fill(lcd.white)
-            lcd.text(message, 60, 120, display_color)
-            lcd.show()
-            print(f"Displayed: {message}")
-            
-        elif cmd_line.startswith(b'BRIGHT:'):
-            # Adjust brightness
-            brightness = int(cmd_line[7:].decode().strip())
-            current_brightness = brightness
-            lcd.set_bl_pwm(int(brightness * 65535 / 100))
-            print(f"Brightness set to: {brightness}%")
-            
-        elif cmd_line.startswith(b'MODE:'):
-            # Change display mode
-            mode = cmd_line[5:].decode().strip()
-            current_mode = mode
-            print(f"Mode changed to: {mode}")
-            update_display_for_mode(mode)
-            
-        elif cmd_line.startswith(b'CMD:CLEAR'):
-            # Clear display
-            lcd.fill(lcd.white)
-            lcd.show()
+# Profiler counters (see profiler.py; reported by the STATS command)
+TOUCH_EVENTS = profiler.counter('touch.events')
+TOUCH_IGNORED = profiler.counter('touch.ignored')
+
+# Print every received command, touch and Cycle mode change (off: printing
+# over USB serial costs more than handling most of them)
+DEBUG = False
+
+def _space(c):
+    """True for the whitespace bytes.strip() removes (9 to 13 and space)"""
+    # Compare values: MicroPython's 'int in bytes' raises TypeError
+    return c == 32 or 9 <= c <= 13
+
+# Field boundaries of the current command's arguments, filled by _split():
+# field i runs from _bounds[i] + 1 to _bounds[i + 1] and the arguments end
+# at _bounds[_ARGS_END], all offsets into the command line. The handlers
+# read the fields from the line through these, without slicing it.
+_MAX_FIELDS = 8
+_ARGS_END = _MAX_FIELDS + 1
+_bounds = array('h', bytearray(2 * (_MAX_FIELDS + 2)))
+
+def _split(line, start, end):
+    """Find the comma-separated fields of line[start:end]; returns their count"""
+    bounds = _bounds
+    bounds[0] = start - 1
+    bounds[_ARGS_END] = end
+    n = 1
+    i = line.find(b',', start, end)
+    while i >= 0:
+        if n == _MAX_FIELDS:
+            return n + 1  # Too many fields for any command
+        bounds[n] = i
+        n += 1
+        i = line.find(b',', i + 1, end)
+    bounds[n] = end
+    return n
+
+def _int(line, field=0):
+    """Parse a field of the args as an optionally signed decimal integer"""
+    i = _bounds[field] + 1
+    end = _bounds[field + 1]
+    # Whitespace around the number is allowed, as int() allows it
+    while i < end and _space(line[i]):
+        i += 1
+    while end > i and _space(line[end - 1]):
+        end -= 1
+    sign = 1
+    if i < end and line[i] == 45:  # '-'
+        sign = -1
+        i += 1
+    if i == end:
+        raise ValueError("invalid integer")
+    n = 0
+    while i < end:
+        d = line[i] - 48
+        if d < 0 or d > 9:
+            raise ValueError("invalid integer")
+        n = n * 10 + d
+        i += 1
+    return sign * n
+
+def _text(line, field=0):
+    """Decode a field of the args as a UTF-8 string"""
+    return str(line[_bounds[field] + 1:_bounds[field + 1]], 'utf-8')
+
+def _args(line):
+    """Decode all of the args, commas included, as a UTF-8 string"""
+    return str(line[_bounds[0] + 1:_bounds[_ARGS_END]], 'utf-8')
+
+def _starts(line, prefix):
+    """True if the args start with the given bytes"""
+    i = _bounds[0] + 1
+    if _bounds[_ARGS_END] - i < len(prefix):
+        return False
+    for k in range(len(prefix)):
+        if line[i + k] != prefix[k]:
+            return False
+    return True
+
+def _cmd_text(line, fields):
+    # MSG:<text> / DISP:<text> - display a text message
+    global clock_face_shown
+    message = _args(line)
+    clock_face_shown = False
+    lcd.begin_frame()
+    lcd.fill(lcd.white)
+    lcd.text(message, 60, 120, display_color)
+    lcd.end_frame()
+    if DEBUG:
+        print(f"Displayed: {message}")
+
+def _cmd_bright(line, fields):
+    # BRIGHT:<0-100> - adjust brightness
+    global current_brightness
+    brightness = _int(line)
+    current_brightness = brightness
+    lcd.set_bl_pwm(int(brightness * 65535 / 100))
+    if DEBUG:
+        print(f"Brightness set to: {brightness}%")
+
+def _cmd_mode(line, fields):
+    # MODE:<mode_name> - change display mode
+    global current_mode
+    mode = _args(line)
+    current_mode = mode
+    if DEBUG:
+        print(f"Mode changed to: {mode}")
+    update_display_for_mode(mode)
+
+def _cmd_cmd(line, fields):
+    # CMD:CLEAR - clear display, CMD:TIME - show time
+    global clock_face_shown
+    if _starts(line, b'CLEAR'):
+        clock_face_shown = False
+        lcd.begin_frame()
+        lcd.fill(lcd.white)
+        lcd.end_frame()
+        if DEBUG:
             print("Display cleared")
-            
-        elif cmd_line.startswith(b'CMD:TIME'):
-            # Show time (you'd get this from RTC or network)
-            lcd.fill(lcd.white)
-            lcd.text("12:34 PM", 80, 120, lcd.black)
-            lcd.show()
+    elif _starts(line, b'TIME'):
+        # Show time (you'd get this from RTC or network)
+        clock_face_shown = False
+        lcd.begin_frame()
+        lcd.fill(lcd.white)
+        lcd.text("12:34 PM", 80, 120, lcd.black)
+        lcd.end_frame()
+        if DEBUG:
             print("Time displayed")
-            
-        elif cmd_line.startswith(b'DISP:'):
-            # Custom display command
-            data = cmd_line[5:].decode().strip()
-            lcd.fill(lcd.white)
-            lcd.text(data, 60, 120, display_color)
-            lcd.show()
-            print(f"Custom display: {data}")
-            
-        elif cmd_line.startswith(b'COLOR:'):
-            # Set text color (RGB)
-            colors = cmd_line[6:].decode().strip().split(',')
-            r, g, b = int(colors[0]), int(colors[1]), int(colors[2])
-            # Convert RGB888 to RGB565 format (note: uses BRG format due to framebuf)
-            display_color = ((b & 0xF8) << 8) | ((g & 0xFC) << 3) | (r >> 3)
-            print(f"Color set to RGB({r},{g},{b})")
-
-        elif cmd_line.startswith(b'SETTIME:'):
-            # Set RTC time from ESP32
-            # Format: SETTIME:YYYY,MM,DD,HH,MM,SS,WEEKDAY,YEARDAY
-            time_str = cmd_line[8:].decode().strip()
-            time_parts = time_str.split(',')
-            if len(time_parts) == 8:
-                year = int(time_parts[0])
-                month = int(time_parts[1])
-                day = int(time_parts[2])
-                hour = int(time_parts[3])
-                minute = int(time_parts[4])
-                second = int(time_parts[5])
-                weekday = int(time_parts[6])
-                yearday = int(time_parts[7])
-                rtc.datetime((year, month, day, weekday, hour, minute, second, 0))
-                print(f"Time set to: {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}")
-                # Refresh display if in clock mode
-                if current_mode == "Clock":
-                    update_display_for_mode(current_mode)
-
-        elif cmd_line.startswith(b'WEATHER:'):
-            # Update weather data
-            # Format: WEATHER:condition,temperature,humidity
-            weather_str = cmd_line[8:].decode().strip()
-            weather_parts = weather_str.split(',')
-            if len(weather_parts) == 3:
-                weather_condition = weather_parts[0]
-                weather_temp = weather_parts[1]
-                weather_humidity = weather_parts[2]
-                print(f"Weather updated: {weather_condition}, {weather_temp}, {weather_humidity}")
-                # Refresh display if in weather mode
-                if current_mode == "Weather":
-                    update_display_for_mode(current_mode)
-
-        elif cmd_line.startswith(b'HIVE:'):
-            # Update Hive thermostat data
-            # Format: HIVE:current_temp,target_temp,heating_status,hotwater_status
-            hive_str = cmd_line[5:].decode().strip()
-            hive_parts = hive_str.split(',')
-            if len(hive_parts) == 4:
-                hive_current_temp = hive_parts[0]
-                hive_target_temp = hive_parts[1]
-                hive_heating_status = hive_parts[2]
-                hive_hotwater_status = hive_parts[3]
-                print(f"Hive updated: Current={hive_current_temp}, Target={hive_target_temp}, Heating={hive_heating_status}, HotWater={hive_hotwater_status}")
-                # Refresh display if in bedroom mode (kept for backwards compatibility)
-                if current_mode == "Bedroom":
-                    update_display_for_mode(current_mode)
-
-        elif cmd_line.startswith(b'BEDROOM:'):
-            # Update bedroom temperature data
-            # Format: BEDROOM:temperature,humidity
-            bedroom_str = cmd_line[8:].decode().strip()
-            bedroom_parts = bedroom_str.split(',')
-            if len(bedroom_parts) == 2:
-                bedroom_temp = bedroom_parts[0]
-                bedroom_humidity = bedroom_parts[1]
-                print(f"Bedroom updated: Temp={bedroom_temp}, Humidity={bedroom_humidity}")
-                # Refresh display if in bedroom mode
-                if current_mode == "Bedroom":
-                    update_display_for_mode(current_mode)
+
+def _cmd_color(line, fields):
+    # COLOR:<r>,<g>,<b> - set text color (RGB)
+    global display_color
+    if fields < 3:
+        raise ValueError("COLOR needs r,g,b")
+    r, g, b = _int(line, 0), _int(line, 1), _int(line, 2)
+    # Convert RGB888 to RGB565 format (note: uses BRG format due to framebuf)
+    display_color = ((b & 0xF8) << 8) | ((g & 0xFC) << 3) | (r >> 3)
+    if DEBUG:
+        print(f"Color set to RGB({r},{g},{b})")
+
+def _cmd_settime(line, fields):
+    # Set RTC time from ESP32
+    # Format: SETTIME:YYYY,MM,DD,HH,MM,SS,WEEKDAY,YEARDAY
+    if fields == 8:
+        year = _int(line, 0)
+        month = _int(line, 1)
+        day = _int(line, 2)
+        hour = _int(line, 3)
+        minute = _int(line, 4)
+        second = _int(line, 5)
+        weekday = _int(line, 6)
+        _int(line, 7)  # YEARDAY: not used, but must be a number
+        rtc.datetime((year, month, day, weekday, hour, minute, second, 0))
+        clock_reset.set()
+        if DEBUG:
+            print(f"Time set to: {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}")
+        # Refresh display if in clock mode
+        if current_mode == "Clock":
+            update_display_for_mode(current_mode)
+
+def _cmd_weather(line, fields):
+    # Update weather data
+    # Format: WEATHER:condition,temperature,humidity
+    global weather_condition, weather_temp, weather_humidity
+    if fields == 3:
+        weather_condition = _text(line, 0)
+        weather_temp = _text(line, 1)
+        weather_humidity = _text(line, 2)
+        if DEBUG:
+            print(f"Weather updated: {weather_condition}, {weather_temp}, {weather_humidity}")
+        # Refresh display if in weather mode
+        if current_mode == "Weather":
+            update_display_for_mode(current_mode)
+
+def _cmd_hive(line, fields):
+    # Update Hive thermostat data
+    # Format: HIVE:current_temp,target_temp,heating_status,hotwater_status
+    global hive_current_temp, hive_target_temp, hive_heating_status, hive_hotwater_status
+    if fields == 4:
+        hive_current_temp = _text(line, 0)
+        hive_target_temp = _text(line, 1)
+        hive_heating_status = _text(line, 2)
+        hive_hotwater_status = _text(line, 3)
+        if DEBUG:
+            print(f"Hive updated: Current={hive_current_temp}, Target={hive_target_temp}, Heating={hive_heating_status}, HotWater={hive_hotwater_status}")
+        # Refresh display if in bedroom mode (kept for backwards compatibility)
+        if current_mode == "Bedroom":
+            update_display_for_mode(current_mode)
+
+def _cmd_bedroom(line, fields):
+    # Update bedroom temperature data
+    # Format: BEDROOM:temperature,humidity
+    global bedroom_temp, bedroom_humidity
+    if fields == 2:
+        bedroom_temp = _text(line, 0)
+        bedroom_humidity = _text(line, 1)
+        if DEBUG:
+            print(f"Bedroom updated: Temp={bedroom_temp}, Humidity={bedroom_humidity}")
+        # Refresh display if in bedroom mode
+        if current_mode == "Bedroom":
+            update_display_for_mode(current_mode)
+
+def _cmd_stats(line, fields):
+    # Report profiler timings, or clear them with STATS:RESET
+    # Format: STATS:name,calls,min_us,avg_us,max_us per timer,
+    # STATS:name,count per counter, then STATS:END
+    if _starts(line, b'RESET'):
+        profiler.reset()
+        if DEBUG:
+            print("Profiler stats cleared")
+    elif not profiler.ENABLED:
+        uart.write(b"STATS:OFF\n")
+    else:
+        for report_line in profiler.report():
+            uart.write(f"STATS:{report_line}\n".encode())
+        uart.write(b"STATS:END\n")
+
+# Command handlers by name (the part of the line before the first ':').
+# Each gets the whole line and the comma-separated field count of its
+# arguments; _int(), _text() and _args() read them through _bounds.
+COMMANDS = {
+    b'MSG': _cmd_text,
+    b'DISP': _cmd_text,
+    b'BRIGHT': _cmd_bright,
+    b'MODE': _cmd_mode,
+    b'CMD': _cmd_cmd,
+    b'COLOR': _cmd_color,
+    b'SETTIME': _cmd_settime,
+    b'WEATHER': _cmd_weather,
+    b'HIVE': _cmd_hive,
+    b'BEDROOM': _cmd_bedroom,
+    b'STATS': _cmd_stats,
+}
+
+def _key(first, length):
+    """Lookup key of a command name from its first byte and length (< 8)"""
+    return (first & 0x1F) << 3 | length
+
+def _index(commands):
+    # {key: (name, handler)}: finding a handler then needs no slice of the
+    # line, only a startswith() check of the name
+    index = {}
+    for name, handler in commands.items():
+        key = _key(name[0], len(name))
+        if len(name) > 7 or key in index:
+            raise ValueError("command names must differ in first letter or length")
+        index[key] = (name, handler)
+    return index
+
+_HANDLERS = _index(COMMANDS)
+
+@profiler.timed('uart.command')
+def process_command(cmd_line):
+    """Process incoming commands from Home Assistant via ESP32"""
+    try:
+        if DEBUG:
+            print(f"Received command: {cmd_line}")
+        # Arguments run from start to end, without surrounding whitespace
+        end = len(cmd_line)
+        while end > 0 and _space(cmd_line[end - 1]):
+            end -= 1
+        colon = cmd_line.find(b':', 0, end)
+        if colon < 0:
+            colon = start = end  # A name without arguments, e.g. STATS
+        else:
+            start = colon + 1
+            while start < end and _space(cmd_line[start]):
+                start += 1
+        entry = _HANDLERS.get(_key(cmd_line[0], colon)) if 0 < colon < 8 else None
+        if entry is not None and cmd_line.startswith(entry[0]):
+            entry[1](cmd_line, _split(cmd_line, start, end))
+        elif DEBUG:
+            print(f"Unknown command: {cmd_line[:colon]}")
 
     except Exception as e:
         print(f"Error processing command: {e}")
 
+@profiler.timed('touch')
+def handle_touch():
+    """Handle a pending touch: the mode button cycles the display mode"""
+    global last_touch_time
+
+    current_time = time.ticks_ms()
+    # Only process touch if at least 500ms has passed since last touch
+    if time.ticks_diff(current_time, last_touch_time) > 500:
+        touch.Flag = 0  # Reset flag
+        x = touch.X_point
+        y = touch.Y_point
+
+        # Check if touch is in button area (y: 210-240)
+        if y >= 210 and y <= 240:
+            if DEBUG:
+                print(f"Mode button touched at ({x}, {y})")
+            if profiler.ENABLED:
+                profiler.count(TOUCH_EVENTS)
+            cycle_mode()
+            last_touch_time = current_time
+    else:
+        # Reset flag even if we ignore the touch
+        touch.Flag = 0
+        if profiler.ENABLED:
+            profiler.count(TOUCH_IGNORED)
+
 def draw_mode_button(mode):
     """Draw a mode change button at the bottom of the screen"""
     # Button area: bottom 30 pixels (y: 210-240)
@@ -195,52 +398,74 @@ def cycle_mode():
     current_index = modes.index(current_mode)
     next_index = (current_index + 1) % len(modes)
     current_mode = modes[next_index]
-    print(f"Mode changed to: {current_mode}")
+    if DEBUG:
+        print(f"Mode changed to: {current_mode}")
     update_display_for_mode(current_mode)
 
+def draw_clock():
+    """Draw the date, time and AM/PM text of the clock face (no background)"""
+    # Get current time
+    current_time = time.localtime()
+    hour = current_time[3]
+    minute = current_time[4]
+
+    # Get date info
+    year = current_time[0]
+    month = current_time[1]
+    day = current_time[2]
+    weekday = current_time[6]
+
+    # Day names
+    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    day_name = days[weekday]
+
+    # Format time as 12-hour with AM/PM
+    am_pm = "AM" if hour < 12 else "PM"
+    display_hour = hour if hour < 12 else hour - 12
+    if display_hour == 0:
+        display_hour = 12
+
+    # Just the time without AM/PM for larger display
+    time_str = "{:02d}:{:02d}".format(display_hour, minute)
+
+    # Top: Day and date
+    date_str = "{} {}/{}/{}".format(day_name, day, month, year)
+    lcd.text(date_str, 55, 50, lcd.white)
+
+    # Center: Very large time using bitmap font (16x24 per char)
+    # Calculate centering for time string
+    time_width = font_16x24.text_width(time_str, spacing=4)
+    time_x = (240 - time_width) // 2
+    font_16x24.draw_text(lcd, time_str, time_x, 100, lcd.white, spacing=4)
+
+    # AM/PM indicator below time
+    lcd.write_text(am_pm, 100, 155, 2, lcd.white)
+
+def refresh_clock():
+    """Redraw only the clock text areas and present the changed pixels"""
+    if not clock_face_shown:
+        # A message or CMD: screen replaced the face; draw the whole mode
+        update_display_for_mode(current_mode)
+        return
+    lcd.begin_frame()
+
+    # Clear the date line, the time digits and the AM/PM label
+    lcd.fill_rect(40, 50, 160, 8, lcd.black)
+    lcd.fill_rect(60, 100, 120, 24, lcd.black)
+    lcd.fill_rect(100, 155, 32, 16, lcd.black)
+    draw_clock()
+    lcd.end_frame()
+
 def update_display_for_mode(mode):
     """Update display based on selected mode"""
+    global clock_face_shown
+    clock_face_shown = mode == "Clock"
+    lcd.begin_frame()
 
     if mode == "Clock":
         # Black background for clock mode
         lcd.fill(lcd.black)
-
-        # Get current time
-        current_time = time.localtime()
-        hour = current_time[3]
-        minute = current_time[4]
-
-        # Get date info
-        year = current_time[0]
-        month = current_time[1]
-        day = current_time[2]
-        weekday = current_time[6]
-
-        # Day names
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        day_name = days[weekday]
-
-        # Format time as 12-hour with AM/PM
-        am_pm = "AM" if hour < 12 else "PM"
-        display_hour = hour if hour < 12 else hour - 12
-        if display_hour == 0:
-            display_hour = 12
-
-        # Just the time without AM/PM for larger display
-        time_str = "{:02d}:{:02d}".format(display_hour, minute)
-
-        # Top: Day and date
-        date_str = "{} {}/{}/{}".format(day_name, day, month, year)
-        lcd.text(date_str, 55, 50, lcd.white)
-
-        # Center: Very large time using bitmap font (16x24 per char)
-        # Calculate centering for time string
-        time_width = bitmap_fonts.get_text_width(time_str, spacing=4)
-        time_x = (240 - time_width) // 2
-        bitmap_fonts.draw_text(lcd, time_str, time_x, 100, lcd.white, spacing=4)
-
-        # AM/PM indicator below time
-        lcd.write_text(am_pm, 100, 155, 2, lcd.white)
+        draw_clock()
 
     elif mode == "Bedroom":
         # Dark grey background for bedroom mode (RGB 64,64,64 in BRG format)
@@ -254,9 +479,9 @@ def update_display_for_mode(mode):
         lcd.text("Temperature", 75, 60, lcd.white)
         if bedroom_temp != "N/A":
             temp_display = bedroom_temp.replace("°C", "").replace(" C", "").strip()
-            temp_width = bitmap_fonts_32.get_text_width_32(temp_display, spacing=2)
+            temp_width = font_24x32.text_width(temp_display, spacing=2)
             temp_x = (240 - temp_width - 15) // 2
-            bitmap_fonts_32.draw_text_32(lcd, temp_display, temp_x, 90, lcd.white, spacing=2)
+            font_24x32.draw_text(lcd, temp_display, temp_x, 90, lcd.white, spacing=2)
             lcd.text("o", temp_x + temp_width + 2, 92, lcd.white)
             lcd.text("C", temp_x + temp_width + 10, 100, lcd.white)
         else:
@@ -266,9 +491,9 @@ def update_display_for_mode(mode):
         lcd.text("Humidity", 85, 150, lcd.white)
         if bedroom_humidity != "N/A":
             humidity_display = bedroom_humidity.replace("%", "").strip()
-            humidity_width = bitmap_fonts.get_text_width(humidity_display, spacing=2)
+            humidity_width = font_16x24.text_width(humidity_display, spacing=2)
             humidity_x = (240 - humidity_width - 20) // 2
-            bitmap_fonts.draw_text(lcd, humidity_display, humidity_x, 165, lcd.white, spacing=2)
+            font_16x24.draw_text(lcd, humidity_display, humidity_x, 165, lcd.white, spacing=2)
             lcd.text("%", humidity_x + humidity_width + 4, 175, lcd.white)
         else:
             lcd.write_text("--%", 95, 165, 2, 0x7BEF)  # Gray
@@ -283,9 +508,9 @@ def update_display_for_mode(mode):
 
         # Very large temperature in center using 32px bitmap font
         temp_display = weather_temp.replace("°C", "").replace(" C", "").strip()
-        temp_width = bitmap_fonts_48.get_text_width_48(temp_display, spacing=3)
+        temp_width = font_24x48.text_width(temp_display, spacing=3)
         temp_x = (240 - temp_width) // 2
-        bitmap_fonts_48.draw_text_48(lcd, temp_display, temp_x, 70, lcd.white, spacing=3)
+        font_24x48.draw_text(lcd, temp_display, temp_x, 70, lcd.white, spacing=3)
 
         # Degree symbol and C
         lcd.text("o", temp_x + temp_width + 2, 72, lcd.white)
@@ -294,9 +519,9 @@ def update_display_for_mode(mode):
         # Humidity at bottom using 24px bitmap font
         lcd.text("Humidity", 80, 140, lcd.white)
         humidity_display = weather_humidity.replace("%", "").strip()
-        humidity_width = bitmap_fonts.get_text_width(humidity_display, spacing=2)
+        humidity_width = font_16x24.text_width(humidity_display, spacing=2)
         humidity_x = (240 - humidity_width - 20) // 2  # Account for % symbol
-        bitmap_fonts.draw_text(lcd, humidity_display, humidity_x, 155, lcd.white, spacing=2)
+        font_16x24.draw_text(lcd, humidity_display, humidity_x, 155, lcd.white, spacing=2)
         lcd.text("%", humidity_x + humidity_width + 4, 165, lcd.white)
 
     elif mode == "Cycle":
@@ -307,43 +532,7 @@ def update_display_for_mode(mode):
         if sub_mode == "Clock":
             # Black background for clock mode
             lcd.fill(lcd.black)
-
-            # Get current time
-            current_time = time.localtime()
-            hour = current_time[3]
-            minute = current_time[4]
-
-            # Get date info
-            year = current_time[0]
-            month = current_time[1]
-            day = current_time[2]
-            weekday = current_time[6]
-
-            # Day names
-            days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-            day_name = days[weekday]
-
-            # Format time as 12-hour with AM/PM
-            am_pm = "AM" if hour < 12 else "PM"
-            display_hour = hour if hour < 12 else hour - 12
-            if display_hour == 0:
-                display_hour = 12
-
-            # Just the time without AM/PM for larger display
-            time_str = "{:02d}:{:02d}".format(display_hour, minute)
-
-            # Top: Day and date
-            date_str = "{} {}/{}/{}".format(day_name, day, month, year)
-            lcd.text(date_str, 55, 50, lcd.white)
-
-            # Center: Very large time using bitmap font (16x24 per char)
-            # Calculate centering for time string
-            time_width = bitmap_fonts.get_text_width(time_str, spacing=4)
-            time_x = (240 - time_width) // 2
-            bitmap_fonts.draw_text(lcd, time_str, time_x, 100, lcd.white, spacing=4)
-
-            # AM/PM indicator below time
-            lcd.write_text(am_pm, 100, 155, 2, lcd.white)
+            draw_clock()
 
         elif sub_mode == "Weather":
             # Black background for weather mode
@@ -355,9 +544,9 @@ def update_display_for_mode(mode):
 
             # Very large temperature in center using 32px bitmap font
             temp_display = weather_temp.replace("°C", "").replace(" C", "").strip()
-            temp_width = bitmap_fonts_32.get_text_width_32(temp_display, spacing=3)
+            temp_width = font_24x32.text_width(temp_display, spacing=3)
             temp_x = (240 - temp_width) // 2
-            bitmap_fonts_32.draw_text_32(lcd, temp_display, temp_x, 70, lcd.white, spacing=3)
+            font_24x32.draw_text(lcd, temp_display, temp_x, 70, lcd.white, spacing=3)
 
             # Degree symbol and C
             lcd.text("o", temp_x + temp_width + 2, 72, lcd.white)
@@ -366,9 +555,9 @@ def update_display_for_mode(mode):
             # Humidity at bottom using 24px bitmap font
             lcd.text("Humidity", 80, 140, lcd.white)
             humidity_display = weather_humidity.replace("%", "").strip()
-            humidity_width = bitmap_fonts.get_text_width(humidity_display, spacing=2)
+            humidity_width = font_16x24.text_width(humidity_display, spacing=2)
             humidity_x = (240 - humidity_width - 20) // 2
-            bitmap_fonts.draw_text(lcd, humidity_display, humidity_x, 155, lcd.white, spacing=2)
+            font_16x24.draw_text(lcd, humidity_display, humidity_x, 155, lcd.white, spacing=2)
             lcd.text("%", humidity_x + humidity_width + 4, 165, lcd.white)
 
         elif sub_mode == "Bedroom":
@@ -383,9 +572,9 @@ def update_display_for_mode(mode):
             lcd.text("Temperature", 75, 60, lcd.white)
             if bedroom_temp != "N/A":
                 temp_display = bedroom_temp.replace("°C", "").replace(" C", "").strip()
-                temp_width = bitmap_fonts_32.get_text_width_32(temp_display, spacing=2)
+                temp_width = font_24x32.text_width(temp_display, spacing=2)
                 temp_x = (240 - temp_width - 15) // 2
-                bitmap_fonts_32.draw_text_32(lcd, temp_display, temp_x, 90, lcd.white, spacing=2)
+                font_24x32.draw_text(lcd, temp_display, temp_x, 90, lcd.white, spacing=2)
                 lcd.text("o", temp_x + temp_width + 2, 92, lcd.white)
                 lcd.text("C", temp_x + temp_width + 10, 100, lcd.white)
             else:
@@ -395,9 +584,9 @@ def update_display_for_mode(mode):
             lcd.text("Humidity", 85, 150, lcd.white)
             if bedroom_humidity != "N/A":
                 humidity_display = bedroom_humidity.replace("%", "").strip()
-                humidity_width = bitmap_fonts.get_text_width(humidity_display, spacing=2)
+                humidity_width = font_16x24.text_width(humidity_display, spacing=2)
                 humidity_x = (240 - humidity_width - 20) // 2
-                bitmap_fonts.draw_text(lcd, humidity_display, humidity_x, 165, lcd.white, spacing=2)
+                font_16x24.draw_text(lcd, humidity_display, humidity_x, 165, lcd.white, spacing=2)
                 lcd.text("%", humidity_x + humidity_width + 4, 175, lcd.white)
             else:
                 lcd.write_text("--%", 95, 165, 2, 0x7BEF)  # Gray
@@ -405,7 +594,7 @@ def update_display_for_mode(mode):
     # Draw mode button at the bottom
     draw_mode_button(mode)
 
-    lcd.show()
+    lcd.end_frame()
 
 def send_sensor_data():
     """Send sensor data back to Home Assistant"""
@@ -421,53 +610,62 @@ def send_sensor_data():
 update_display_for_mode(current_mode)
 print(f"Switched to {current_mode} mode")
 
-# Main loop
-last_sensor_update = time.ticks_ms()
-last_clock_update = time.ticks_ms()
-last_custom_update = time.ticks_ms()
-last_touch_time = 0
-
-while True:
-    # Check for incoming commands from Home Assistant
-    if uart.any():
-        cmd_line = uart.readline()
+async def uart_reader():
+    """Process command lines from Home Assistant as they arrive"""
+    reader = asyncio.StreamReader(uart)
+    while True:
+        cmd_line = await reader.readline()
         if cmd_line:
-            print(f"Raw UART data received: {cmd_line}")
+            if DEBUG:
+                print(f"Raw UART data received: {cmd_line}")
             process_command(cmd_line)
 
-    # Check for touch events
-    if touch.Flag == 1:
-        current_time = time.ticks_ms()
-        # Only process touch if at least 500ms has passed since last touch
-        if time.ticks_diff(current_time, last_touch_time) > 500:
-            touch.Flag = 0  # Reset flag
-            x = touch.X_point
-            y = touch.Y_point
-
-            # Check if touch is in button area (y: 210-240)
-            if y >= 210 and y <= 240:
-                print(f"Mode button touched at ({x}, {y})")
-                cycle_mode()
-                last_touch_time = current_time
+async def touch_events():
+    """Handle touches as the touch controller's IRQ reports them"""
+    while True:
+        await touch_flag.wait()
+        if touch.Flag == 1:
+            handle_touch()
+
+async def clock_timer():
+    """Refresh the clock at the start of every minute if in clock mode"""
+    while True:
+        try:
+            await asyncio.wait_for(clock_reset.wait(), 60 - time.localtime()[5])
+        except asyncio.TimeoutError:
+            if current_mode == "Clock":
+                refresh_clock()
         else:
-            # Reset flag even if we ignore the touch
-            touch.Flag = 0
+            # SETTIME moved the RTC: sleep to its next minute instead
+            clock_reset.clear()
+
+async def cycle_timer():
+    """Advance Cycle mode to its next sub-mode every CYCLE_INTERVAL seconds"""
+    global current_custom_index
+
+    while True:
+        await asyncio.sleep(CYCLE_INTERVAL)
+        if current_mode == "Cycle":
+            current_custom_index = (current_custom_index + 1) % len(custom_sub_modes)
+            if DEBUG:
+                print(f"Cycle mode cycling to: {custom_sub_modes[current_custom_index]}")
+            update_display_for_mode(current_mode)
+
+async def telemetry_timer():
+    """Send sensor data every TELEMETRY_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(TELEMETRY_INTERVAL)
+        send_sensor_data()
 
-    # Update clock display every minute if in clock mode
-    if current_mode == "Clock" and time.ticks_diff(time.ticks_ms(), last_clock_update) > 60000:
-        update_display_for_mode(current_mode)
-        last_clock_update = time.ticks_ms()
+async def main_tasks():
+    """Run all application tasks (until cancelled or one of them fails)"""
+    await asyncio.gather(uart_reader(), touch_events(), clock_timer(),
+                         cycle_timer(), telemetry_timer())
 
-    # Cycle mode display every 10 seconds
-    if current_mode == "Cycle" and time.ticks_diff(time.ticks_ms(), last_custom_update) > 10000:
-        current_custom_index = (current_custom_index + 1) % len(custom_sub_modes)
-        print(f"Cycle mode cycling to: {custom_sub_modes[current_custom_index]}")
-        update_display_for_mode(current_mode)
-        last_custom_update = time.ticks_ms()
-
-    # Send sensor data periodically (every 10 seconds)
-    if time.ticks_diff(time.ticks_ms(), last_sensor_update) > 10000:
-        send_sensor_data()
-        last_sensor_update = time.ticks_ms()
+def run():
+    """Main loop: run the tasks; the scheduler sleeps until one has work"""
+    asyncio.run(main_tasks())
 
-    time.sleep(0.1)
\ No newline at end of file
+# Main loop (not started when imported, e.g. by the host benchmarks)
+if __name__ == '__main__':
+    run()
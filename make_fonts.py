@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Bitmap Font Packer for Waveshare RP2350 Display
+
+Converts the glyph tables in bitmap_fonts.py, bitmap_fonts_32.py and
+bitmap_fonts_48.py into packed .bfnt files that font_engine.PackedFont reads
+glyph by glyph from flash, so the device never has to import the large
+Python list-of-int modules.
+
+Usage:
+    python make_fonts.py                      # all three built-in fonts
+    python make_fonts.py module.py TABLE W H out.bfnt
+
+The file layout is documented at the top of font_engine.py.
+"""
+
+import ast
+import os
+import struct
+import sys
+
+FONT_MAGIC = b'BFNT'
+FONT_VERSION = 1
+FONT_HEADER = '<4sBBBBH'
+
+# (module, table name, width, height, output file)
+FONTS = [
+    ('bitmap_fonts.py', 'LARGE_DIGITS', 16, 24, 'font_16x24.bfnt'),
+    ('bitmap_fonts_32.py', 'LARGE_DIGITS_32', 24, 32, 'font_24x32.bfnt'),
+    ('bitmap_fonts_48.py', 'LARGE_DIGITS_48', 24, 48, 'font_24x48.bfnt'),
+]
+
+
+def read_glyph_table(module_path, table_name):
+    """
+    Read a glyph dict from a font module without importing it.
+
+    Args:
+        module_path: Path to the .py font module
+        table_name: Name of the dict assigned in the module
+
+    Returns:
+        dict of char -> list of row ints
+    """
+    with open(module_path) as f:
+        tree = ast.parse(f.read(), module_path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == table_name for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise KeyError(f"{table_name} not found in {module_path}")
+
+
+def pack_font(glyphs, width, height):
+    """
+    Pack a glyph table into .bfnt bytes.
+
+    Each row is left-aligned and padded to whole bytes (MONO_HLSB), matching
+    the buffers font_engine.BitmapFont builds in RAM.
+    """
+    stride = (width + 7) // 8
+    shift = stride * 8 - width
+    size = stride * height
+    chars = sorted(c for c in glyphs if ord(c) < 256)
+
+    out = bytearray(struct.pack(FONT_HEADER, FONT_MAGIC, FONT_VERSION,
+                                width, height, len(chars), size))
+    out += bytes(ord(c) for c in chars)
+    for c in chars:
+        rows = glyphs[c]
+        if len(rows) != height:
+            raise ValueError(f"Glyph {c!r} has {len(rows)} rows, expected {height}")
+        for bits in rows:
+            out += (bits << shift).to_bytes(stride, 'big')
+    return bytes(out)
+
+
+def make_font(module_path, table_name, width, height, output_path):
+    glyphs = read_glyph_table(module_path, table_name)
+    data = pack_font(glyphs, width, height)
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    print(f"{output_path}: {len(glyphs)} glyphs, {width}x{height}, {len(data):,} bytes")
+
+
+def main():
+    if len(sys.argv) == 6:
+        module_path, table_name, width, height, output_path = sys.argv[1:]
+        make_font(module_path, table_name, int(width), int(height), output_path)
+    elif len(sys.argv) == 1:
+        here = os.path.dirname(os.path.abspath(__file__))
+        for module, table_name, width, height, output in FONTS:
+            make_font(os.path.join(here, module), table_name, width, height,
+                      os.path.join(here, output))
+    else:
+        print("Usage: python make_fonts.py [<module.py> <TABLE> <width> <height> <out.bfnt>]",
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
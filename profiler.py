@@ -0,0 +1,183 @@
+# Lightweight Profiler for the RP2350 Display
+# Scoped ticks_us timers and event counters for the hot paths (display
+# presents, font drawing, gauge drawing, UART commands, touch). Samples go
+# into arrays allocated once at import, so recording never allocates; each
+# timer keeps its last WINDOW samples for a rolling min/avg/max.
+#
+# Profiling is on when a file named profile.flag is on the device's flash
+# at boot (mpremote fs touch :profile.flag, then reset). This module is
+# imported by LCD_1inch28 before anything is decorated, so the switch is
+# read in time. Disabled, timed() returns the function unchanged and count()
+# is never called, so the instrumented code runs exactly as before.
+#
+# Usage:
+#     import profiler
+#
+#     @profiler.timed('gauge.draw')
+#     def draw(self): ...
+#
+#     TOUCHES = profiler.counter('touch.events')
+#     if profiler.ENABLED:
+#         profiler.count(TOUCHES)
+#
+#     for line in profiler.report():
+#         print(line)
+
+import os
+import time
+from array import array
+
+PROFILE_FLAG = 'profile.flag'  # Create this file to profile from boot
+
+
+def _flag_present():
+    try:
+        os.stat(PROFILE_FLAG)
+        return True
+    except OSError:
+        return False
+
+
+# True records timings; False costs nothing. Read once, at import: it must
+# be decided before LCD_1inch28, font_engine, circular_gauge or main.py
+# are imported (the host benchmarks set it directly)
+ENABLED = _flag_present()
+
+MAX_TIMERS = 16   # Named timers that can be registered
+MAX_COUNTERS = 8  # Named counters that can be registered
+WINDOW = 32       # Samples kept per timer for min/avg/max
+
+# Timer storage: WINDOW samples per timer in microseconds, the next sample
+# position, and the number of samples recorded since the last reset
+_samples = array('i', bytearray(4 * MAX_TIMERS * WINDOW))
+_next = array('i', bytearray(4 * MAX_TIMERS))
+_calls = array('i', bytearray(4 * MAX_TIMERS))
+_timer_names = []
+
+_counts = array('i', bytearray(4 * MAX_COUNTERS))
+_counter_names = []
+
+
+def timer(name):
+    """
+    Register a timer.
+
+    Args:
+        name: Label used in reports, e.g. 'lcd.show'
+
+    Returns:
+        Timer id to pass to record(); registering a name twice returns
+        the same id
+    """
+    if name in _timer_names:
+        return _timer_names.index(name)
+    if len(_timer_names) >= MAX_TIMERS:
+        raise ValueError("profiler: more than %d timers" % MAX_TIMERS)
+    _timer_names.append(name)
+    return len(_timer_names) - 1
+
+
+def counter(name):
+    """
+    Register a counter.
+
+    Args:
+        name: Label used in reports, e.g. 'uart.commands'
+
+    Returns:
+        Counter id to pass to count()
+    """
+    if name in _counter_names:
+        return _counter_names.index(name)
+    if len(_counter_names) >= MAX_COUNTERS:
+        raise ValueError("profiler: more than %d counters" % MAX_COUNTERS)
+    _counter_names.append(name)
+    return len(_counter_names) - 1
+
+
+def record(slot, us):
+    """Add one sample of us microseconds to a timer (no allocation)."""
+    i = _next[slot]
+    _samples[slot * WINDOW + i] = us
+    i += 1
+    _next[slot] = 0 if i == WINDOW else i
+    _calls[slot] += 1
+
+
+def count(slot, n=1):
+    """Add n to a counter."""
+    _counts[slot] += n
+
+
+def timed(name):
+    """
+    Decorator timing every call of a function or method with ticks_us.
+
+    With profiling disabled the function is returned as is.
+
+    Args:
+        name: Timer label
+    """
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+        slot = timer(name)
+        ticks_us = time.ticks_us
+        ticks_diff = time.ticks_diff
+
+        def wrapper(*args, **kwargs):
+            t0 = ticks_us()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(slot, ticks_diff(ticks_us(), t0))
+        return wrapper
+    return decorate
+
+
+def stats(slot):
+    """
+    Rolling statistics of a timer.
+
+    Returns:
+        (calls, min_us, avg_us, max_us) over the last WINDOW samples;
+        calls counts every sample since the last reset
+    """
+    calls = _calls[slot]
+    n = calls if calls < WINDOW else WINDOW
+    if not n:
+        return 0, 0, 0, 0
+    base = slot * WINDOW
+    lo = hi = total = _samples[base]
+    for i in range(base + 1, base + n):
+        v = _samples[i]
+        total += v
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    return calls, lo, total // n, hi
+
+
+def report():
+    """
+    Lines describing every timer and counter, as sent for a STATS command.
+
+    Timers: "<name>,<calls>,<min_us>,<avg_us>,<max_us>"
+    Counters: "<name>,<count>"
+    """
+    lines = []
+    for slot, name in enumerate(_timer_names):
+        lines.append("%s,%d,%d,%d,%d" % ((name,) + stats(slot)))
+    for slot, name in enumerate(_counter_names):
+        lines.append("%s,%d" % (name, _counts[slot]))
+    return lines
+
+
+def reset():
+    """Clear all samples and counts (registrations are kept)."""
+    for i in range(MAX_TIMERS):
+        _next[i] = 0
+        _calls[i] = 0
+    for i in range(MAX_COUNTERS):
+        _counts[i] = 0
@@ -0,0 +1,79 @@
+# Host Simulator for the Waveshare RP2350 Display
+# Stand-ins for MicroPython's machine/framebuf/uasyncio modules so the display
+# code (LCD_1inch28, fonts, gauges, main.py) can run under CPython for
+# benchmarks.
+#
+# Usage:
+#     import simulator
+#     panel = simulator.install(panel=True)
+#     from LCD_1inch28 import LCD_1inch28
+#     lcd = LCD_1inch28()
+#     ...
+#     panel.save('screen.png')
+
+import sys
+import time
+
+# Panel wiring on the Waveshare RP2350-Touch-LCD-1.28
+PANEL_SPI = 1
+PANEL_DC = 8
+PANEL_CS = 9
+
+
+def _ticks_ms():
+    return time.monotonic_ns() // 1_000_000
+
+
+def _ticks_us():
+    return time.monotonic_ns() // 1_000
+
+
+def _ticks_diff(new, old):
+    return new - old
+
+
+def _ticks_add(ticks, delta):
+    return ticks + delta
+
+
+def _sleep_ms(ms):
+    time.sleep(ms / 1000)
+
+
+def _sleep_us(us):
+    time.sleep(us / 1_000_000)
+
+
+def install(panel=False):
+    """
+    Register the simulated modules in sys.modules.
+
+    Also adds MicroPython's ticks_*/sleep_ms/sleep_us helpers to the time
+    module. Safe to call more than once.
+
+    Args:
+        panel: Attach a virtual GC9A01 to the display's SPI bus, decoding
+               everything sent to it into a panel image (default False;
+               benchmarks that only count bytes can leave it off)
+
+    Returns:
+        The simulator.gc9a01.GC9A01 instance, or None
+    """
+    from simulator import machine, framebuf, uasyncio
+
+    sys.modules['machine'] = machine
+    sys.modules['framebuf'] = framebuf
+    sys.modules['uasyncio'] = uasyncio
+
+    for name, func in (('ticks_ms', _ticks_ms), ('ticks_us', _ticks_us),
+                       ('ticks_diff', _ticks_diff), ('ticks_add', _ticks_add),
+                       ('sleep_ms', _sleep_ms), ('sleep_us', _sleep_us)):
+        if not hasattr(time, name):
+            setattr(time, name, func)
+
+    if not panel:
+        return None
+    from simulator.gc9a01 import GC9A01
+    device = GC9A01(PANEL_DC, PANEL_CS)
+    machine.SPI.devices[PANEL_SPI] = device
+    return device
@@ -0,0 +1,432 @@
+# Simulated framebuf module
+# FrameBuffer with the same memory layout as MicroPython's: RGB565 pixels
+# are stored little-endian, MONO_HLSB rows are byte-padded with the leftmost
+# pixel in the most significant bit. RGB565 drawing and MONO_HLSB/RGB565
+# blit sources go through NumPy views of the buffer, so benchmarks measure
+# the code under test rather than the simulator; other formats use the
+# per-pixel fallbacks.
+
+import numpy as np
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+RGB565 = 1
+GS8 = 6
+
+
+# MicroPython's built-in 8x8 font (extmod/font_petme128_8x8.h), characters
+# 32 to 127, 8 bytes each: one byte per column, least significant bit at the
+# top. text() draws anything outside 32-127 as character 127, like the device
+_FONT = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00'  # 32 space
+    b'\x00\x00\x00\x4f\x4f\x00\x00\x00'  # 33 '!'
+    b'\x00\x07\x07\x00\x00\x07\x07\x00'  # 34 '"'
+    b'\x14\x7f\x7f\x14\x14\x7f\x7f\x14'  # 35 '#'
+    b'\x00\x24\x2e\x6b\x6b\x3a\x12\x00'  # 36 '$'
+    b'\x00\x63\x33\x18\x0c\x66\x63\x00'  # 37 '%'
+    b'\x00\x32\x7f\x4d\x4d\x77\x72\x50'  # 38 '&'
+    b'\x00\x00\x00\x04\x06\x03\x01\x00'  # 39 "'"
+    b'\x00\x00\x1c\x3e\x63\x41\x00\x00'  # 40 '('
+    b'\x00\x00\x41\x63\x3e\x1c\x00\x00'  # 41 ')'
+    b'\x08\x2a\x3e\x1c\x1c\x3e\x2a\x08'  # 42 '*'
+    b'\x00\x08\x08\x3e\x3e\x08\x08\x00'  # 43 '+'
+    b'\x00\x00\x80\xe0\x60\x00\x00\x00'  # 44 ','
+    b'\x00\x08\x08\x08\x08\x08\x08\x00'  # 45 '-'
+    b'\x00\x00\x00\x60\x60\x00\x00\x00'  # 46 '.'
+    b'\x00\x40\x60\x30\x18\x0c\x06\x02'  # 47 '/'
+    b'\x00\x3e\x7f\x49\x45\x7f\x3e\x00'  # 48 '0'
+    b'\x00\x40\x44\x7f\x7f\x40\x40\x00'  # 49 '1'
+    b'\x00\x62\x73\x51\x49\x4f\x46\x00'  # 50 '2'
+    b'\x00\x22\x63\x49\x49\x7f\x36\x00'  # 51 '3'
+    b'\x00\x18\x18\x14\x16\x7f\x7f\x10'  # 52 '4'
+    b'\x00\x27\x67\x45\x45\x7d\x39\x00'  # 53 '5'
+    b'\x00\x3e\x7f\x49\x49\x7b\x32\x00'  # 54 '6'
+    b'\x00\x03\x03\x79\x7d\x07\x03\x00'  # 55 '7'
+    b'\x00\x36\x7f\x49\x49\x7f\x36\x00'  # 56 '8'
+    b'\x00\x26\x6f\x49\x49\x7f\x3e\x00'  # 57 '9'
+    b'\x00\x00\x00\x24\x24\x00\x00\x00'  # 58 ':'
+    b'\x00\x00\x80\xe4\x64\x00\x00\x00'  # 59 ';'
+    b'\x00\x08\x1c\x36\x63\x41\x41\x00'  # 60 '<'
+    b'\x00\x14\x14\x14\x14\x14\x14\x00'  # 61 '='
+    b'\x00\x41\x41\x63\x36\x1c\x08\x00'  # 62 '>'
+    b'\x00\x02\x03\x51\x59\x0f\x06\x00'  # 63 '?'
+    b'\x00\x3e\x7f\x41\x4d\x4f\x2e\x00'  # 64 '@'
+    b'\x00\x7c\x7e\x0b\x0b\x7e\x7c\x00'  # 65 'A'
+    b'\x00\x7f\x7f\x49\x49\x7f\x36\x00'  # 66 'B'
+    b'\x00\x3e\x7f\x41\x41\x63\x22\x00'  # 67 'C'
+    b'\x00\x7f\x7f\x41\x63\x3e\x1c\x00'  # 68 'D'
+    b'\x00\x7f\x7f\x49\x49\x41\x41\x00'  # 69 'E'
+    b'\x00\x7f\x7f\x09\x09\x01\x01\x00'  # 70 'F'
+    b'\x00\x3e\x7f\x41\x49\x7b\x3a\x00'  # 71 'G'
+    b'\x00\x7f\x7f\x08\x08\x7f\x7f\x00'  # 72 'H'
+    b'\x00\x00\x41\x7f\x7f\x41\x00\x00'  # 73 'I'
+    b'\x00\x20\x60\x41\x7f\x3f\x01\x00'  # 74 'J'
+    b'\x00\x7f\x7f\x1c\x36\x63\x41\x00'  # 75 'K'
+    b'\x00\x7f\x7f\x40\x40\x40\x40\x00'  # 76 'L'
+    b'\x00\x7f\x7f\x06\x0c\x06\x7f\x7f'  # 77 'M'
+    b'\x00\x7f\x7f\x0e\x1c\x7f\x7f\x00'  # 78 'N'
+    b'\x00\x3e\x7f\x41\x41\x7f\x3e\x00'  # 79 'O'
+    b'\x00\x7f\x7f\x09\x09\x0f\x06\x00'  # 80 'P'
+    b'\x00\x1e\x3f\x21\x61\x7f\x5e\x00'  # 81 'Q'
+    b'\x00\x7f\x7f\x19\x39\x6f\x46\x00'  # 82 'R'
+    b'\x00\x26\x6f\x49\x49\x7b\x32\x00'  # 83 'S'
+    b'\x00\x01\x01\x7f\x7f\x01\x01\x00'  # 84 'T'
+    b'\x00\x3f\x7f\x40\x40\x7f\x3f\x00'  # 85 'U'
+    b'\x00\x1f\x3f\x60\x60\x3f\x1f\x00'  # 86 'V'
+    b'\x00\x7f\x7f\x30\x18\x30\x7f\x7f'  # 87 'W'
+    b'\x00\x63\x77\x1c\x1c\x77\x63\x00'  # 88 'X'
+    b'\x00\x07\x0f\x78\x78\x0f\x07\x00'  # 89 'Y'
+    b'\x00\x61\x71\x59\x4d\x47\x43\x00'  # 90 'Z'
+    b'\x00\x00\x7f\x7f\x41\x41\x00\x00'  # 91 '['
+    b'\x00\x02\x06\x0c\x18\x30\x60\x40'  # 92 '\\'
+    b'\x00\x00\x41\x41\x7f\x7f\x00\x00'  # 93 ']'
+    b'\x00\x08\x0c\x06\x06\x0c\x08\x00'  # 94 '^'
+    b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'  # 95 '_'
+    b'\x00\x00\x01\x03\x06\x04\x00\x00'  # 96 '`'
+    b'\x00\x20\x74\x54\x54\x7c\x78\x00'  # 97 'a'
+    b'\x00\x7f\x7f\x44\x44\x7c\x38\x00'  # 98 'b'
+    b'\x00\x38\x7c\x44\x44\x6c\x28\x00'  # 99 'c'
+    b'\x00\x38\x7c\x44\x44\x7f\x7f\x00'  # 100 'd'
+    b'\x00\x38\x7c\x54\x54\x5c\x58\x00'  # 101 'e'
+    b'\x00\x08\x7e\x7f\x09\x03\x02\x00'  # 102 'f'
+    b'\x00\x98\xbc\xa4\xa4\xfc\x7c\x00'  # 103 'g'
+    b'\x00\x7f\x7f\x04\x04\x7c\x78\x00'  # 104 'h'
+    b'\x00\x00\x00\x7d\x7d\x00\x00\x00'  # 105 'i'
+    b'\x00\x40\xc0\x80\x80\xfd\x7d\x00'  # 106 'j'
+    b'\x00\x7f\x7f\x30\x38\x6c\x44\x00'  # 107 'k'
+    b'\x00\x00\x41\x7f\x7f\x40\x00\x00'  # 108 'l'
+    b'\x00\x7c\x7c\x18\x30\x18\x7c\x7c'  # 109 'm'
+    b'\x00\x7c\x7c\x04\x04\x7c\x78\x00'  # 110 'n'
+    b'\x00\x38\x7c\x44\x44\x7c\x38\x00'  # 111 'o'
+    b'\x00\xfc\xfc\x24\x24\x3c\x18\x00'  # 112 'p'
+    b'\x00\x18\x3c\x24\x24\xfc\xfc\x00'  # 113 'q'
+    b'\x00\x7c\x7c\x04\x04\x0c\x08\x00'  # 114 'r'
+    b'\x00\x48\x5c\x54\x54\x74\x24\x00'  # 115 's'
+    b'\x00\x04\x04\x3e\x7e\x44\x44\x00'  # 116 't'
+    b'\x00\x3c\x7c\x40\x40\x7c\x7c\x00'  # 117 'u'
+    b'\x00\x1c\x3c\x60\x60\x3c\x1c\x00'  # 118 'v'
+    b'\x00\x1c\x7c\x70\x38\x70\x7c\x1c'  # 119 'w'
+    b'\x00\x44\x6c\x38\x38\x6c\x44\x00'  # 120 'x'
+    b'\x00\x9c\xbc\xa0\xe0\x7c\x3c\x00'  # 121 'y'
+    b'\x00\x44\x64\x74\x5c\x4c\x44\x00'  # 122 'z'
+    b'\x00\x08\x08\x3e\x77\x41\x41\x00'  # 123 '{'
+    b'\x00\x00\x00\xff\xff\x00\x00\x00'  # 124 '|'
+    b'\x00\x41\x41\x77\x3e\x08\x08\x00'  # 125 '}'
+    b'\x00\x02\x03\x01\x03\x02\x03\x01'  # 126 '~'
+    b'\xaa\x55\xaa\x55\xaa\x55\xaa\x55'  # 127 DEL (drawn for any code outside 32-127)
+)
+
+# The same glyphs as (8, 8) boolean masks indexed [row, column]
+_MASKS = [np.array([[(_FONT[i + j] >> k) & 1 for j in range(8)] for k in range(8)], dtype=bool)
+          for i in range(0, len(_FONT), 8)]
+
+
+ELLIPSE_MASK_FILL = 0x10
+ELLIPSE_MASK_ALL = 0x0F
+
+
+def _cdiv(a, b):
+    # Integer division truncating toward zero, as in C
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        if stride is None:
+            stride = width
+        if format == MONO_HLSB or format == MONO_HMSB:
+            stride = (stride + 7) & ~7
+        self.stride = stride
+        # Pixel view sharing the buffer's memory, [row, column]
+        self._px = None
+        if format == RGB565:
+            self._px = np.frombuffer(buffer, dtype='<u2', count=stride * height).reshape(
+                height, stride)
+
+    # -- raw pixel access ------------------------------------------------
+
+    def _get(self, x, y):
+        fmt = self.format
+        if fmt == RGB565:
+            return int(self._px[y, x])
+        if fmt == MONO_HLSB:
+            i = (x + y * self.stride) >> 3
+            return (self.buf[i] >> (7 - (x & 7))) & 1
+        if fmt == MONO_HMSB:
+            i = (x + y * self.stride) >> 3
+            return (self.buf[i] >> (x & 7)) & 1
+        if fmt == MONO_VLSB:
+            i = (y >> 3) * self.stride + x
+            return (self.buf[i] >> (y & 7)) & 1
+        return self.buf[x + y * self.stride]
+
+    def _set(self, x, y, c):
+        fmt = self.format
+        if fmt == RGB565:
+            self._px[y, x] = c & 0xFFFF
+        elif fmt == MONO_HLSB:
+            i = (x + y * self.stride) >> 3
+            bit = 0x80 >> (x & 7)
+            self.buf[i] = (self.buf[i] | bit) if c & 1 else (self.buf[i] & ~bit)
+        elif fmt == MONO_HMSB:
+            i = (x + y * self.stride) >> 3
+            bit = 1 << (x & 7)
+            self.buf[i] = (self.buf[i] | bit) if c & 1 else (self.buf[i] & ~bit)
+        elif fmt == MONO_VLSB:
+            i = (y >> 3) * self.stride + x
+            bit = 1 << (y & 7)
+            self.buf[i] = (self.buf[i] | bit) if c & 1 else (self.buf[i] & ~bit)
+        else:
+            self.buf[x + y * self.stride] = c & 0xFF
+
+    def _values(self):
+        """All pixel values as a (height, width) array, for use as a blit source."""
+        if self.format == RGB565:
+            return self._px[:, :self.width]
+        if self.format == MONO_HLSB:
+            rows = np.frombuffer(self.buf, dtype=np.uint8, count=self.stride // 8 * self.height)
+            bits = np.unpackbits(rows.reshape(self.height, self.stride // 8), axis=1)
+            return bits[:, :self.width]
+        out = np.empty((self.height, self.width), dtype=np.int64)
+        for y in range(self.height):
+            for x in range(self.width):
+                out[y, x] = self._get(x, y)
+        return out
+
+    # -- drawing primitives ----------------------------------------------
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width)
+        y1 = min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if self._px is not None:
+            self._px[y0:y1, x0:x1] = c & 0xFFFF
+            return
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        w, h = self.width, self.height
+        while True:
+            if 0 <= x1 < w and 0 <= y1 < h:
+                self._set(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def _ellipse_points(self, cx, cy, x, y, c, mask):
+        if mask & ELLIPSE_MASK_FILL:
+            if mask & 1:
+                self.fill_rect(cx, cy - y, x + 1, 1, c)
+            if mask & 2:
+                self.fill_rect(cx - x, cy - y, x + 1, 1, c)
+            if mask & 4:
+                self.fill_rect(cx - x, cy + y, x + 1, 1, c)
+            if mask & 8:
+                self.fill_rect(cx, cy + y, x + 1, 1, c)
+        else:
+            if mask & 1:
+                self.pixel(cx + x, cy - y, c)
+            if mask & 2:
+                self.pixel(cx - x, cy - y, c)
+            if mask & 4:
+                self.pixel(cx - x, cy + y, c)
+            if mask & 8:
+                self.pixel(cx + x, cy + y, c)
+
+    def ellipse(self, cx, cy, xr, yr, c, f=False, m=ELLIPSE_MASK_ALL):
+        # Same midpoint algorithm as MicroPython's modframebuf.c
+        mask = (ELLIPSE_MASK_FILL if f else 0) | (m & ELLIPSE_MASK_ALL)
+        if xr == 0 and yr == 0:
+            if mask & ELLIPSE_MASK_ALL:
+                self.pixel(cx, cy, c)
+            return
+        two_asquare = 2 * xr * xr
+        two_bsquare = 2 * yr * yr
+        x, y = xr, 0
+        xchange = yr * yr * (1 - 2 * xr)
+        ychange = xr * xr
+        error = 0
+        stoppingx = two_bsquare * xr
+        stoppingy = 0
+        while stoppingx >= stoppingy:
+            self._ellipse_points(cx, cy, x, y, c, mask)
+            y += 1
+            stoppingy += two_asquare
+            error += ychange
+            ychange += two_asquare
+            if 2 * error + xchange > 0:
+                x -= 1
+                stoppingx -= two_bsquare
+                error += xchange
+                xchange += two_bsquare
+        x, y = 0, yr
+        xchange = yr * yr
+        ychange = xr * xr * (1 - 2 * yr)
+        error = 0
+        stoppingx = 0
+        stoppingy = two_asquare * yr
+        while stoppingx <= stoppingy:
+            self._ellipse_points(cx, cy, x, y, c, mask)
+            x += 1
+            stoppingx += two_bsquare
+            error += xchange
+            xchange += two_bsquare
+            if 2 * error + ychange > 0:
+                y -= 1
+                stoppingy -= two_asquare
+                error += ychange
+                ychange += two_asquare
+
+    def poly(self, x, y, coords, c, f=False):
+        # Same outline and scanline fill as MicroPython's modframebuf.c
+        n = len(coords) // 2
+        if n == 0:
+            return
+        pts = [(coords[2 * i], coords[2 * i + 1]) for i in range(n)]
+        if not f:
+            px1, py1 = pts[0]
+            for px2, py2 in pts[1:] + pts[:1]:
+                self.line(x + px1, y + py1, x + px2, y + py2, c)
+                px1, py1 = px2, py2
+            return
+        ys = [p[1] for p in pts]
+        for row in range(min(ys), max(ys) + 1):
+            nodes = []
+            px1, py1 = pts[0]
+            for i in range(n - 1, -1, -1):
+                px2, py2 = pts[i]
+                if py1 != py2 and ((py1 > row >= py2) or (py1 <= row < py2)):
+                    t = _cdiv(32 * (px2 - px1) * (row - py1), py2 - py1)
+                    nodes.append(_cdiv(32 * px1 + t + 16, 32))
+                elif row == max(py1, py2):
+                    if py1 < py2:
+                        self.pixel(x + px2, y + py2, c)
+                    elif py2 < py1:
+                        self.pixel(x + px1, y + py1, c)
+                    else:
+                        self.line(x + px1, y + py1, x + px2, y + py2, c)
+                px1, py1 = px2, py2
+            nodes.sort()
+            for i in range(0, len(nodes) - 1, 2):
+                self.fill_rect(x + nodes[i], y + row, nodes[i + 1] - nodes[i] + 1, 1, c)
+
+    def text(self, s, x, y, c=1):
+        w, h = self.width, self.height
+        if y >= h or y + 8 <= 0:
+            return
+        ky0 = max(0, -y)
+        ky1 = min(8, h - y)
+        for ch in s:
+            if x >= w:
+                break
+            if x + 8 > 0:
+                code = ord(ch)
+                if code < 32 or code > 127:
+                    code = 127
+                glyph = code - 32
+                kx0 = max(0, -x)
+                kx1 = min(8, w - x)
+                if self._px is not None:
+                    mask = _MASKS[glyph][ky0:ky1, kx0:kx1]
+                    self._px[y + ky0:y + ky1, x + kx0:x + kx1][mask] = c & 0xFFFF
+                else:
+                    base = glyph * 8
+                    for j in range(kx0, kx1):
+                        for k in range(ky0, ky1):
+                            if _FONT[base + j] & (1 << k):
+                                self._set(x + j, y + k, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + fbuf.width, self.width)
+        y1 = min(y + fbuf.height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        src = fbuf._values()[y0 - y:y1 - y, x0 - x:x1 - x]
+        if palette is not None:
+            src = palette._values()[0][src]
+        if self._px is not None:
+            dst = self._px[y0:y1, x0:x1]
+            if key == -1:
+                dst[...] = src
+            else:
+                keep = src != key
+                dst[keep] = src[keep]
+            return
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                col = int(src[yy - y0, xx - x0])
+                if col != key:
+                    self._set(xx, yy, col)
+
+    def scroll(self, xstep, ystep):
+        w, h = self.width, self.height
+        if self._px is not None:
+            if abs(xstep) >= w or abs(ystep) >= h:
+                return
+            px = self._px
+            dy0, sy0 = max(ystep, 0), max(-ystep, 0)
+            dx0, sx0 = max(xstep, 0), max(-xstep, 0)
+            px[dy0:h - sy0, dx0:w - sx0] = px[sy0:h - dy0, sx0:w - dx0].copy()
+            return
+        rows = range(h - 1, -1, -1) if ystep > 0 else range(h)
+        cols = range(w - 1, -1, -1) if xstep > 0 else range(w)
+        for yy in rows:
+            sy = yy - ystep
+            if not 0 <= sy < h:
+                continue
+            for xx in cols:
+                sx = xx - xstep
+                if 0 <= sx < w:
+                    self._set(xx, yy, self._get(sx, sy))
@@ -0,0 +1,144 @@
+# Virtual GC9A01 panel
+# Decodes the byte stream LCD_1inch28 sends over SPI: bytes written while
+# DC is low are commands, bytes written while DC is high are their
+# parameters. CASET/RASET set the address window and RAMWR data fills it
+# row by row, so gram ends up holding what the real panel would show.
+
+import numpy as np
+
+from simulator.machine import Pin
+
+CASET = 0x2A
+RASET = 0x2B
+RAMWR = 0x2C
+RAMWRC = 0x3C
+
+
+class GC9A01:
+    """
+    Panel model attached to an SPI bus through machine.SPI.devices.
+
+    gram holds the panel's pixels as 16-bit words in the byte order they
+    arrive, which is the framebuffer's little-endian order, so after a
+    show() gram.tobytes() equals the LCD buffer.
+
+    Attributes:
+        gram: (height, width) uint16 array of panel pixels
+        commands: Dict of command byte -> number of times received
+        pixel_bytes: Bytes written to GRAM
+        windows: Number of RAMWR commands (address windows filled)
+    """
+
+    def __init__(self, dc, cs=None, width=240, height=240):
+        """
+        Args:
+            dc: GPIO number of the data/command line
+            cs: GPIO number of the chip select line, or None if always selected
+            width: Panel width in pixels (default 240)
+            height: Panel height in pixels (default 240)
+        """
+        self.dc = dc
+        self.cs = cs
+        self.width = width
+        self.height = height
+        self.gram = np.zeros((height, width), dtype=np.uint16)
+        self.reset_counters()
+        self._cmd = None
+        self._args = bytearray()
+        self._x0, self._x1 = 0, width - 1
+        self._y0, self._y1 = 0, height - 1
+        self._pos = 0
+        self._odd = None
+
+    def reset_counters(self):
+        self.commands = {}
+        self.pixel_bytes = 0
+        self.windows = 0
+
+    def _line(self, gpio):
+        pin = Pin.pins.get(gpio)
+        return pin.value() if pin is not None else 0
+
+    def write(self, buf):
+        if self.cs is not None and self._line(self.cs):
+            return
+        if not self._line(self.dc):
+            for cmd in bytes(buf):
+                self._command(cmd)
+        elif self._cmd in (RAMWR, RAMWRC):
+            self._pixels(buf)
+        elif self._cmd is not None:
+            self._args += buf
+            if len(self._args) >= 4 and self._cmd in (CASET, RASET):
+                a = self._args
+                start, end = (a[0] << 8) | a[1], (a[2] << 8) | a[3]
+                if self._cmd == CASET:
+                    self._x0, self._x1 = start, end
+                else:
+                    self._y0, self._y1 = start, end
+
+    def _command(self, cmd):
+        self.commands[cmd] = self.commands.get(cmd, 0) + 1
+        self._cmd = cmd
+        self._args = bytearray()
+        if cmd == RAMWR:
+            self.windows += 1
+            self._pos = 0
+            self._odd = None
+
+    def _pixels(self, buf):
+        data = bytes(buf)
+        self.pixel_bytes += len(data)
+        if self._odd is not None:
+            data = self._odd + data
+            self._odd = None
+        if len(data) & 1:
+            self._odd = data[-1:]
+            data = data[:-1]
+        words = np.frombuffer(data, dtype='<u2')
+
+        x0, x1 = self._x0, min(self._x1, self.width - 1)
+        y0, y1 = self._y0, min(self._y1, self.height - 1)
+        w = x1 - x0 + 1
+        area = w * (y1 - y0 + 1)
+        if w <= 0 or area <= 0:
+            return
+        i = 0
+        n = len(words)
+        while i < n:
+            # Writes past the end of the window wrap to its start
+            pos = self._pos % area
+            row, col = divmod(pos, w)
+            if col:
+                take = min(w - col, n - i)
+                self.gram[y0 + row, x0 + col:x0 + col + take] = words[i:i + take]
+            else:
+                rows = min((n - i) // w, (y1 - y0 + 1) - row)
+                if rows:
+                    take = rows * w
+                    self.gram[y0 + row:y0 + row + rows, x0:x1 + 1] = \
+                        words[i:i + take].reshape(rows, w)
+                else:
+                    take = n - i
+                    self.gram[y0 + row, x0:x0 + take] = words[i:i + take]
+            i += take
+            self._pos += take
+
+    def rgb(self):
+        """
+        Panel image as RGB888, decoding words with the display's BRG565
+        layout (blue bits 15-11, red 10-5, green 4-0; see COLOR_NOTES.md).
+
+        Returns:
+            (height, width, 3) uint8 array
+        """
+        g = self.gram
+        r = ((g >> 5) & 0x3F) * 255 // 63
+        gr = (g & 0x1F) * 255 // 31
+        b = (g >> 11) * 255 // 31
+        return np.stack([r, gr, b], axis=2).astype(np.uint8)
+
+    def save(self, path):
+        """Write the panel image to a PNG (needs Pillow)."""
+        from PIL import Image
+        Image.fromarray(self.rgb()).save(path)
@@ -0,0 +1,268 @@
+# Simulated machine module
+# Peripherals record what the driver does to them (pin edges, SPI writes,
+# UART traffic) instead of touching hardware.
+
+import time
+
+
+class Pin:
+    """
+    GPIO pin that remembers its level and counts falling edges.
+
+    The most recent Pin created for each GPIO number is kept in Pin.pins,
+    so simulated devices can read the lines the driver controls.
+    """
+
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    pins = {}
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        Pin.pins[id] = self
+        self.id = id
+        self.mode = mode
+        self._value = 1 if mode == Pin.IN and pull == Pin.PULL_UP else 0
+        if value is not None:
+            self._value = 1 if value else 0
+        self.falls = 0
+        self.irq_handler = None
+        self.irq_trigger = 0
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        v = 1 if v else 0
+        if self._value and not v:
+            self.falls += 1
+        self._value = v
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING, hard=False):
+        self.irq_handler = handler
+        self.irq_trigger = trigger
+
+    def pulse(self):
+        """Drive an input high then low, running the IRQ handler for the edge."""
+        self._value = 1
+        if self.irq_handler and self.irq_trigger & Pin.IRQ_RISING:
+            self.irq_handler(self)
+        self._value = 0
+        if self.irq_handler and self.irq_trigger & Pin.IRQ_FALLING:
+            self.irq_handler(self)
+
+
+class SPI:
+    """
+    SPI bus that counts write() calls and bytes clocked out.
+
+    Writes return immediately unless SPI.realtime is set, in which case
+    each write sleeps for as long as the bytes take at the bus rate
+    (capped at the RP2350's 75 MHz maximum). A device registered in
+    SPI.devices for the bus id (such as simulator.gc9a01.GC9A01) receives
+    every write. With record set, each write is also kept in transactions.
+    """
+
+    MAX_BAUDRATE = 75_000_000
+    realtime = False
+    devices = {}
+
+    def __init__(self, id, baudrate=1_000_000, **kwargs):
+        self.id = id
+        self.baudrate = min(baudrate, SPI.MAX_BAUDRATE)
+        self.write_count = 0
+        self.byte_count = 0
+        self.record = False
+        self.transactions = []
+
+    def write(self, buf):
+        self.write_count += 1
+        self.byte_count += len(buf)
+        if self.record:
+            self.transactions.append(bytes(buf))
+        device = SPI.devices.get(self.id)
+        if device is not None:
+            device.write(buf)
+        if SPI.realtime:
+            time.sleep(len(buf) * 8 / self.baudrate)
+
+    def reset_counters(self):
+        self.write_count = 0
+        self.byte_count = 0
+        self.transactions = []
+
+
+class PWM:
+    def __init__(self, pin):
+        self.pin = pin
+        self._freq = 0
+        self._duty = 0
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self._freq = value
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self._duty = value
+
+
+class Timer:
+    """Timer that records its configuration; fire() runs the callback."""
+
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1):
+        self.id = id
+        self.callback = None
+        self.mode = Timer.PERIODIC
+        self.period = -1
+        self.fired = 0
+
+    def init(self, mode=PERIODIC, period=-1, freq=-1, callback=None):
+        self.mode = mode
+        self.period = period if freq <= 0 else 1000 // freq
+        self.callback = callback
+
+    def deinit(self):
+        self.callback = None
+
+    def fire(self):
+        """Run the callback once, as if the period had elapsed."""
+        if self.callback is not None:
+            self.fired += 1
+            self.callback(self)
+            if self.mode == Timer.ONE_SHOT:
+                self.callback = None
+
+
+class UART:
+    """
+    UART that records what is written and reads what a test feeds it.
+
+    Sent bytes accumulate in tx; feed() queues bytes for read()/readline()
+    and then calls rx_waiter, if set (simulator.uasyncio.StreamReader uses
+    it to wake up instead of polling). feed() may be called from another
+    thread.
+    """
+
+    def __init__(self, id, baudrate=115200, tx=None, rx=None, **kwargs):
+        self.id = id
+        self.baudrate = baudrate
+        self.tx = bytearray()
+        self.write_count = 0
+        self.rx_waiter = None
+        self._rx = bytearray()
+
+    def feed(self, data):
+        """Queue bytes (or a str) as if received from the other end."""
+        self._rx += data.encode() if isinstance(data, str) else data
+        if self.rx_waiter is not None:
+            self.rx_waiter()
+
+    def any(self):
+        return len(self._rx)
+
+    def read(self, nbytes=None):
+        if not self._rx:
+            return None
+        n = len(self._rx) if nbytes is None else nbytes
+        data = bytes(self._rx[:n])
+        del self._rx[:n]
+        return data
+
+    def readline(self):
+        if not self._rx:
+            return None
+        end = self._rx.find(b'\n')
+        return self.read(len(self._rx) if end < 0 else end + 1)
+
+    def write(self, buf):
+        self.write_count += 1
+        self.tx += buf
+        return len(buf)
+
+
+class RTC:
+    """
+    Real-time clock that runs from the host's monotonic clock.
+
+    Starts at 2021-01-01 00:00:00 like the RP2 port; datetime() sets and
+    reads (year, month, day, weekday, hours, minutes, seconds, subseconds)
+    with weekday 0 = Monday.
+    """
+
+    def __init__(self, id=0):
+        self._set((2021, 1, 1, 4, 0, 0, 0, 0))
+
+    def _set(self, dt):
+        year, month, day, _, hours, minutes, seconds = dt[:7]
+        self._base = (time.mktime((year, month, day, hours, minutes, seconds, 0, 0, -1))
+                      - time.monotonic())
+
+    def datetime(self, dt=None):
+        if dt is not None:
+            self._set(dt)
+            return None
+        t = time.localtime(int(self._base + time.monotonic()))
+        return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_wday, t.tm_hour, t.tm_min, t.tm_sec, 0)
+
+
+class I2C:
+    """
+    I2C bus backed by a per-address register map (all zeros by default).
+
+    Every I2C object for the same bus id shares I2C.buses[id], so a test
+    can preset a device's registers before the driver opens the bus, e.g.
+    I2C.buses[1] = {0x15: {0xA7: 0xB5}} for the CST816T chip id.
+    Counts register reads and writes and the bytes moved.
+    """
+
+    buses = {}
+
+    def __init__(self, id, scl=None, sda=None, freq=400_000):
+        self.id = id
+        self.registers = I2C.buses.setdefault(id, {})
+        self.read_count = 0
+        self.write_count = 0
+        self.byte_count = 0
+
+    def readfrom_mem(self, addr, memaddr, nbytes):
+        self.read_count += 1
+        self.byte_count += nbytes
+        regs = self.registers.get(addr, {})
+        return bytes(regs.get(memaddr + i, 0) for i in range(nbytes))
+
+    def writeto_mem(self, addr, memaddr, buf):
+        self.write_count += 1
+        self.byte_count += len(buf)
+        regs = self.registers.setdefault(addr, {})
+        for i, b in enumerate(buf):
+            regs[memaddr + i] = b
+
+
+class ADC:
+    def __init__(self, pin):
+        self.pin = pin
+
+    def read_u16(self):
+        return 0
+
+
+def idle():
+    """Yield the CPU, like machine.idle() waiting for the next interrupt."""
+    time.sleep(0)
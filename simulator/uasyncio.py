@@ -0,0 +1,67 @@
+# Simulated uasyncio module
+# CPython's asyncio plus the MicroPython-only parts main.py uses:
+# StreamReader(stream) over a simulated UART, ThreadSafeFlag and sleep_ms.
+# The waits are event driven, like the real scheduler polling the UART: a
+# task blocked on a StreamReader or ThreadSafeFlag costs no wakeups until
+# data or an IRQ arrives, which may come from another thread.
+
+from asyncio import *  # noqa: F401,F403
+import asyncio as _asyncio
+
+
+async def sleep_ms(ms):
+    await _asyncio.sleep(ms / 1000)
+
+
+class ThreadSafeFlag:
+    """
+    Flag set from an IRQ handler (or another thread) and awaited by a task.
+
+    set() may be called before anything waits; wait() then returns at once.
+    Like MicroPython's, wait() clears the flag when it returns.
+    """
+
+    def __init__(self):
+        self._flag = False
+        self._event = None
+        self._loop = None
+
+    def set(self):
+        self._flag = True
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def clear(self):
+        self._flag = False
+
+    async def wait(self):
+        if self._event is None:
+            self._loop = _asyncio.get_running_loop()
+            self._event = _asyncio.Event()
+        while not self._flag:
+            # A set() between the check and the clear still wakes us: the
+            # event is set later, from the loop
+            self._event.clear()
+            await self._event.wait()
+        self._flag = False
+
+
+class StreamReader:
+    """MicroPython-style StreamReader over a simulator.machine.UART."""
+
+    def __init__(self, stream):
+        self.s = stream
+        self._flag = ThreadSafeFlag()
+        stream.rx_waiter = self._flag.set
+
+    async def _wait(self, ready):
+        while not ready():
+            await self._flag.wait()
+
+    async def read(self, n=-1):
+        await self._wait(self.s.any)
+        return self.s.read(None if n < 0 else n)
+
+    async def readline(self):
+        await self._wait(lambda: self.s._rx.find(b'\n') >= 0)
+        return self.s.readline()